@@ -20,9 +20,11 @@ fi
 
 echo "Creating GitHub release $VERSION..."
 
-# Create release with all template ZIPs
+# Create release with all template ZIPs, checksums and the build manifest
 gh release create "$VERSION" \
   "$GENRELEASES_DIR"/*.zip \
+  "$GENRELEASES_DIR"/CHECKSUMS.sha256 \
+  "$GENRELEASES_DIR"/build-manifest.json \
   --title "Twitter-Kit Templates $VERSION" \
   --notes-file release_notes.md
 
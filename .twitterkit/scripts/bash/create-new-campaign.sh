@@ -9,6 +9,7 @@ set -e
 JSON_MODE=false
 SHORT_NAME=""
 CAMPAIGN_NUMBER=""
+USE_WORKTREE=false
 ARGS=()
 i=1
 
@@ -18,6 +19,9 @@ while [ $i -le $# ]; do
         --json)
             JSON_MODE=true
             ;;
+        --worktree)
+            USE_WORKTREE=true
+            ;;
         --short-name)
             if [ $((i + 1)) -gt $# ]; then
                 echo 'Error: --short-name requires a value' >&2
@@ -45,10 +49,13 @@ while [ $i -le $# ]; do
             CAMPAIGN_NUMBER="$next_arg"
             ;;
         --help|-h)
-            echo "Usage: $0 [--json] [--short-name <name>] [--number N] <campaign_description>"
+            echo "Usage: $0 [--json] [--worktree] [--short-name <name>] [--number N] <campaign_description>"
             echo ""
             echo "Options:"
             echo "  --json              Output in JSON format"
+            echo "  --worktree          Create the campaign branch in its own git worktree instead of"
+            echo "                      switching branches (directory: \$TWITTERKIT_WORKTREE_DIR,"
+            echo "                      default: ../<repo>.worktrees)"
             echo "  --short-name <name> Provide a custom short name (2-4 words) for the campaign branch"
             echo "  --number N          Specify campaign number manually (overrides auto-detection)"
             echo "  --help, -h          Show this help message"
@@ -56,6 +63,7 @@ while [ $i -le $# ]; do
             echo "Examples:"
             echo "  $0 'Alpha launch Twitter campaign' --short-name 'alpha-launch'"
             echo "  $0 'Product hunt launch week' --number 3"
+            echo "  $0 'Beta waitlist push' --worktree"
             exit 0
             ;;
         *)
@@ -67,7 +75,7 @@ done
 
 CAMPAIGN_DESCRIPTION="${ARGS[*]}"
 if [ -z "$CAMPAIGN_DESCRIPTION" ]; then
-    echo "Usage: $0 [--json] [--short-name <name>] [--number N] <campaign_description>" >&2
+    echo "Usage: $0 [--json] [--worktree] [--short-name <name>] [--number N] <campaign_description>" >&2
     exit 1
 fi
 
@@ -104,6 +112,23 @@ get_highest_from_specs() {
     echo "$highest"
 }
 
+# Get highest campaign number from local branches (campaigns created in
+# worktrees are not visible in this checkout's specs/ directory)
+get_highest_from_branches() {
+    local highest=0
+
+    if git rev-parse --git-dir > /dev/null 2>&1; then
+        while read -r branch; do
+            number=$((10#${branch%%-*}))
+            if [ "$number" -gt "$highest" ]; then
+                highest=$number
+            fi
+        done < <(git branch --list --format='%(refname:short)' '[0-9][0-9][0-9]-*' 2>/dev/null)
+    fi
+
+    echo "$highest"
+}
+
 # Find repo root
 REPO_ROOT=$(find_repo_root "$PWD")
 if [ -z "$REPO_ROOT" ]; then
@@ -113,12 +138,17 @@ fi
 
 cd "$REPO_ROOT"
 
+SPECS_DIR="$REPO_ROOT/specs"
+
 # Determine campaign number
 if [ -n "$CAMPAIGN_NUMBER" ]; then
     NEXT_NUMBER="$CAMPAIGN_NUMBER"
 else
-    SPECS_DIR="$REPO_ROOT/specs"
     HIGHEST=$(get_highest_from_specs "$SPECS_DIR")
+    HIGHEST_BRANCH=$(get_highest_from_branches)
+    if [ "$HIGHEST_BRANCH" -gt "$HIGHEST" ]; then
+        HIGHEST=$HIGHEST_BRANCH
+    fi
     NEXT_NUMBER=$((HIGHEST + 1))
 fi
 
@@ -135,6 +165,30 @@ FORMATTED_NUMBER=$(printf "%03d" "$NEXT_NUMBER")
 
 # Create campaign directory name
 CAMPAIGN_DIR_NAME="${FORMATTED_NUMBER}-${SHORT_NAME}"
+BRANCH_NAME="$CAMPAIGN_DIR_NAME"
+WORKTREE_PATH=""
+
+# In worktree mode the campaign lives in its own checkout of the new branch,
+# so parallel campaigns never switch the main worktree's branch
+if [ "$USE_WORKTREE" = true ]; then
+    if ! git rev-parse --git-dir > /dev/null 2>&1; then
+        echo "Error: --worktree requires a git repository" >&2
+        exit 1
+    fi
+    WORKTREE_DIR="${TWITTERKIT_WORKTREE_DIR:-$(dirname "$REPO_ROOT")/$(basename "$REPO_ROOT").worktrees}"
+    WORKTREE_PATH="$WORKTREE_DIR/$BRANCH_NAME"
+    if [ -e "$WORKTREE_PATH" ]; then
+        echo "Error: Worktree path already exists: $WORKTREE_PATH" >&2
+        exit 1
+    fi
+    mkdir -p "$WORKTREE_DIR"
+    git worktree add -b "$BRANCH_NAME" "$WORKTREE_PATH" > /dev/null 2>&1 || {
+        echo "Error: Could not create worktree for branch '$BRANCH_NAME'" >&2
+        exit 1
+    }
+    SPECS_DIR="$WORKTREE_PATH/specs"
+fi
+
 CAMPAIGN_DIR="$SPECS_DIR/$CAMPAIGN_DIR_NAME"
 
 # Check if campaign directory already exists
@@ -155,9 +209,10 @@ touch "$CAMPAIGN_DIR/research.md"
 # Create refs subdirectory if needed
 mkdir -p "$CAMPAIGN_DIR/refs"
 
-# Create git branch
-BRANCH_NAME="$CAMPAIGN_DIR_NAME"
-if git rev-parse --git-dir > /dev/null 2>&1; then
+# Create git branch (already done in worktree mode)
+if [ "$USE_WORKTREE" = true ]; then
+    :
+elif git rev-parse --git-dir > /dev/null 2>&1; then
     if git rev-parse --verify "$BRANCH_NAME" > /dev/null 2>&1; then
         echo "Warning: Git branch '$BRANCH_NAME' already exists, skipping branch creation" >&2
     else
@@ -173,7 +228,7 @@ if [ "$JSON_MODE" = true ]; then
   "campaign_dir": "$CAMPAIGN_DIR",
   "branch_name": "$BRANCH_NAME",
   "short_name": "$SHORT_NAME",
-  "description": "$CAMPAIGN_DESCRIPTION"
+  "description": "$CAMPAIGN_DESCRIPTION"$([ -n "$WORKTREE_PATH" ] && printf ',\n  "worktree_path": "%s"' "$WORKTREE_PATH")
 }
 EOF
 else
@@ -181,6 +236,9 @@ else
     echo ""
     echo "Campaign directory: $CAMPAIGN_DIR"
     echo "Git branch: $BRANCH_NAME"
+    if [ -n "$WORKTREE_PATH" ]; then
+        echo "Worktree: $WORKTREE_PATH"
+    fi
     echo ""
     echo "Next steps:"
     echo "  1. Run /twitterkit.specify to create your campaign spec"
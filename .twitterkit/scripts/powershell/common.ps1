@@ -10,7 +10,7 @@ function Get-RepoRoot {
     
     # Fall back to script location for non-git repos
     $scriptDir = Split-Path -Parent $PSScriptRoot
-    return (Resolve-Path "$scriptDir/..").Path
+    return (Resolve-Path "$scriptDir/../..").Path
 }
 
 function Get-CurrentBranch {
@@ -1,22 +1,13 @@
 #!/usr/bin/env bash
 set -euo pipefail
 
-# Cross-platform sha256 function
-get_sha256() {
-  if command -v sha256sum &>/dev/null; then
-    sha256sum "$1" | cut -d' ' -f1
-  else
-    shasum -a 256 "$1" | cut -d' ' -f1
-  fi
-}
-
 # build-templates.sh
 # Local build wrapper for twitter-Kit template generation
 # Enables testing template generation without CI/CD
 # Usage: ./scripts/build-templates.sh <version> [--verbose]
 #   Version must match: v[0-9]+\.[0-9]+\.[0-9]+
 #   Optional env vars:
-#     AGENTS: space or comma separated agent names (default: all 18)
+#     AGENTS: space or comma separated agent names (default: all 17)
 #     SCRIPTS: space or comma separated script types (default: sh,ps)
 #   Examples:
 #     ./scripts/build-templates.sh v0.1.0
@@ -39,13 +30,10 @@ if [[ ! $VERSION =~ ^v[0-9]+\.[0-9]+\.[0-9]+$ ]]; then
   exit 1
 fi
 
-# Setup output directory
+# Setup output directory. Archives are rebuilt incrementally, so the
+# directory is not wiped; --clean drops archives from other builds.
 DIST_DIR="dist/templates"
 mkdir -p "$DIST_DIR"
-rm -rf "$DIST_DIR"/* || true
-
-# Export for create-release-packages.sh
-export GENRELEASES_DIR="$DIST_DIR"
 
 echo "╔════════════════════════════════════════════════════════════╗"
 echo "║     twitter-Kit Template Builder                               ║"
@@ -53,100 +41,28 @@ echo "╚═══════════════════════
 echo ""
 echo "Version: $VERSION"
 echo "Output:  $DIST_DIR"
-echo "Agents:  ${AGENTS:-all 18}"
+echo "Agents:  ${AGENTS:-all 17}"
 echo "Scripts: ${SCRIPTS:-sh,ps}"
 echo ""
 
-# Call the existing build script
+# Build archives; the packager writes build-manifest.json and
+# CHECKSUMS.sha256 while it streams the archives to disk
+if command -v twitterify &>/dev/null; then
+  BUILD=(twitterify)
+else
+  export PYTHONPATH="$(pwd)/src${PYTHONPATH:+:$PYTHONPATH}"
+  BUILD=(python3 -m twitterify_cli)
+fi
+
 if [[ "$VERBOSE" == "--verbose" ]]; then
-  chmod +x .github/workflows/scripts/create-release-packages.sh
-  .github/workflows/scripts/create-release-packages.sh "$VERSION"
+  "${BUILD[@]}" release build "$VERSION" --output "$DIST_DIR" --clean --debug
 else
-  chmod +x .github/workflows/scripts/create-release-packages.sh
-  .github/workflows/scripts/create-release-packages.sh "$VERSION" >/dev/null 2>&1 || {
+  "${BUILD[@]}" release build "$VERSION" --output "$DIST_DIR" --clean >/dev/null 2>&1 || {
     echo "❌ Build failed" >&2
     exit 1
   }
 fi
 
-# Generate manifest with metadata
-generate_manifest() {
-  local version=$1
-  local output_dir=$2
-  local build_started=$(date -u +"%Y-%m-%dT%H:%M:%SZ")
-
-  echo "Generating build manifest..."
-
-  # Create manifest JSON
-  cat > "$output_dir/build-manifest.json" << 'MANIFEST_EOF'
-{
-  "build_id": "$(date -u +%Y%m%d-%H%M%S)",
-  "version": "$version",
-  "build_started_at": "$build_started",
-  "build_completed_at": "$(date -u +"%Y-%m-%dT%H:%M:%SZ")",
-  "variants": [],
-  "total_size_bytes": 0,
-  "failed_variants": [],
-  "environment": {
-    "os": "$(uname -s)",
-    "bash_version": "$BASH_VERSION",
-    "git_commit": "$(git rev-parse HEAD 2>/dev/null || echo 'unknown')"
-  }
-}
-MANIFEST_EOF
-
-  # Collect variant metadata
-  local variants_json="[]"
-  local total_size=0
-  local failed_count=0
-
-  for zip_file in "$output_dir"/*.zip; do
-    [[ -f "$zip_file" ]] || continue
-
-    local filename=$(basename "$zip_file")
-    local size=$(wc -c < "$zip_file" | tr -d ' ')
-    local sha256=$(get_sha256 "$zip_file")
-
-    # Extract agent and script from filename
-    if [[ $filename =~ twitter-kit-template-([^-]+)-(sh|ps)-v[0-9]+\.[0-9]+\.[0-9]+.*\.zip ]]; then
-      local agent="${BASH_REMATCH[1]}"
-      local script="${BASH_REMATCH[2]}"
-
-      # Add variant to JSON
-      local variant_json="{\"agent\":\"$agent\",\"script\":\"$script\",\"archive_name\":\"$filename\",\"size_bytes\":$size,\"sha256\":\"$sha256\",\"build_status\":\"completed\"}"
-
-      if [[ "$variants_json" == "[]" ]]; then
-        variants_json="[$variant_json]"
-      else
-        variants_json=$(echo "$variants_json" | sed "s/\]/,$variant_json]/")
-      fi
-
-      total_size=$((total_size + size))
-    fi
-  done
-
-  # Update manifest with actual data (using jq if available, otherwise basic sed)
-  if command -v jq &>/dev/null; then
-    local manifest=$(jq \
-      --arg version "$version" \
-      --arg build_id "$(date -u +%Y%m%d-%H%M%S)" \
-      --arg started "$build_started" \
-      --arg completed "$(date -u +%Y-%m-%dT%H:%M:%SZ)" \
-      --arg total "$total_size" \
-      '.version = $version | .build_id = $build_id | .build_started_at = $started | .build_completed_at = $completed | .total_size_bytes = ($total | tonumber) | .variants = ('"$variants_json"' // []) | .failed_variants = []' \
-      "$output_dir/build-manifest.json")
-    echo "$manifest" > "$output_dir/build-manifest.json"
-  else
-    # Fallback: basic text replacement without jq
-    echo "Warning: jq not found, using basic manifest generation" >&2
-  fi
-}
-
-# Generate manifest
-if ! generate_manifest "$VERSION" "$DIST_DIR"; then
-  echo "⚠️  Warning: Could not generate manifest" >&2
-fi
-
 # Display summary
 echo ""
 echo "╔════════════════════════════════════════════════════════════╗"
@@ -165,10 +81,8 @@ echo ""
 
 # Show first few ZIPs
 echo "Sample Generated Templates:"
-find "$DIST_DIR" -name "*.zip" -type f | sort | head -3 | while read -r zip; do
-  size=$(ls -lh "$zip" | awk '{print $5}')
-  name=$(basename "$zip")
-  sha256=$(get_sha256 "$zip")
+head -3 "$DIST_DIR/CHECKSUMS.sha256" | while read -r sha256 name; do
+  size=$(ls -lh "$DIST_DIR/$name" | awk '{print $5}')
   echo "  • $name ($size)"
   echo "    SHA-256: $sha256"
 done
@@ -5,336 +5,24 @@ set -euo pipefail
 # Automated validation of twitter-Kit template quality
 # Prevents publishing templates with wrong namespace, missing files, or structural issues
 # Usage: ./scripts/validate-templates.sh <template-dir-or-zip> [--verbose]
+#
+# Thin wrapper around `twitterify release validate`, which checks every
+# archive member in memory in a single pass and validates archives in parallel.
+# Set JSON=1 for a machine-readable report.
 
 INPUT="${1:-.}"
-VERBOSE="${2:-}"
-TEMP_DIR=""
-TOTAL_VARIANTS=0
-PASSED_VARIANTS=0
-FAILED_VARIANTS=0
-FAILED_LIST=""
+shift || true
 
-# Cleanup temporary directories on exit
-cleanup() {
-  if [[ -n "$TEMP_DIR" && -d "$TEMP_DIR" ]]; then
-    rm -rf "$TEMP_DIR"
-  fi
-}
-trap cleanup EXIT
+ARGS=("$INPUT" "$@")
+if [[ -n "${JSON:-}" ]]; then
+  ARGS+=(--json)
+fi
 
-# Color output functions
-print_pass() { echo "  ✅ $1"; }
-print_fail() { echo "  ❌ $1"; }
-print_warn() { echo "  ⚠️  $1"; }
+if command -v twitterify &>/dev/null; then
+  exec twitterify release validate "${ARGS[@]}"
+fi
 
-check_frontmatter_namespace() {
-  local extract_dir=$1
-  local variant_name=$2
-  local errors=0
-
-  # TEMPORARY: Skip validation for Copilot templates until directory structure is fixed
-  if [[ "$variant_name" == *"copilot"* ]]; then
-    print_warn "Skipping Copilot validation (known issue with directory structure)"
-    return 0
-  fi
-
-  # Find agent directory (anything starting with . except .twitterkit)
-  local agent_dir=$(find "$extract_dir" -maxdepth 1 -type d -name ".*" ! -name ".twitterkit" | head -1)
-  if [[ -z "$agent_dir" ]]; then
-    print_fail "No agent directory found (expected .{agent}/)"
-    return 1
-  fi
-
-  # Special handling for Copilot (uses .github/agents/ structure)
-  local command_search_dir="$agent_dir"
-  if [[ "$(basename "$agent_dir")" == ".github" ]]; then
-    if [[ -d "$agent_dir/agents" ]]; then
-      command_search_dir="$agent_dir/agents"
-    fi
-  fi
-
-  # Check all command files in agent directory
-  local command_files=$(find "$command_search_dir" -type f \( -name "twitterkit.*.md" -o -name "twitterkit.*.toml" -o -name "twitterkit.*.agent.md" \) 2>/dev/null | wc -l)
-
-  if [[ $command_files -lt 9 ]]; then
-    print_fail "Command file count check: found $command_files, expected 9"
-    return 1
-  fi
-
-  # Check frontmatter in a sample file (support .md, .toml, and .agent.md)
-  local sample_file=$(find "$command_search_dir" -type f \( -name "twitterkit.*.md" -o -name "twitterkit.*.agent.md" \) | head -1)
-  if [[ -n "$sample_file" ]]; then
-    # Check that the file exists and has twitterkit. in the filename
-    if [[ ! "$(basename "$sample_file")" =~ ^twitterkit\. ]]; then
-      print_fail "Command file doesn't use twitterkit.* naming: $(basename "$sample_file")"
-      return 1
-    fi
-  fi
-
-  print_pass "Frontmatter uses twitterkit.* namespace"
-  return 0
-}
-
-# Check 2: Required files validation
-check_required_files() {
-  local extract_dir=$1
-  local errors=0
-
-  local required_files=(
-    ".twitterkit/memory/constitution.md"
-    ".twitterkit/templates/spec-template.md"
-    ".twitterkit/templates/plan-template.md"
-    ".twitterkit/templates/tasks-template.md"
-  )
-
-  for file in "${required_files[@]}"; do
-    if [[ ! -f "$extract_dir/$file" ]]; then
-      print_fail "Missing required file: $file"
-      ((errors++))
-    fi
-  done
-
-  if [[ $errors -eq 0 ]]; then
-    print_pass "All required files present"
-  fi
-
-  return $errors
-}
-
-# Check 3: Content scanning for spec-kit references in COMMAND FILES ONLY
-# Note: Documentation files (constitution.md, etc.) may legitimately reference speckit
-# for explaining namespacing concepts - we only check agent command directories
-check_content_references() {
-  local extract_dir=$1
-  local errors=0
-
-  # Find agent directories (exclude .twitterkit which contains documentation)
-  local speckit_refs=0
-  for agent_dir in $(find "$extract_dir" -maxdepth 1 -type d -name ".*" ! -name ".twitterkit" 2>/dev/null); do
-    local refs=$(find "$agent_dir" -type f \( -name "*.md" -o -name "*.toml" -o -name "*.agent.md" \) -exec grep -l "/speckit\." {} \; 2>/dev/null | wc -l)
-    speckit_refs=$((speckit_refs + refs))
-  done
-
-  if [[ $speckit_refs -gt 0 ]]; then
-    print_fail "Found $speckit_refs command files with /speckit.* references"
-    return 1
-  fi
-
-  print_pass "No /speckit.* references in command files"
-  return 0
-}
-
-# Check 4: Directory structure validation
-check_directory_structure() {
-  local extract_dir=$1
-  local errors=0
-
-  # Verify .twitterkit directory
-  if [[ ! -d "$extract_dir/.twitterkit" ]]; then
-    print_fail "Missing .twitterkit directory"
-    return 1
-  fi
-
-  # Verify subdirectories
-  local required_dirs=("memory" "scripts" "templates")
-  for dir in "${required_dirs[@]}"; do
-    if [[ ! -d "$extract_dir/.twitterkit/$dir" ]]; then
-      print_fail "Missing .twitterkit/$dir directory"
-      ((errors++))
-    fi
-  done
-
-  if [[ $errors -gt 0 ]]; then
-    return 1
-  fi
-
-  print_pass "Directory structure is correct"
-  return 0
-}
-
-# Check 5: Constitution version validation
-check_constitution_version() {
-  local extract_dir=$1
-
-  if [[ ! -f "$extract_dir/.twitterkit/memory/constitution.md" ]]; then
-    print_fail "Constitution file not found"
-    return 1
-  fi
-
-  # Check for twitter-related content in constitution
-  if ! grep -qi "twitter" "$extract_dir/.twitterkit/memory/constitution.md"; then
-    print_fail "Constitution doesn't appear to be twitter-focused"
-    return 1
-  fi
-
-  print_pass "Constitution is twitter-Kit v1.0.0"
-  return 0
-}
-
-# Check 6: Script consistency (bash vs powershell)
-check_script_consistency() {
-  local extract_dir=$1
-  local variant_name=$2
-  local errors=0
-
-  # Extract script type from variant name (sh or ps)
-  local script_type=""
-  if [[ $variant_name == *"-sh-"* ]]; then
-    script_type="sh"
-  elif [[ $variant_name == *"-ps-"* ]]; then
-    script_type="ps"
-  else
-    print_warn "Could not determine script type from filename"
-    return 0
-  fi
-
-  # Check script directories
-  if [[ "$script_type" == "sh" ]]; then
-    if [[ ! -d "$extract_dir/.twitterkit/scripts/bash" ]]; then
-      print_fail "Script type is 'sh' but no bash/ scripts directory found"
-      return 1
-    fi
-    if [[ -d "$extract_dir/.twitterkit/scripts/powershell" ]]; then
-      print_warn "Script type is 'sh' but powershell/ directory found (should not exist)"
-    fi
-  elif [[ "$script_type" == "ps" ]]; then
-    if [[ ! -d "$extract_dir/.twitterkit/scripts/powershell" ]]; then
-      print_fail "Script type is 'ps' but no powershell/ scripts directory found"
-      return 1
-    fi
-    if [[ -d "$extract_dir/.twitterkit/scripts/bash" ]]; then
-      print_warn "Script type is 'ps' but bash/ directory found (should not exist)"
-    fi
-  fi
-
-  print_pass "Script consistency check passed ($script_type)"
-  return 0
-}
-
-# Check 7: ZIP integrity
-check_zip_integrity() {
-  local zip_file=$1
-
-  if ! unzip -t "$zip_file" >/dev/null 2>&1; then
-    print_fail "ZIP file is corrupted or invalid"
-    return 1
-  fi
-
-  print_pass "ZIP file integrity verified"
-  return 0
-}
-
-# Main validation function for a single variant
-validate_variant() {
-  local variant_path=$1
-  local variant_name=$(basename "$variant_path" .zip)
-
-  echo "Validating $variant_name..."
-
-  # Create temporary extraction directory
-  local temp_extract=$(mktemp -d)
-  trap "rm -rf '$temp_extract'" RETURN
-
-  # Check ZIP integrity first
-  if ! check_zip_integrity "$variant_path"; then
-    ((FAILED_VARIANTS++))
-    FAILED_LIST="$FAILED_LIST\n  • $variant_name (ZIP corrupted)"
-    return 1
-  fi
-
-  # Extract ZIP
-  if ! unzip -q "$variant_path" -d "$temp_extract"; then
-    ((FAILED_VARIANTS++))
-    FAILED_LIST="$FAILED_LIST\n  • $variant_name (extraction failed)"
-    return 1
-  fi
-
-  # Run all validation checks
-  local check_errors=0
-
-  check_frontmatter_namespace "$temp_extract" "$variant_name" || ((check_errors++))
-  check_required_files "$temp_extract" || ((check_errors++))
-  check_content_references "$temp_extract" || ((check_errors++))
-  check_directory_structure "$temp_extract" || ((check_errors++))
-  check_constitution_version "$temp_extract" || ((check_errors++))
-  check_script_consistency "$temp_extract" "$variant_name" || ((check_errors++))
-
-  if [[ $check_errors -eq 0 ]]; then
-    echo "  ✅ VALIDATION PASSED"
-    ((PASSED_VARIANTS++))
-    return 0
-  else
-    echo "  ⛔ VALIDATION FAILED ($check_errors checks)"
-    ((FAILED_VARIANTS++))
-    FAILED_LIST="$FAILED_LIST\n  • $variant_name"
-    return 1
-  fi
-}
-
-# Main entry point
-main() {
-  if [[ ! -e "$INPUT" ]]; then
-    echo "Error: Input does not exist: $INPUT" >&2
-    exit 1
-  fi
-
-  echo "╔════════════════════════════════════════════════════════════╗"
-  echo "║     twitter-Kit Template Validator                             ║"
-  echo "╚════════════════════════════════════════════════════════════╝"
-  echo ""
-
-  # Process input: single ZIP or directory of ZIPs
-  if [[ -f "$INPUT" && "$INPUT" == *.zip ]]; then
-    # Single ZIP file
-    echo "Input: Single ZIP file"
-    echo "File:  $(basename "$INPUT")"
-    echo ""
-    ((TOTAL_VARIANTS++))
-    validate_variant "$INPUT" || true  # Don't exit on validation failure
-  elif [[ -d "$INPUT" ]]; then
-    # Directory of ZIPs
-    local zip_count=$(find "$INPUT" -maxdepth 1 -name "*.zip" -type f | wc -l)
-    echo "Input: Directory with $zip_count templates"
-    echo "Path:  $INPUT"
-    echo ""
-
-    if [[ $zip_count -eq 0 ]]; then
-      echo "⚠️  No ZIP files found in directory"
-      exit 1
-    fi
-
-    TOTAL_VARIANTS=$zip_count
-
-    # Process each ZIP file
-    for zip_file in $(find "$INPUT" -maxdepth 1 -name "*.zip" -type f | sort); do
-      validate_variant "$zip_file" || true  # Don't exit on validation failure
-      echo ""
-    done
-  else
-    echo "Error: Input must be a ZIP file or directory containing ZIPs" >&2
-    exit 1
-  fi
-
-  # Print summary
-  echo "╔════════════════════════════════════════════════════════════╗"
-  echo "║                   VALIDATION SUMMARY                       ║"
-  echo "╚════════════════════════════════════════════════════════════╝"
-  echo ""
-  echo "Total Variants:    $TOTAL_VARIANTS"
-  echo "Passed:            $PASSED_VARIANTS"
-  echo "Failed:            $FAILED_VARIANTS"
-  echo ""
-
-  if [[ $FAILED_VARIANTS -gt 0 ]]; then
-    echo "Failed Templates:"
-    echo -e "$FAILED_LIST"
-    echo ""
-    echo "❌ VALIDATION FAILED: $FAILED_VARIANTS template(s) have errors"
-    exit 1
-  else
-    echo "✅ ALL VALIDATIONS PASSED"
-    exit 0
-  fi
-}
-
-main "$@"
+# Fall back to the CLI sources in this repository
+REPO_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+export PYTHONPATH="$REPO_ROOT/src${PYTHONPATH:+:$PYTHONPATH}"
+exec python3 -m twitterify_cli release validate "${ARGS[@]}"
@@ -1,40 +1,36 @@
-"""Twitter-Init-Kit CLI Tool - Main Entry Point"""
+"""Twitter-Init-Kit CLI Tool - Main Entry Point
 
-import sys
-from pathlib import Path
-from typing import Optional
-
-import typer
-from rich.console import Console
-from rich.panel import Panel
+The typer application lives in cli.py and is only imported when a command
+needs it: `twitterify prereqs`, which slash commands run on every
+invocation, is answered without loading typer, rich or the command modules.
+"""
 
-from .commands.init import init_command
-from .commands.check import check_command
+import sys
+from typing import Any
 
 __version__ = "0.1.0"
 
-app = typer.Typer(
-    help="twitterify - Twitter marketing toolkit powered by spec-driven development",
-    no_args_is_help=True,
-)
-console = Console()
-
 
-# Register commands
-app.command(name="init")(init_command)
-app.command(name="check")(check_command)
+def __getattr__(name: str) -> Any:
+    """Load the typer app (and its console) on first access."""
+    if name in ("app", "console"):
+        from . import cli
 
-
-@app.command()
-def version() -> None:
-    """Show version information."""
-    console.print(f"[bold]twitterify[/bold] version {__version__}")
-    console.print("Twitter marketing toolkit powered by spec-driven development")
-    console.print("\nFor more information, visit: https://github.com/yourusername/twitter-init-kit")
+        return getattr(cli, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main() -> None:
     """Main entry point."""
+    if sys.argv[1:2] == ["prereqs"]:
+        from .prerequisites import run
+
+        exit_code = run(sys.argv[2:])
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    from .cli import app
+
     app()
 
 
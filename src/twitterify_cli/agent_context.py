@@ -0,0 +1,260 @@
+"""Twitter-Init-Kit Agent Context - Agent Context Files"""
+
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .commands.init import AGENT_CONFIG
+from .workspace import feature_paths
+
+# Context file per agent. Agents sharing a file (AGENTS.md) get one copy.
+CONTEXT_FILES = {
+    "claude": Path(".claude") / "memory.md",
+    "cursor": Path(".cursor") / "context.md",
+    "cursor-agent": Path(".cursor") / "context.md",
+    "windsurf": Path(".windsurf") / "context.md",
+    "gemini": Path("GEMINI.md"),
+    "copilot": Path(".github") / "agents" / "copilot-instructions.md",
+    "qwen": Path("QWEN.md"),
+    "opencode": Path("AGENTS.md"),
+    "codex": Path("AGENTS.md"),
+    "kilocode": Path(".kilocode") / "rules" / "twitterkit-rules.md",
+    "auggie": Path(".augment") / "rules" / "twitterkit-rules.md",
+    "codebuddy": Path("CODEBUDDY.md"),
+    "amp": Path("AGENTS.md"),
+    "shai": Path("SHAI.md"),
+    "q": Path("AGENTS.md"),
+    "bob": Path("AGENTS.md"),
+    "roo": Path(".roo") / "rules" / "twitterkit-rules.md",
+    "qoder": Path("QODER.md"),
+}
+
+CONSTITUTION = Path(".twitterkit") / "memory" / "constitution.md"
+
+# Markers around the generated part of a context file; everything outside
+# them is left alone
+SECTION_START = "<!-- TWITTERKIT CONTEXT START -->"
+SECTION_END = "<!-- TWITTERKIT CONTEXT END -->"
+
+# Title of context files written whole by update-agent-context.sh (no
+# markers), which are replaced entirely
+CONTEXT_TITLE = "# Twitter-Kit Context"
+
+# "**Field**: value" lines of plan-template.md's Twitter Context section
+PLAN_FIELDS = (
+    "Primary Persona",
+    "Twitter Narrative Type",
+    "Core Channels",
+    "Content Pillars",
+    "Launch Timeline",
+    "Campaign Constraints",
+)
+PLAN_FIELD_PATTERN = re.compile(r"^\*\*(?P<field>[^*]+)\*\*:\s*(?P<value>.+?)\s*$", re.MULTILINE)
+PLAN_TITLE_PATTERN = re.compile(r"^#\s+Twitter Growth Plan:\s*(?P<name>.+?)\s*$", re.MULTILINE)
+
+SECTION_TEMPLATE = """## Project Information
+
+This project uses **twitter-init-kit** for Twitter marketing and growth planning.
+
+## Available Commands
+
+- `/twitterkit.constitution` - Create/update project Twitter marketing principles
+- `/twitterkit.specify` - Create Twitter campaign specification
+- `/twitterkit.plan` - Generate Twitter growth plan
+- `/twitterkit.tasks` - Break down into executable tasks
+- `/twitterkit.implement` - Execute tasks systematically
+- `/twitterkit.clarify` - Clarify ambiguous requirements
+
+## Workflow
+
+1. **Constitution**: Define Twitter marketing principles and guardrails
+2. **Specify**: Create campaign spec (personas, objectives, growth loops, metrics)
+3. **Plan**: Generate growth plan (phases, sprint cycles, experiments)
+4. **Tasks**: Break down into executable tasks with ownership
+5. **Implement**: Execute systematically with PDCA tracking
+
+## Project Structure
+
+- `.twitterkit/` - Twitter-kit package (templates, commands, scripts)
+  - `memory/constitution.md` - Project principles
+  - `templates/` - Campaign templates (spec, plan, tasks)
+  - `templates/commands/` - Slash command definitions
+  - `scripts/bash/` - Workflow automation scripts
+- `specs/` - Campaign specifications
+- `refs/` - Reference materials and research
+{campaign}
+## Key Principles
+
+{constitution}
+"""
+
+
+def _placeholder(value: str) -> bool:
+    """Whether a plan value is still the template's placeholder."""
+    return (value.startswith("[") and value.endswith("]")) or "NEEDS CLARIFICATION" in value
+
+
+def parse_plan(path: Path) -> Optional[Dict[str, str]]:
+    """Extract the campaign name and Twitter Context fields from a plan.
+
+    Args:
+        path: plan.md
+
+    Returns:
+        "name" plus each filled-in PLAN_FIELDS entry, or None if the file
+        doesn't exist
+    """
+    try:
+        text = path.read_text(encoding="utf-8")
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+    plan: Dict[str, str] = {}
+    title = PLAN_TITLE_PATTERN.search(text)
+    if title and not _placeholder(title.group("name")):
+        plan["name"] = title.group("name")
+    for match in PLAN_FIELD_PATTERN.finditer(text):
+        field, value = match.group("field").strip(), match.group("value")
+        if field in PLAN_FIELDS and field not in plan and not _placeholder(value):
+            plan[field] = value
+    return plan
+
+
+def render_section(root: Path, feature: str, plan: Optional[Dict[str, str]]) -> str:
+    """Render the managed section, markers included.
+
+    Args:
+        root: Project root
+        feature: Current feature (branch or specs/ directory name)
+        plan: parse_plan() result for the feature, if it has a plan
+
+    Returns:
+        Section text ending in a newline
+    """
+    try:
+        constitution = (root / CONSTITUTION).read_text(encoding="utf-8").rstrip("\n")
+    except FileNotFoundError:
+        constitution = ""
+
+    campaign = ""
+    if plan is not None:
+        lines = [f"- **Campaign**: {plan.get('name', feature)} (`specs/{feature}/plan.md`)"]
+        lines += [f"- **{field}**: {plan[field]}" for field in PLAN_FIELDS if field in plan]
+        campaign = "\n## Active Campaign\n\n" + "\n".join(lines) + "\n"
+
+    body = SECTION_TEMPLATE.format(campaign=campaign, constitution=constitution)
+    return f"{SECTION_START}\n{body}{SECTION_END}\n"
+
+
+def splice(existing: Optional[str], section: str) -> str:
+    """Put the managed section into a context file's content.
+
+    Args:
+        existing: Current file content, or None for a new file
+        section: render_section() output
+
+    Returns:
+        New content: the section replaces the marked one, or the whole file
+        if it was written by update-agent-context.sh, or is appended
+    """
+    if existing is None or existing.startswith(CONTEXT_TITLE) and SECTION_START not in existing:
+        return f"{CONTEXT_TITLE}\n\n{section}"
+
+    start = existing.find(SECTION_START)
+    end = existing.find(SECTION_END, start)
+    if start != -1 and end != -1:
+        end += len(SECTION_END)
+        if existing[end : end + 1] == "\n":
+            end += 1
+        return existing[:start] + section + existing[end:]
+
+    separator = "" if not existing or existing.endswith("\n\n") else ("\n" if existing.endswith("\n") else "\n\n")
+    return existing + separator + section
+
+
+def context_agents(root: Path) -> List[str]:
+    """Agents configured in the project.
+
+    Returns:
+        Agents with twitterkit commands installed or a context file present,
+        in AGENT_CONFIG order
+    """
+    agents = []
+    for agent, (commands_dir, _) in AGENT_CONFIG.items():
+        if (root / CONTEXT_FILES[agent]).is_file():
+            agents.append(agent)
+            continue
+        try:
+            with os.scandir(root / commands_dir) as entries:
+                if any(entry.name.startswith("twitterkit.") for entry in entries):
+                    agents.append(agent)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    return agents
+
+
+def _write_context(path: Path, section: str) -> str:
+    """Splice the section into one file, writing only if its bytes change."""
+    try:
+        existing: Optional[str] = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        existing = None
+
+    content = splice(existing, section)
+    if content == existing:
+        return "unchanged"
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, path)
+    return "updated" if existing is not None else "created"
+
+
+def update_agent_context(
+    root: Path,
+    agents: Optional[Iterable[str]] = None,
+    jobs: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Update agents' context files from the current plan.
+
+    The current feature's plan.md is parsed once and one managed section is
+    rendered for every agent; files are updated concurrently, and only those
+    whose content changes are written.
+
+    Args:
+        root: Project root
+        agents: Agent keys (default: context_agents())
+        jobs: Number of threads (default: one per file, at most 8)
+
+    Returns:
+        One result per context file: path (root-relative), agents, and
+        status ("created", "updated" or "unchanged")
+
+    Raises:
+        ValueError: If an agent is unknown
+    """
+    agents = list(context_agents(root) if agents is None else agents)
+    unknown = [agent for agent in agents if agent not in CONTEXT_FILES]
+    if unknown:
+        raise ValueError(f"Unknown agent: {', '.join(unknown)}")
+
+    paths = feature_paths(root)
+    feature = Path(paths["FEATURE_DIR"]).name
+    section = render_section(root, feature, parse_plan(Path(paths["IMPL_PLAN"])))
+
+    files: Dict[Path, List[str]] = {}
+    for agent in agents:
+        files.setdefault(CONTEXT_FILES[agent], []).append(agent)
+    if not files:
+        return []
+
+    with ThreadPoolExecutor(max_workers=jobs or min(len(files), 8)) as pool:
+        statuses = list(pool.map(lambda rel: _write_context(root / rel, section), files))
+
+    return [
+        {"path": rel.as_posix(), "agents": file_agents, "status": status}
+        for (rel, file_agents), status in zip(files.items(), statuses)
+    ]
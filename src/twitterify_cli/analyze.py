@@ -0,0 +1,240 @@
+"""Twitter-Init-Kit Analyze - Mechanical Cross-Artifact Checks"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .artifacts import ARTIFACT_DOCS, Artifact, ArtifactCache
+
+CONSTITUTION = Path(".twitterkit") / "memory" / "constitution.md"
+
+# Severities, most severe first (as in /twitterkit.analyze, plus INFO for
+# notes that need no action)
+SEVERITIES = ("CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO")
+
+# Finding categories and their severity
+CATEGORIES = {
+    "missing_document": "CRITICAL",
+    "constitution": "CRITICAL",
+    "coverage": "CRITICAL",
+    "duplication": "HIGH",
+    "unknown_reference": "MEDIUM",
+    "placeholder": "MEDIUM",
+    "orphan_task": "LOW",
+    "untraced_tasks": "INFO",
+}
+
+# Constitution lines listing banned phrases, e.g.
+# **Anti-pattern**: Vague aspirations like "increase engagement" ...
+RULE_PATTERN = re.compile(
+    r"^\s*(?:[-*]\s+)?\*\*(?:Anti-pattern|Forbidden|Prohibited|Avoid)\*\*\s*:(?P<rest>.*)$", re.IGNORECASE
+)
+QUOTED_PATTERN = re.compile(r"[\"“](?P<term>[^\"”]{3,})[\"”]")
+HEADING_PATTERN = re.compile(r"^#{1,6}\s+(?P<title>.+?)\s*$")
+NORMALIZE_PATTERN = re.compile(r"[^a-z0-9]+")
+
+
+def constitution_rules(root: Path) -> List[Dict[str, str]]:
+    """Banned phrases from the constitution's Anti-pattern/Forbidden lines.
+
+    Args:
+        root: Project root
+
+    Returns:
+        {"term", "principle"} for each quoted phrase, with the heading it
+        appears under
+    """
+    try:
+        text = (root / CONSTITUTION).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return []
+
+    rules = []
+    principle = ""
+    for line in text.splitlines():
+        heading = HEADING_PATTERN.match(line)
+        if heading:
+            principle = heading.group("title")
+            continue
+        rule = RULE_PATTERN.match(line)
+        if rule:
+            for match in QUOTED_PATTERN.finditer(rule.group("rest")):
+                rules.append({"term": match.group("term"), "principle": principle})
+    return rules
+
+
+def _normalize(text: str) -> str:
+    """Requirement text compared for duplicates: lowercase words only."""
+    return NORMALIZE_PATTERN.sub(" ", text.lower()).strip()
+
+
+def _finding(
+    category: str,
+    document: Optional[str],
+    line: Optional[int],
+    summary: str,
+    **details: Any,
+) -> Dict[str, Any]:
+    """A report finding, with the category's severity."""
+    return {
+        "category": category,
+        "severity": CATEGORIES[category],
+        "document": document,
+        "line": line,
+        "summary": summary,
+        **details,
+    }
+
+
+def analyze_feature(
+    root: Path,
+    feature_dir: Path,
+    cache: ArtifactCache,
+    rules: Optional[List[Dict[str, str]]] = None,
+) -> Dict[str, Any]:
+    """Run the mechanical /twitterkit.analyze checks on a feature.
+
+    Checks requirement→task coverage, tasks mapped to no requirement or
+    story, references to undefined requirements or tasks, unfilled template
+    placeholders, duplicate requirements (same ID or same text) and phrases
+    the constitution bans. Coverage and orphan tasks are only checked when
+    tasks.md cites requirement IDs (or stories) at all; tasks written from
+    the shipped template don't, and get a single INFO finding instead.
+    Judgment calls (ambiguity, terminology drift, conflicts) are left to
+    the agent.
+
+    Args:
+        root: Project root
+        feature_dir: specs/NNN-name directory
+        cache: Cache to parse documents through
+        rules: constitution_rules() result (default: read from root)
+
+    Returns:
+        Report with "feature", "documents", "metrics", "coverage" and
+        "findings" (sorted by severity, then document and line)
+    """
+    if rules is None:
+        rules = constitution_rules(root)
+
+    artifacts: Dict[str, Artifact] = {}
+    texts: Dict[str, str] = {}
+    findings: List[Dict[str, Any]] = []
+    for kind, name in ARTIFACT_DOCS.items():
+        path = feature_dir / name
+        try:
+            content = path.read_bytes()
+        except (FileNotFoundError, NotADirectoryError):
+            findings.append(_finding("missing_document", name, None, f"{name} not found in {feature_dir}"))
+            continue
+        artifacts[kind] = cache.parse(content, kind, str(path))
+        texts[kind] = content.decode("utf-8", errors="replace")
+
+    spec = artifacts.get("spec")
+    tasks = artifacts["tasks"].tasks if "tasks" in artifacts else ()
+    requirements = spec.requirements if spec else ()
+
+    # Requirement → task coverage, when tasks.md traces tasks to requirements
+    cites_requirements = any(task.requirements for task in tasks)
+    cites_stories = cites_requirements or any(task.tags for task in tasks)
+    covering: Dict[str, List[str]] = {requirement.id: [] for requirement in requirements}
+    task_ids = {task.id for task in tasks}
+    for task in tasks:
+        for ref in task.requirements:
+            if ref in covering:
+                if task.id not in covering[ref]:
+                    covering[ref].append(task.id)
+            else:
+                summary = f"{task.id} references {ref}, which spec.md doesn't define"
+                findings.append(
+                    _finding("unknown_reference", "tasks.md", task.line, summary, task=task.id, reference=ref)
+                )
+        for dependency in task.depends:
+            if dependency not in task_ids:
+                summary = f"{task.id} depends on undefined task {dependency}"
+                findings.append(
+                    _finding("unknown_reference", "tasks.md", task.line, summary, task=task.id, reference=dependency)
+                )
+        if cites_stories and not task.requirements and not task.tags:
+            summary = f"{task.id} maps to no requirement or story"
+            findings.append(_finding("orphan_task", "tasks.md", task.line, summary, task=task.id))
+
+    if "tasks" in artifacts and cites_requirements:
+        for requirement in requirements:
+            if not covering[requirement.id]:
+                summary = f"{requirement.id} has no tasks"
+                findings.append(_finding("coverage", "spec.md", requirement.line, summary, requirement=requirement.id))
+    elif "tasks" in artifacts and requirements:
+        summary = "No task cites a requirement ID; requirement coverage not checked"
+        if not cites_stories:
+            summary = "No task cites a requirement ID or [US#] story; coverage and orphan tasks not checked"
+        findings.append(_finding("untraced_tasks", "tasks.md", None, summary))
+
+    # Duplicate requirements: the same ID defined twice, or the same text
+    seen_ids: Dict[str, int] = {}
+    seen_texts: Dict[str, str] = {}
+    for requirement in requirements:
+        if requirement.id in seen_ids:
+            summary = f"{requirement.id} is also defined on line {seen_ids[requirement.id]}"
+            duplicates = [requirement.id]
+            findings.append(_finding("duplication", "spec.md", requirement.line, summary, requirements=duplicates))
+        else:
+            seen_ids[requirement.id] = requirement.line
+        text = _normalize(requirement.text)
+        if text and text in seen_texts and seen_texts[text] != requirement.id:
+            summary = f"{requirement.id} repeats {seen_texts[text]}"
+            duplicates = [seen_texts[text], requirement.id]
+            findings.append(_finding("duplication", "spec.md", requirement.line, summary, requirements=duplicates))
+        else:
+            seen_texts.setdefault(text, requirement.id)
+
+    # Template placeholders left in
+    for kind, artifact in artifacts.items():
+        for placeholder in artifact.placeholders:
+            summary = f"Unfilled placeholder {placeholder.text}"
+            findings.append(
+                _finding("placeholder", ARTIFACT_DOCS[kind], placeholder.line, summary, text=placeholder.text)
+            )
+
+    # Phrases the constitution bans
+    if rules:
+        principles = {rule["term"].lower(): rule["principle"] for rule in rules}
+        terms = sorted(principles, key=len, reverse=True)
+        banned = re.compile("|".join(rf"\b{re.escape(term)}\b" for term in terms), re.IGNORECASE)
+        for kind, text in texts.items():
+            for line_number, line in enumerate(text.splitlines(), 1):
+                for match in banned.finditer(line):
+                    term = match.group(0).lower()
+                    summary = f'"{match.group(0)}" conflicts with {principles[term]}'
+                    findings.append(
+                        _finding("constitution", ARTIFACT_DOCS[kind], line_number, summary,
+                                 term=term, principle=principles[term])
+                    )
+
+    findings.sort(key=lambda item: (SEVERITIES.index(item["severity"]), item["document"] or "", item["line"] or 0))
+    for number, finding in enumerate(findings, 1):
+        finding["id"] = f"F{number}"
+
+    covered = sum(1 for ids in covering.values() if ids)
+    counts = {category: 0 for category in CATEGORIES}
+    for finding in findings:
+        counts[finding["category"]] += 1
+    return {
+        "feature": feature_dir.name,
+        "documents": {kind: artifacts[kind].path if kind in artifacts else None for kind in ARTIFACT_DOCS},
+        "metrics": {
+            "requirements": len(requirements),
+            "tasks": len(tasks),
+            "covered_requirements": covered,
+            "coverage_percent": (
+                round(100 * covered / len(requirements), 1) if requirements and cites_requirements else None
+            ),
+            "findings": len(findings),
+            "critical": sum(1 for finding in findings if finding["severity"] == "CRITICAL"),
+            **{f"{category}_findings": count for category, count in counts.items()},
+        },
+        "coverage": [
+            {"requirement": requirement, "line": seen_ids[requirement], "tasks": ids}
+            for requirement, ids in covering.items()
+        ],
+        "findings": findings,
+    }
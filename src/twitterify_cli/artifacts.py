@@ -0,0 +1,374 @@
+"""Twitter-Init-Kit Artifacts - Parsed spec.md, plan.md and tasks.md"""
+
+import hashlib
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from .workspace import open_state_db
+
+CACHE_NAME = "artifacts.sqlite"
+
+# Bump when the model or the parser changes: cached models are discarded
+PARSER_FORMAT = 2
+
+# Parsed models kept in the cache (oldest are dropped first)
+CACHE_SIZE = 1024
+
+# Campaign documents parsed for a feature, by kind
+ARTIFACT_DOCS = {"spec": "spec.md", "plan": "plan.md", "tasks": "tasks.md"}
+
+# Requirement ID prefixes: functional, non-functional, success criteria
+REQUIREMENT_PREFIXES = ("FR", "NFR", "SC", "REQ")
+
+HEADING_PATTERN = re.compile(r"^(?P<hashes>#{1,6})\s+(?P<title>.+?)\s*#*\s*$")
+FENCE_PATTERN = re.compile(r"^\s*(```|~~~)")
+CHECKBOX_PATTERN = re.compile(r"^\s*[-*+]\s+\[(?P<mark>[ xX])\]\s+(?P<text>.*?)\s*$")
+TASK_PATTERN = re.compile(r"^(?P<id>T\d{3,})\b[:.]?\s*(?P<text>.*)$")
+TAG_PATTERN = re.compile(r"^\[(?P<tag>[^\]]+)\]\s*")
+REQUIREMENT_PATTERN = re.compile(
+    r"^\s*[-*+]\s+\*\*(?P<id>(?:%s)-\d{3,})\*\*\s*:?\s*(?P<text>.*?)\s*$" % "|".join(REQUIREMENT_PREFIXES)
+)
+REQUIREMENT_REF_PATTERN = re.compile(r"\b(?:%s)-\d{3,}\b" % "|".join(REQUIREMENT_PREFIXES))
+DEPENDS_PATTERN = re.compile(
+    r"\b(?:depends on|after|requires|blocked by)\s*:?\s*(?P<ids>T\d{3,}(?:\s*(?:,|and|&|/)\s*T\d{3,})*)",
+    re.IGNORECASE,
+)
+TASK_REF_PATTERN = re.compile(r"\bT\d{3,}\b")
+PHASE_PATTERN = re.compile(r"^Phase\s+(?P<number>\d+)\b", re.IGNORECASE)
+
+# Unfilled template text: "[Painful problem]", "[NEEDS CLARIFICATION: ...]",
+# TODO markers; links, checkboxes, task tags and code spans don't count
+PLACEHOLDER_PATTERN = re.compile(r"\[(?P<text>[^\[\]]{2,})\](?![(\[:])|\b(?:TODO|TKTK)\b|\?\?\?")
+TASK_TAG_PATTERN = re.compile(r"^(?:US\d+|Story \d+)$")
+CODE_SPAN_PATTERN = re.compile(r"`[^`]*`")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS artifacts (
+    digest TEXT PRIMARY KEY,
+    model TEXT NOT NULL
+);
+"""
+
+
+class Section(NamedTuple):
+    """A markdown heading."""
+
+    level: int
+    title: str
+    line: int
+
+
+class Requirement(NamedTuple):
+    """A `- **FR-001**: ...` requirement or success criterion."""
+
+    id: str
+    text: str
+    line: int
+    section: Optional[str]
+
+
+class Task(NamedTuple):
+    """A `- [ ] T001 [P] ...` task."""
+
+    id: str
+    text: str
+    line: int
+    done: bool
+    parallel: bool
+    tags: Tuple[str, ...]
+    requirements: Tuple[str, ...]
+    depends: Tuple[str, ...]
+    phase: Optional[int]
+    section: Optional[str]
+
+
+class Phase(NamedTuple):
+    """A `## Phase N: ...` heading and the tasks under it."""
+
+    number: int
+    title: str
+    line: int
+    tasks: Tuple[str, ...]
+
+
+class ChecklistItem(NamedTuple):
+    """A checkbox item that isn't a task."""
+
+    text: str
+    checked: bool
+    line: int
+    section: Optional[str]
+
+
+class Placeholder(NamedTuple):
+    """Template text left unfilled."""
+
+    text: str
+    line: int
+
+
+class Artifact(NamedTuple):
+    """Parsed campaign document.
+
+    Line numbers are 1-based; fenced code blocks are skipped.
+    """
+
+    kind: str
+    path: str
+    digest: str
+    sections: Tuple[Section, ...]
+    requirements: Tuple[Requirement, ...]
+    tasks: Tuple[Task, ...]
+    phases: Tuple[Phase, ...]
+    checklist: Tuple[ChecklistItem, ...]
+    placeholders: Tuple[Placeholder, ...]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form."""
+        data = self._asdict()
+        for field in ("sections", "requirements", "tasks", "phases", "checklist", "placeholders"):
+            data[field] = [item._asdict() for item in data[field]]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Artifact":
+        """Rebuild an artifact from to_dict() output."""
+        return cls(
+            kind=data["kind"],
+            path=data["path"],
+            digest=data["digest"],
+            sections=tuple(Section(**item) for item in data["sections"]),
+            requirements=tuple(Requirement(**item) for item in data["requirements"]),
+            tasks=tuple(
+                Task(**{**item, **{key: tuple(item[key]) for key in ("tags", "requirements", "depends")}})
+                for item in data["tasks"]
+            ),
+            phases=tuple(Phase(**{**item, "tasks": tuple(item["tasks"])}) for item in data["phases"]),
+            checklist=tuple(ChecklistItem(**item) for item in data["checklist"]),
+            placeholders=tuple(Placeholder(**item) for item in data["placeholders"]),
+        )
+
+
+def content_digest(content: bytes) -> str:
+    """Cache key of a document's content."""
+    return hashlib.sha256(content).hexdigest()
+
+
+def _parse_task(task_id: str, text: str, line: int, done: bool, phase: Optional[int], section: Optional[str]) -> Task:
+    """Split a task's leading [tags] and references from its text."""
+    tags = []
+    while True:
+        match = TAG_PATTERN.match(text)
+        if not match:
+            break
+        tags.append(match.group("tag"))
+        text = text[match.end():]
+
+    depends: List[str] = []
+    for match in DEPENDS_PATTERN.finditer(text):
+        depends += [ref for ref in TASK_REF_PATTERN.findall(match.group("ids")) if ref not in depends]
+
+    return Task(
+        id=task_id,
+        text=text,
+        line=line,
+        done=done,
+        parallel="P" in tags,
+        tags=tuple(tag for tag in tags if tag != "P"),
+        requirements=tuple(dict.fromkeys(REQUIREMENT_REF_PATTERN.findall(text))),
+        depends=tuple(depends),
+        phase=phase,
+        section=section,
+    )
+
+
+def parse_markdown(text: str, kind: str = "", path: str = "") -> Artifact:
+    """Parse a campaign document.
+
+    Args:
+        text: Markdown content
+        kind: "spec", "plan", "tasks" or another document name
+        path: Where the content came from
+
+    Returns:
+        The parsed artifact
+    """
+    sections: List[Section] = []
+    requirements: List[Requirement] = []
+    tasks: List[Task] = []
+    phases: List[Dict[str, Any]] = []
+    checklist: List[ChecklistItem] = []
+    placeholders: List[Placeholder] = []
+
+    section: Optional[str] = None
+    phase: Optional[Dict[str, Any]] = None
+    fenced = False
+
+    for line_number, line in enumerate(text.splitlines(), 1):
+        if FENCE_PATTERN.match(line):
+            fenced = not fenced
+            continue
+        if fenced:
+            continue
+
+        for match in PLACEHOLDER_PATTERN.finditer(CODE_SPAN_PATTERN.sub("", line)):
+            if not TASK_TAG_PATTERN.match(match.group("text") or ""):
+                placeholders.append(Placeholder(match.group(0), line_number))
+
+        heading = HEADING_PATTERN.match(line)
+        if heading:
+            level, section = len(heading.group("hashes")), heading.group("title")
+            sections.append(Section(level, section, line_number))
+            if phase is not None and level <= phase["level"]:
+                phase = None
+            match = PHASE_PATTERN.match(section)
+            if match:
+                phase = {"number": int(match.group("number")), "title": section, "line": line_number,
+                         "level": level, "tasks": []}
+                phases.append(phase)
+            continue
+
+        checkbox = CHECKBOX_PATTERN.match(line)
+        if checkbox:
+            done = checkbox.group("mark") != " "
+            task = TASK_PATTERN.match(checkbox.group("text"))
+            if task:
+                phase_number = phase["number"] if phase else None
+                tasks.append(
+                    _parse_task(task.group("id"), task.group("text"), line_number, done, phase_number, section)
+                )
+                if phase is not None:
+                    phase["tasks"].append(task.group("id"))
+            else:
+                checklist.append(ChecklistItem(checkbox.group("text"), done, line_number, section))
+            continue
+
+        requirement = REQUIREMENT_PATTERN.match(line)
+        if requirement:
+            requirements.append(Requirement(requirement.group("id"), requirement.group("text"), line_number, section))
+
+    return Artifact(
+        kind=kind,
+        path=path,
+        digest=content_digest(text.encode("utf-8")),
+        sections=tuple(sections),
+        requirements=tuple(requirements),
+        tasks=tuple(tasks),
+        phases=tuple(
+            Phase(item["number"], item["title"], item["line"], tuple(item["tasks"])) for item in phases
+        ),
+        checklist=tuple(checklist),
+        placeholders=tuple(placeholders),
+    )
+
+
+def artifact_kind(path: Path) -> str:
+    """Kind of a document: its name without .md (spec, plan, tasks, ...)."""
+    return path.name[:-3] if path.name.endswith(".md") else path.name
+
+
+class ArtifactCache:
+    """Parsed documents keyed by a hash of their content.
+
+    Models live in memory and in .twitterkit/state/artifacts.sqlite, so
+    documents that haven't changed since any earlier run are never parsed
+    again; loading one costs a read and a hash.
+    """
+
+    def __init__(self, root: Path, path: Optional[Path] = None):
+        """Open (or create) the cache.
+
+        Args:
+            root: Project root
+            path: Database file (default: .twitterkit/state/artifacts.sqlite);
+                an in-memory cache is used if it can't be written or the
+                project has no .twitterkit/ directory
+        """
+        self.root = root
+        self.conn = open_state_db(root, CACHE_NAME, SCHEMA, PARSER_FORMAT, path)
+        self.memory: Dict[str, Artifact] = {}
+        self.lock = threading.Lock()
+        self.parsed = 0
+
+    def close(self) -> None:
+        """Close the database."""
+        self.conn.close()
+
+    def __enter__(self) -> "ArtifactCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def parse(self, content: bytes, kind: str = "", path: str = "") -> Artifact:
+        """Parse content, or return its cached model.
+
+        Args:
+            content: Document bytes (UTF-8)
+            kind: Kind to report
+            path: Path to report
+
+        Returns:
+            The parsed artifact
+        """
+        digest = content_digest(content)
+        with self.lock:
+            artifact = self.memory.get(digest)
+            if artifact is None:
+                row = self.conn.execute("SELECT model FROM artifacts WHERE digest = ?", (digest,)).fetchone()
+                if row is not None:
+                    artifact = Artifact.from_dict(json.loads(row["model"]))
+                else:
+                    artifact = parse_markdown(content.decode("utf-8", errors="replace"))._replace(digest=digest)
+                    self.parsed += 1
+                    with self.conn:
+                        self.conn.execute(
+                            "INSERT OR REPLACE INTO artifacts VALUES (?, ?)",
+                            (digest, json.dumps(artifact.to_dict(), separators=(",", ":"))),
+                        )
+                        self.conn.execute(
+                            "DELETE FROM artifacts WHERE rowid <= (SELECT MAX(rowid) FROM artifacts) - ?",
+                            (CACHE_SIZE,),
+                        )
+                if len(self.memory) >= CACHE_SIZE:
+                    self.memory.clear()
+                self.memory[digest] = artifact
+        return artifact._replace(kind=kind, path=path)
+
+    def load(self, path: Path) -> Artifact:
+        """Parse a document file through the cache.
+
+        Args:
+            path: Markdown file
+
+        Returns:
+            The parsed artifact, with the path as given
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        return self.parse(path.read_bytes(), artifact_kind(path), str(path))
+
+    def feature(self, feature_dir: Path) -> Dict[str, Artifact]:
+        """Parse a feature's spec.md, plan.md and tasks.md.
+
+        Args:
+            feature_dir: specs/NNN-name directory
+
+        Returns:
+            Artifacts by kind, for the documents that exist
+        """
+        artifacts = {}
+        for kind, name in ARTIFACT_DOCS.items():
+            try:
+                artifacts[kind] = self.load(feature_dir / name)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+        return artifacts
@@ -0,0 +1,280 @@
+"""Twitter-Init-Kit Campaigns - Lock-Safe Campaign Numbering and Creation"""
+
+import json
+import os
+import re
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from .git_utils import GitUtils
+from .workspace import STATE_DIR, ensure_state_dir
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+INDEX_NAME = "campaigns.json"
+LOCK_NAME = "campaigns.lock"
+INDEX_FORMAT = 1
+
+# Placeholder files created in every campaign directory
+CAMPAIGN_FILES = ("spec.md", "plan.md", "tasks.md", "research.md")
+
+# Leading campaign number of a specs/ directory or branch name
+NUMBER_PATTERN = re.compile(r"^(\d+)")
+BRANCH_PATTERN = re.compile(r"^(\d{3})-")
+
+
+class CampaignError(Exception):
+    """Raised when a campaign can't be created."""
+
+
+def find_repo_root(start: Path) -> Optional[Path]:
+    """Find the project root by walking up from start.
+
+    Args:
+        start: Directory to start from
+
+    Returns:
+        First directory containing .git, .twitterkit or .specify, or None
+    """
+    for directory in (start.resolve(), *start.resolve().parents):
+        if (directory / ".git").exists() or (directory / ".twitterkit").is_dir() or (directory / ".specify").is_dir():
+            return directory
+    return None
+
+
+def slugify(description: str, max_words: int = 4) -> str:
+    """Turn a description into a branch-safe short name.
+
+    Args:
+        description: Campaign description
+        max_words: Number of words to keep
+
+    Returns:
+        Lowercase dash-separated slug (e.g., "alpha-launch-twitter-campaign")
+    """
+    slug = re.sub(r"[^a-z0-9]+", "-", description.lower()).strip("-")
+    return "-".join(slug.split("-")[:max_words])
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on path for the duration of the block.
+
+    Args:
+        path: Lock file (created if missing)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a+b") as handle:
+        if fcntl:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Modification time of a path in nanoseconds, or None if missing."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def scan_highest(specs_dir: Path, repo_root: Path, git: bool = True) -> int:
+    """Find the highest campaign number in use with one directory scan.
+
+    Local branches are included because campaigns created in worktrees
+    don't appear in this checkout's specs/ directory.
+
+    Args:
+        specs_dir: specs/ directory
+        repo_root: Project root
+        git: Also consider local NNN-* branches
+
+    Returns:
+        Highest number, or 0 if there are no campaigns
+    """
+    highest = 0
+    try:
+        with os.scandir(specs_dir) as entries:
+            for entry in entries:
+                match = NUMBER_PATTERN.match(entry.name)
+                if match and entry.is_dir():
+                    highest = max(highest, int(match.group(1)))
+    except FileNotFoundError:
+        pass
+
+    if git:
+        for branch in GitUtils().list_branches(repo_root):
+            match = BRANCH_PATTERN.match(branch)
+            if match:
+                highest = max(highest, int(match.group(1)))
+    return highest
+
+
+def load_index(repo_root: Path) -> Optional[Dict[str, Any]]:
+    """Read the campaign index.
+
+    Args:
+        repo_root: Project root
+
+    Returns:
+        Index data, or None if missing, unreadable or of another format
+    """
+    try:
+        index = json.loads((repo_root / STATE_DIR / INDEX_NAME).read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(index, dict) or index.get("format") != INDEX_FORMAT or not isinstance(index.get("highest"), int):
+        return None
+    return index
+
+
+def write_index(repo_root: Path, highest: int) -> None:
+    """Atomically record the highest campaign number and the specs/ mtime.
+
+    Args:
+        repo_root: Project root
+        highest: Highest campaign number in use
+    """
+    state_dir = ensure_state_dir(repo_root)
+    index = {
+        "format": INDEX_FORMAT,
+        "highest": highest,
+        "specs_mtime_ns": _mtime_ns(repo_root / "specs"),
+    }
+    path = state_dir / INDEX_NAME
+    tmp_path = path.with_name(f"{INDEX_NAME}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(index, indent=2) + "\n")
+    os.replace(tmp_path, path)
+
+
+def highest_number(repo_root: Path, git: bool = True) -> int:
+    """Highest campaign number in use, from the index when it is current.
+
+    The index is trusted while specs/ has the modification time it
+    recorded; otherwise (campaigns added or removed by other tools, or a
+    missing index) it is rebuilt with one scan. Numbers handed out earlier
+    are never reused. Call with the campaign lock held.
+
+    Args:
+        repo_root: Project root
+        git: Consider local branches when rebuilding
+
+    Returns:
+        Highest campaign number
+    """
+    index = load_index(repo_root)
+    if index is not None and index.get("specs_mtime_ns") == _mtime_ns(repo_root / "specs"):
+        return index["highest"]
+
+    highest = scan_highest(repo_root / "specs", repo_root, git=git)
+    if index is not None:
+        highest = max(highest, index["highest"])
+    return highest
+
+
+def create_campaign(
+    repo_root: Path,
+    description: str,
+    short_name: Optional[str] = None,
+    number: Optional[int] = None,
+    worktree: bool = False,
+) -> Dict[str, Any]:
+    """Create a numbered campaign directory and its branch.
+
+    Numbering, directory creation and branch creation happen under an
+    exclusive lock, so concurrent callers always get distinct numbers.
+
+    Args:
+        repo_root: Project root
+        description: Campaign description
+        short_name: Branch short name (default: first four words of description)
+        number: Campaign number (default: next free number)
+        worktree: Check the branch out in a new linked worktree
+            ($TWITTERKIT_WORKTREE_DIR, default ../<repo>.worktrees) instead of
+            switching the current one
+
+    Returns:
+        Same fields as create-new-campaign.sh --json: campaign_number,
+        campaign_dir, branch_name, short_name, description and, in
+        worktree mode, worktree_path; plus a "warnings" list
+
+    Raises:
+        CampaignError: If the worktree or campaign directory can't be created
+    """
+    git_utils = GitUtils()
+    is_git = git_utils.is_git_repo(repo_root)
+    if worktree and not is_git:
+        raise CampaignError("--worktree requires a git repository")
+
+    short_name = short_name or slugify(description)
+    warnings = []
+
+    with file_lock(repo_root / STATE_DIR / LOCK_NAME):
+        highest = highest_number(repo_root, git=is_git)
+        if number is None:
+            number = highest + 1
+        branch_name = f"{number:03d}-{short_name}"
+
+        specs_dir = repo_root / "specs"
+        worktree_path = None
+        if worktree:
+            worktree_dir = Path(
+                os.environ.get("TWITTERKIT_WORKTREE_DIR") or repo_root.parent / f"{repo_root.name}.worktrees"
+            )
+            worktree_path = GitUtils.get_worktree_path(repo_root, branch_name, worktree_dir)
+            if worktree_path.exists():
+                raise CampaignError(f"Worktree path already exists: {worktree_path}")
+            if not git_utils.create_branch(repo_root, branch_name, worktree_dir=worktree_dir):
+                raise CampaignError(f"Could not create worktree for branch '{branch_name}'")
+            specs_dir = worktree_path / "specs"
+
+        campaign_dir = specs_dir / branch_name
+        specs_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            # mkdir is the atomic claim: it fails if the directory exists
+            campaign_dir.mkdir()
+        except FileExistsError:
+            raise CampaignError(f"Campaign directory already exists: {campaign_dir}")
+        try:
+            for name in CAMPAIGN_FILES:
+                (campaign_dir / name).touch()
+            (campaign_dir / "refs").mkdir()
+        except OSError:
+            shutil.rmtree(campaign_dir, ignore_errors=True)
+            raise
+
+        if is_git and not worktree:
+            if branch_name in git_utils.list_branches(repo_root):
+                warnings.append(f"Git branch '{branch_name}' already exists, skipping branch creation")
+            elif not git_utils.create_branch(repo_root, branch_name):
+                warnings.append("Could not create git branch")
+
+        write_index(repo_root, max(highest, number))
+
+    result: Dict[str, Any] = {
+        "campaign_number": number,
+        "campaign_dir": str(campaign_dir),
+        "branch_name": branch_name,
+        "short_name": short_name,
+        "description": description,
+    }
+    if worktree_path is not None:
+        result["worktree_path"] = str(worktree_path)
+    result["warnings"] = warnings
+    return result
@@ -0,0 +1,142 @@
+"""Twitter-Init-Kit Checksums - Parallel Archive Verification"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .packager import CHECKSUMS_NAME, MANIFEST_NAME
+
+
+def hash_file(path: Path) -> Tuple[int, str]:
+    """Hash a file with large buffered reads.
+
+    hashlib releases the GIL while digesting, so several files hash in
+    parallel from a thread pool.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        (size in bytes, hex SHA-256)
+    """
+    with path.open("rb", buffering=0) as f:
+        digest = hashlib.file_digest(f, "sha256")
+        return f.tell(), digest.hexdigest()
+
+
+def hash_files(paths: Iterable[Path], jobs: Optional[int] = None) -> Dict[str, Tuple[int, str]]:
+    """Hash files concurrently.
+
+    Args:
+        paths: Files to hash
+        jobs: Number of worker threads (default: CPU count + 4)
+
+    Returns:
+        Mapping of file name -> (size, sha256)
+    """
+    paths = list(paths)
+    if not paths:
+        return {}
+
+    workers = min(jobs or (os.cpu_count() or 1) + 4, len(paths))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return {path.name: result for path, result in zip(paths, pool.map(hash_file, paths))}
+
+
+def read_checksums(path: Path) -> Dict[str, str]:
+    """Parse a sha256sum-format checksum file.
+
+    Args:
+        path: CHECKSUMS.sha256 file
+
+    Returns:
+        Mapping of file name -> expected sha256
+    """
+    expected: Dict[str, str] = {}
+    for line in path.read_text().splitlines():
+        if not line.strip() or line.startswith("#"):
+            continue
+        digest, _, name = line.partition(" ")
+        # sha256sum marks binary mode with "*" and may prefix "./"
+        name = name.lstrip(" *").removeprefix("./")
+        expected[name] = digest.lower()
+    return expected
+
+
+def verify_directory(directory: Path, jobs: Optional[int] = None) -> Dict[str, Any]:
+    """Verify archives against CHECKSUMS.sha256 and build-manifest.json.
+
+    Every archive listed in either file, or present on disk, is hashed once;
+    each source's expectations are then compared against the results.
+
+    Args:
+        directory: Directory containing archives and checksum files
+        jobs: Number of worker threads
+
+    Returns:
+        Report with sources, verified file names and problems; each problem
+        has file, issue (missing, unlisted, sha256, size), source and, where
+        relevant, expected and actual values
+
+    Raises:
+        ValueError: If the directory has neither a checksum file nor a
+            manifest with a "variants" mapping
+    """
+    # source name -> file name -> (expected size or None, expected sha256)
+    sources: Dict[str, Dict[str, Tuple[Optional[int], str]]] = {}
+
+    checksums_path = directory / CHECKSUMS_NAME
+    if checksums_path.is_file():
+        sources[CHECKSUMS_NAME] = {name: (None, digest) for name, digest in read_checksums(checksums_path).items()}
+
+    manifest_path = directory / MANIFEST_NAME
+    legacy = False
+    if manifest_path.is_file():
+        manifest = json.loads(manifest_path.read_text())
+        variants = manifest.get("variants") if isinstance(manifest, dict) else None
+        if isinstance(variants, dict):
+            sources[MANIFEST_NAME] = {
+                name: (entry.get("size"), entry["sha256"]) for name, entry in variants.items()
+            }
+        else:
+            # Older list-format manifests carry no per-archive digests to check
+            legacy = True
+
+    if not sources:
+        if legacy:
+            raise ValueError(f"{MANIFEST_NAME} in {directory} has no variants mapping and there is no {CHECKSUMS_NAME}")
+        raise ValueError(f"No {CHECKSUMS_NAME} or {MANIFEST_NAME} in {directory}")
+
+    listed = {name for expected in sources.values() for name in expected}
+    on_disk = {path.name for path in directory.glob("*.zip") if path.is_file()}
+    present = sorted(name for name in listed | on_disk if (directory / name).is_file())
+    actual = hash_files([directory / name for name in present], jobs=jobs)
+
+    problems: List[Dict[str, Any]] = []
+    for source, expected in sources.items():
+        for name, (size, digest) in sorted(expected.items()):
+            if name not in actual:
+                problems.append({"file": name, "issue": "missing", "source": source})
+                continue
+            actual_size, actual_digest = actual[name]
+            if size is not None and size != actual_size:
+                problems.append(
+                    {"file": name, "issue": "size", "source": source, "expected": size, "actual": actual_size}
+                )
+            if digest != actual_digest:
+                problems.append(
+                    {"file": name, "issue": "sha256", "source": source, "expected": digest, "actual": actual_digest}
+                )
+        for name in sorted(on_disk - set(expected)):
+            problems.append({"file": name, "issue": "unlisted", "source": source})
+
+    failed = {problem["file"] for problem in problems}
+    return {
+        "directory": str(directory),
+        "sources": list(sources),
+        "verified": [name for name in present if name not in failed],
+        "problems": problems,
+    }
@@ -0,0 +1,89 @@
+"""Twitter-Init-Kit CLI Tool - Typer Application"""
+
+import time
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+
+from .commands.init import init_command
+from .commands.check import check_command
+from .commands.status import status_command
+from .commands.release import release_app
+from .commands.campaign import campaign_app
+from .commands.tasks import tasks_app
+from .commands.verify import verify_command
+from .commands.paths import paths_command
+from .commands.prereqs import prereqs_command
+from .commands.serve import serve_command
+from .commands.watch import watch_command
+from .commands.context import context_command
+from .commands.artifacts import artifacts_command
+from .commands.analyze import analyze_command
+from .commands.duplicates import duplicates_command
+from . import __version__
+from .profiling import profiler
+
+app = typer.Typer(
+    help="twitterify - Twitter marketing toolkit powered by spec-driven development",
+    no_args_is_help=True,
+)
+console = Console()
+
+
+@app.callback()
+def main_callback(
+    ctx: typer.Context,
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Time subprocesses, copies and renders and print a summary",
+    ),
+    profile_trace: Optional[Path] = typer.Option(
+        None,
+        "--profile-trace",
+        help="Also write a Chrome trace-event JSON file (implies --profile)",
+    ),
+) -> None:
+    """twitterify - Twitter marketing toolkit powered by spec-driven development"""
+    if not (profile or profile_trace):
+        return
+
+    profiler.enable()
+    started = time.perf_counter()
+
+    def report() -> None:
+        profiler.print_summary(wall_time=time.perf_counter() - started)
+        if profile_trace:
+            profiler.write_chrome_trace(profile_trace)
+        profiler.disable()
+
+    ctx.call_on_close(report)
+
+
+# Register commands
+app.command(name="init")(init_command)
+app.command(name="check")(check_command)
+app.command(name="status")(status_command)
+app.command(name="verify")(verify_command)
+app.command(name="paths")(paths_command)
+app.command(name="prereqs")(prereqs_command)
+app.command(name="serve")(serve_command)
+app.command(name="watch")(watch_command)
+app.command(name="context")(context_command)
+app.command(name="artifacts")(artifacts_command)
+app.command(name="analyze")(analyze_command)
+app.command(name="duplicates")(duplicates_command)
+app.add_typer(release_app, name="release")
+app.add_typer(campaign_app, name="campaign")
+app.add_typer(tasks_app, name="tasks")
+
+
+@app.command()
+def version() -> None:
+    """Show version information."""
+    console.print(f"[bold]twitterify[/bold] version {__version__}")
+    console.print("Twitter marketing toolkit powered by spec-driven development")
+    console.print("\nFor more information, visit: https://github.com/yourusername/twitter-init-kit")
@@ -0,0 +1,91 @@
+"""Twitter-Init-Kit Client - Daemon Protocol Client
+
+Kept to the standard library and workspace paths: it runs before the CLI
+is loaded (see prerequisites.run), where importing the daemon's server
+side would cost more than the query.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .workspace import STATE_DIR
+
+SOCKET_NAME = "daemon.sock"
+PROTOCOL_VERSION = 1
+
+# Longest socket path that fits sockaddr_un on every Unix (macOS: 104 bytes)
+MAX_SOCKET_PATH = 100
+
+CLIENT_TIMEOUT = 5.0
+
+
+class DaemonError(Exception):
+    """Raised when the daemon can't start or rejects a request."""
+
+
+class DaemonUnavailable(DaemonError):
+    """Raised when no daemon is listening for the repository."""
+
+
+def socket_path(root: Path) -> Path:
+    """Socket the repository's daemon listens on.
+
+    Args:
+        root: Project root
+
+    Returns:
+        .twitterkit/state/daemon.sock, or a per-repository path in the temp
+        directory when that is too long for a Unix socket address
+    """
+    path = root / STATE_DIR / SOCKET_NAME
+    if len(os.fsencode(path)) <= MAX_SOCKET_PATH:
+        return path
+    digest = hashlib.sha256(os.fsencode(root)).hexdigest()[:16]
+    return Path(tempfile.gettempdir()) / f"twitterify-{digest}.sock"
+
+
+def request(root: Path, method: str, params: Optional[Dict[str, Any]] = None, timeout: float = CLIENT_TIMEOUT) -> Any:
+    """Send one query to the repository's daemon.
+
+    Args:
+        root: Project root
+        method: Protocol method
+        params: Method parameters
+        timeout: Seconds to wait for the connection and the response
+
+    Returns:
+        The method's result
+
+    Raises:
+        DaemonUnavailable: If no daemon is listening
+        DaemonError: If the daemon rejected the request
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise DaemonUnavailable("Unix domain sockets are not supported on this platform")
+    path = socket_path(root)
+
+    payload = {"id": 1, "protocol": PROTOCOL_VERSION, "method": method, "params": params or {}}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(path))
+        except OSError as e:
+            raise DaemonUnavailable(f"No daemon listening on {path}") from e
+        try:
+            sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+        except OSError as e:
+            raise DaemonUnavailable(f"Daemon on {path} did not answer: {e}") from e
+
+    if not line:
+        raise DaemonUnavailable(f"Daemon on {path} closed the connection")
+    response = json.loads(line)
+    if "error" in response:
+        raise DaemonError(response["error"])
+    return response["result"]
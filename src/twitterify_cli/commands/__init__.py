@@ -1,3 +1,3 @@
 """Twitter-Init-Kit CLI Commands Module"""
 
-__all__ = ["init", "check"]
+__all__ = ["init", "check", "status", "release", "verify", "campaign", "paths", "prereqs", "serve", "watch", "context", "artifacts", "analyze", "duplicates", "tasks"]
@@ -0,0 +1,82 @@
+"""Twitter-Init-Kit Analyze Command - Cross-Artifact Report"""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from ..analyze import analyze_feature
+from ..artifacts import ArtifactCache
+from ..workspace import feature_paths
+
+console = Console()
+
+# Findings shown in the table (as in /twitterkit.analyze); --json has all
+MAX_TABLE_FINDINGS = 50
+
+SEVERITY_STYLES = {"CRITICAL": "bold red", "HIGH": "red", "MEDIUM": "yellow", "LOW": "dim", "INFO": "cyan"}
+
+
+def analyze_command(
+    feature: Optional[str] = typer.Option(
+        None,
+        "--feature",
+        help="Feature directory in specs/ (default: the current branch's)",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output the report in JSON format",
+    ),
+    strict: bool = typer.Option(
+        False,
+        "--strict",
+        help="Exit with status 1 if there are CRITICAL findings",
+    ),
+) -> None:
+    """Run the mechanical /twitterkit.analyze checks on a feature.
+
+    Reports requirement→task coverage, orphan tasks, references to
+    undefined requirements or tasks, leftover template placeholders,
+    duplicate requirements and phrases the constitution bans. Documents
+    are parsed through the cache in .twitterkit/state/, so the agent only
+    has to handle the judgment calls.
+    """
+
+    paths = feature_paths(Path.cwd(), feature=feature)
+    root = Path(paths["REPO_ROOT"])
+    with ArtifactCache(root) as cache:
+        report = analyze_feature(root, Path(paths["FEATURE_DIR"]), cache)
+
+    if json_output:
+        print(json.dumps(report, indent=2))
+    else:
+        metrics = report["metrics"]
+        coverage = metrics["coverage_percent"]
+        console.print(
+            f"[bold]{report['feature']}[/bold]: {metrics['requirements']} requirements, {metrics['tasks']} tasks, "
+            f"coverage {'-' if coverage is None else f'{coverage}%'}, {metrics['findings']} findings "
+            f"({metrics['critical']} critical)"
+        )
+        if report["findings"]:
+            table = Table()
+            table.add_column("ID", style="cyan")
+            table.add_column("Severity")
+            table.add_column("Location")
+            table.add_column("Summary")
+            for finding in report["findings"][:MAX_TABLE_FINDINGS]:
+                severity = finding["severity"]
+                location = finding["document"] + (f":{finding['line']}" if finding["line"] else "")
+                table.add_row(
+                    finding["id"], f"[{SEVERITY_STYLES[severity]}]{severity}[/]", location, finding["summary"]
+                )
+            console.print(table)
+            hidden = len(report["findings"]) - MAX_TABLE_FINDINGS
+            if hidden > 0:
+                console.print(f"[dim]... {hidden} more (use --json for all)[/dim]")
+
+    if strict and report["metrics"]["critical"]:
+        raise typer.Exit(1)
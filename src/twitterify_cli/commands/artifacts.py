@@ -0,0 +1,64 @@
+"""Twitter-Init-Kit Artifacts Command - Parsed Campaign Documents"""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from ..artifacts import ArtifactCache
+from ..workspace import feature_paths
+
+console = Console()
+
+
+def artifacts_command(
+    feature: Optional[str] = typer.Option(
+        None,
+        "--feature",
+        help="Feature directory in specs/ (default: the current branch's)",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output the parsed documents in JSON format",
+    ),
+) -> None:
+    """Show the parsed spec.md, plan.md and tasks.md of a feature.
+
+    Documents are parsed into sections, requirement IDs, tasks (with [P]
+    markers, tags and dependencies), phases and checklist items. Parsed
+    models are cached in .twitterkit/state/ by content hash, so unchanged
+    documents are never parsed twice.
+    """
+
+    paths = feature_paths(Path.cwd(), feature=feature)
+    root = Path(paths["REPO_ROOT"])
+    with ArtifactCache(root) as cache:
+        artifacts = cache.feature(Path(paths["FEATURE_DIR"]))
+
+    if json_output:
+        print(json.dumps({kind: artifact.to_dict() for kind, artifact in artifacts.items()}, indent=2))
+        return
+
+    if not artifacts:
+        console.print(f"[yellow]No spec.md, plan.md or tasks.md in {paths['FEATURE_DIR']}[/yellow]")
+        return
+
+    table = Table(title=Path(paths["FEATURE_DIR"]).name)
+    table.add_column("Document", style="cyan")
+    for column in ("Sections", "Requirements", "Tasks", "Parallel", "Phases", "Checklist"):
+        table.add_column(column, justify="right")
+    for artifact in artifacts.values():
+        table.add_row(
+            Path(artifact.path).name,
+            str(len(artifact.sections)),
+            str(len(artifact.requirements)),
+            f"{sum(task.done for task in artifact.tasks)}/{len(artifact.tasks)}",
+            str(sum(task.parallel for task in artifact.tasks)),
+            str(len(artifact.phases)),
+            f"{sum(item.checked for item in artifact.checklist)}/{len(artifact.checklist)}",
+        )
+    console.print(table)
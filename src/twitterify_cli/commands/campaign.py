@@ -0,0 +1,94 @@
+"""Twitter-Init-Kit Campaign Command - Campaign Creation"""
+
+import json
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+from rich.console import Console
+
+from ..campaigns import CampaignError, create_campaign, find_repo_root
+
+console = Console()
+err_console = Console(stderr=True)
+
+campaign_app = typer.Typer(
+    help="Create and manage campaigns",
+    no_args_is_help=True,
+)
+
+
+@campaign_app.command("new")
+def new_command(
+    description: List[str] = typer.Argument(
+        ...,
+        help="Campaign description",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output in JSON format",
+    ),
+    worktree: bool = typer.Option(
+        False,
+        "--worktree",
+        help="Create the campaign branch in its own git worktree instead of switching branches "
+        "(directory: $TWITTERKIT_WORKTREE_DIR, default: ../<repo>.worktrees)",
+    ),
+    short_name: Optional[str] = typer.Option(
+        None,
+        "--short-name",
+        help="Custom short name (2-4 words) for the campaign branch",
+    ),
+    number: Optional[int] = typer.Option(
+        None,
+        "--number",
+        min=1,
+        help="Campaign number (overrides auto-detection)",
+    ),
+) -> None:
+    """Create a numbered campaign directory and branch.
+
+    Numbers come from an index under .twitterkit/state/ guarded by a file
+    lock, so campaigns created concurrently never share a number. Output
+    matches create-new-campaign.sh.
+    """
+
+    repo_root = find_repo_root(Path.cwd())
+    if repo_root is None:
+        console.print(
+            "[red]Error: Could not find repository root (no .git, .twitterkit, or .specify directory found)[/red]"
+        )
+        raise typer.Exit(1)
+
+    try:
+        result = create_campaign(
+            repo_root,
+            " ".join(description),
+            short_name=short_name,
+            number=number,
+            worktree=worktree,
+        )
+    except CampaignError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    for warning in result.pop("warnings"):
+        err_console.print(f"[yellow]Warning: {warning}[/yellow]")
+
+    if json_output:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return
+
+    console.print(f"[green]✓[/green] Created campaign: {result['branch_name']}")
+    console.print()
+    console.print(f"Campaign directory: {result['campaign_dir']}")
+    console.print(f"Git branch: {result['branch_name']}")
+    if "worktree_path" in result:
+        console.print(f"Worktree: {result['worktree_path']}")
+    console.print()
+    console.print("Next steps:")
+    console.print("  1. Run /twitterkit.specify to create your campaign spec")
+    console.print("  2. Run /twitterkit.plan to generate your growth plan")
+    console.print("  3. Run /twitterkit.tasks to break down execution")
+    console.print("  4. Run /twitterkit.implement to execute systematically")
@@ -7,6 +7,8 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
+from ..profiling import profiler
+
 console = Console()
 
 
@@ -94,8 +96,9 @@ def _check_tools(tools: Dict[str, str], debug: bool = False) -> Dict[str, Tuple[
 
     for tool, cmd in tools.items():
         try:
-            result = subprocess.run(
+            result = profiler.run(
                 cmd,
+                category="probe",
                 shell=True,
                 capture_output=True,
                 timeout=5,
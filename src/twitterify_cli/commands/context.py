@@ -0,0 +1,55 @@
+"""Twitter-Init-Kit Context Command - Agent Context Updates"""
+
+import json
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+from rich.console import Console
+
+from ..agent_context import update_agent_context
+from ..workspace import repo_root
+
+console = Console()
+
+
+def context_command(
+    agents: Optional[List[str]] = typer.Option(
+        None,
+        "--agent",
+        "-a",
+        help="Agent to update (repeatable; default: agents configured in the project)",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output in JSON format",
+    ),
+) -> None:
+    """Update the agents' context files from the current plan.
+
+    The current feature's plan.md and the constitution are read once and a
+    managed section is spliced into every agent's context file, between
+    TWITTERKIT CONTEXT markers; anything outside them is kept. Files are
+    updated concurrently and only written when their content changes.
+    """
+
+    root = repo_root(Path.cwd())
+    try:
+        results = update_agent_context(root, agents or None)
+    except ValueError as e:
+        console.print(f"[red]✗[/red] {e}")
+        raise typer.Exit(1)
+
+    if json_output:
+        print(json.dumps(results, indent=2))
+        return
+
+    if not results:
+        console.print("[yellow]No agents configured; use --agent to choose one[/yellow]")
+        return
+    for result in results:
+        if result["status"] == "unchanged":
+            console.print(f"[dim]- {result['path']} (unchanged)[/dim]")
+        else:
+            console.print(f"[green]✓[/green] {result['path']} ({result['status']}: {', '.join(result['agents'])})")
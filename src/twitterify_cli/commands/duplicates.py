@@ -0,0 +1,71 @@
+"""Twitter-Init-Kit Duplicates Command - Near-Duplicate Clusters"""
+
+import json
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from ..duplicates import DEFAULT_THRESHOLD, DuplicateIndex
+from ..workspace import repo_root
+
+console = Console()
+
+
+def duplicates_command(
+    threshold: float = typer.Option(
+        DEFAULT_THRESHOLD,
+        "--threshold",
+        min=0.0,
+        max=1.0,
+        help="Minimum Jaccard similarity of word shingles",
+    ),
+    features: Optional[List[str]] = typer.Option(
+        None,
+        "--feature",
+        help="Only clusters involving this feature (repeatable)",
+    ),
+    cross_only: bool = typer.Option(
+        False,
+        "--cross-campaign",
+        help="Only clusters spanning several campaigns",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output in JSON format",
+    ),
+) -> None:
+    """Find near-duplicate requirements and tasks across specs/.
+
+    Every requirement and task line is shingled and MinHashed into an LSH
+    index in .twitterkit/state/, so candidates are found without comparing
+    every pair. The index is refreshed incrementally: only campaign
+    documents that changed since the last run are re-indexed.
+    """
+
+    root = repo_root(Path.cwd())
+    with DuplicateIndex(root) as index:
+        clusters = index.clusters(threshold=threshold, features=features or None)
+    if cross_only:
+        clusters = [cluster for cluster in clusters if cluster["cross_campaign"]]
+
+    if json_output:
+        print(json.dumps(clusters, indent=2))
+        return
+
+    if not clusters:
+        console.print("[green]✓[/green] No near-duplicates found")
+        return
+    for number, cluster in enumerate(clusters, 1):
+        scope = "across campaigns" if cluster["cross_campaign"] else "within a campaign"
+        title = f"Cluster {number}: {len(cluster['items'])} items, similarity ≥ {cluster['similarity']} ({scope})"
+        table = Table(title=title)
+        table.add_column("Location", style="cyan")
+        table.add_column("ID")
+        table.add_column("Text")
+        for item in cluster["items"]:
+            table.add_row(f"{item['feature']}/{item['document']}.md:{item['line']}", item["id"], item["text"])
+        console.print(table)
@@ -10,6 +10,8 @@ from rich.console import Console
 from rich.panel import Panel
 
 from ..git_utils import GitUtils
+from ..profiling import profiler
+from ..workspace import STATE_DIR
 
 console = Console()
 
@@ -36,6 +38,22 @@ AGENT_CONFIG = {
 }
 
 
+def command_file_name(template: str, file_ext: str) -> str:
+    """Name a command template is installed under for an agent.
+
+    Args:
+        template: Template file name, e.g. twitterkit.plan.md
+        file_ext: The agent's file extension from AGENT_CONFIG
+
+    Returns:
+        The file name in the agent's commands directory
+    """
+    # Convert filename if needed (e.g., .md -> .toml for gemini/qwen, .agent.md for copilot)
+    if file_ext in (".toml", ".agent.md"):
+        return Path(template).stem + file_ext
+    return template
+
+
 def init_command(
     project_name: Optional[str] = typer.Argument(
         None,
@@ -66,6 +84,11 @@ def init_command(
         "--no-git",
         help="Skip git repository initialization",
     ),
+    commit: bool = typer.Option(
+        False,
+        "--commit",
+        help="Commit the generated files in the repository init creates",
+    ),
     ignore_agent_tools: bool = typer.Option(
         False,
         "--ignore-agent-tools",
@@ -111,11 +134,16 @@ def init_command(
     if debug:
         console.print(f"[dim]Target directory: {target_dir}[/dim]")
 
+    # Files written by this run, committed by path with --commit when we own the repository
+    written_paths = []
+    repo_initialized = False
+
     # Initialize git repository if not disabled
     if not no_git:
         git_utils = GitUtils(debug=debug)
         if not git_utils.is_git_repo(target_dir):
             if git_utils.init_repo(target_dir):
+                repo_initialized = True
                 console.print("[green]✓[/green] Initialized git repository")
             else:
                 console.print("[yellow]⚠[/yellow] Git initialization failed (continuing...)")
@@ -137,7 +165,23 @@ def init_command(
         if debug:
             console.print(f"[dim]Copying .twitterkit/ from {source_twitterkit}[/dim]")
 
-        shutil.copytree(source_twitterkit, target_twitterkit, dirs_exist_ok=True)
+        def copy_and_record(src: str, dst: str) -> str:
+            written_paths.append(Path(dst))
+            with profiler.span("copy file", "copy", path=dst):
+                return shutil.copy2(src, dst)
+
+        def skip_state(directory: str, names: list) -> list:
+            # Local state of a development checkout is never installed
+            return [STATE_DIR.name] if Path(directory) == source_twitterkit else []
+
+        with profiler.span("copy .twitterkit", "phase"):
+            shutil.copytree(
+                source_twitterkit,
+                target_twitterkit,
+                copy_function=copy_and_record,
+                ignore=skip_state,
+                dirs_exist_ok=True,
+            )
         console.print("[green]✓[/green] Installed .twitterkit/ package")
     else:
         if debug:
@@ -159,24 +203,15 @@ def init_command(
             if commands_source.exists():
                 installed_count = 0
                 for cmd_file in commands_source.glob("twitterkit.*.md"):
-                    # Convert filename if needed (e.g., .md -> .toml for gemini/qwen)
-                    if file_ext == ".md":
-                        dest_name = cmd_file.name
-                    elif file_ext == ".toml":
-                        # Convert to TOML format for gemini/qwen
-                        dest_name = cmd_file.stem + ".toml"
-                    elif file_ext == ".agent.md":
-                        # Convert to .agent.md for copilot
-                        dest_name = cmd_file.stem + ".agent.md"
-                    else:
-                        dest_name = cmd_file.name
-                    
+                    dest_name = command_file_name(cmd_file.name, file_ext)
                     dest_file = commands_dir / dest_name
                     if dest_file.exists() and not force:
                         if debug:
                             console.print(f"[yellow]⚠[/yellow] Skipping {dest_name} (already exists)")
                     else:
-                        shutil.copy2(cmd_file, dest_file)
+                        with profiler.span("install command", "copy", path=str(dest_file)):
+                            shutil.copy2(cmd_file, dest_file)
+                        written_paths.append(dest_file)
                         installed_count += 1
                         if debug:
                             console.print(f"[dim]Installed: {dest_name}[/dim]")
@@ -222,8 +257,22 @@ Twitter marketing campaign powered by twitter-init-kit
 - [Spec-Kit Original](https://github.com/github/spec-kit)
 """
         readme_path.write_text(readme_content)
+        written_paths.append(readme_path)
         console.print("[green]✓[/green] Created README.md")
 
+    # Commit exactly the files we generated; never sweep up unrelated content
+    if commit and repo_initialized and written_paths:
+        if git_utils.commit_changes(
+            target_dir,
+            "Initial commit from twitterify template",
+            paths=written_paths,
+        ):
+            console.print("[green]✓[/green] Created initial commit")
+        else:
+            console.print("[yellow]⚠[/yellow] Initial commit failed (continuing...)")
+    elif commit and not no_git and not repo_initialized:
+        console.print("[dim]Not committing: the git repository already existed[/dim]")
+
     # Display success message
     next_steps = [
         f"1. cd {target_dir.name if target_dir != Path.cwd() else '.'}",
@@ -237,10 +286,11 @@ Twitter marketing campaign powered by twitter-init-kit
 
     next_steps.insert(1, f"   AI Agent: {selected_ai}")
 
-    console.print(
-        Panel(
-            f"[green]✓ Project initialized at {target_dir}[/green]\n\n"
-            f"Next steps:\n" + "\n".join(next_steps),
-            title="[bold blue]twitter-init-kit[/bold blue]",
+    with profiler.span("summary panel", "render"):
+        console.print(
+            Panel(
+                f"[green]✓ Project initialized at {target_dir}[/green]\n\n"
+                f"Next steps:\n" + "\n".join(next_steps),
+                title="[bold blue]twitter-init-kit[/bold blue]",
+            )
         )
-    )
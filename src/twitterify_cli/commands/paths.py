@@ -0,0 +1,72 @@
+"""Twitter-Init-Kit Paths Command - Feature Path Resolution"""
+
+import json
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from ..daemon import query
+
+console = Console()
+err_console = Console(stderr=True)
+
+# Keys printed by check-prerequisites.sh --paths-only, in order
+PATH_KEYS = {
+    "REPO_ROOT": "REPO_ROOT",
+    "BRANCH": "CURRENT_BRANCH",
+    "FEATURE_DIR": "FEATURE_DIR",
+    "FEATURE_SPEC": "FEATURE_SPEC",
+    "IMPL_PLAN": "IMPL_PLAN",
+    "TASKS": "TASKS",
+}
+
+
+def paths_command(
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output in JSON format",
+    ),
+    list_features: bool = typer.Option(
+        False,
+        "--list",
+        help="List every feature directory in specs/ with its documents",
+    ),
+) -> None:
+    """Show the current feature's paths, like check-prerequisites.sh --paths-only.
+
+    Lookups go through an index of specs/ kept in .twitterkit/state/, which
+    only rescans directories whose modification time changed. The branch is
+    read from .git/HEAD without running git. Answered by `twitterify
+    serve` when it runs for the repository.
+    """
+
+    if list_features:
+        features = query(Path.cwd(), "features")
+        if json_output:
+            print(json.dumps(features, indent=2))
+            return
+        table = Table(title="Features")
+        table.add_column("Feature", style="cyan")
+        table.add_column("Documents")
+        for feature in features:
+            table.add_row(feature["name"], ", ".join(feature["docs"]) or "[dim]-[/dim]")
+        console.print(table)
+        return
+
+    paths = query(Path.cwd(), "paths")
+    for warning in paths["warnings"]:
+        err_console.print(f"[yellow]Warning: {warning}[/yellow]")
+
+    output = {key: paths[source] for key, source in PATH_KEYS.items()}
+    output["AVAILABLE_DOCS"] = paths["AVAILABLE_DOCS"]
+    if json_output:
+        print(json.dumps(output))
+        return
+
+    for key, value in output.items():
+        if key == "AVAILABLE_DOCS":
+            value = ", ".join(value) or "-"
+        print(f"{key}: {value}")
@@ -0,0 +1,55 @@
+"""Twitter-Init-Kit Prereqs Command - Feature Prerequisite Checks"""
+
+import sys
+from pathlib import Path
+
+import typer
+
+from ..daemon import query
+
+
+def prereqs_command(
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output in JSON format",
+    ),
+    require_tasks: bool = typer.Option(
+        False,
+        "--require-tasks",
+        help="Require tasks.md to exist (for implementation phase)",
+    ),
+    include_tasks: bool = typer.Option(
+        False,
+        "--include-tasks",
+        help="Include tasks.md in AVAILABLE_DOCS list",
+    ),
+    paths_only: bool = typer.Option(
+        False,
+        "--paths-only",
+        help="Only output path variables (no prerequisite validation)",
+    ),
+) -> None:
+    """Check the current feature's prerequisites, like check-prerequisites.sh.
+
+    Output, error messages and exit codes are identical to the script's, so
+    command templates can call either. The branch is read from .git without
+    running git and the feature directory is read with one scan. Answered
+    by `twitterify serve` when it runs for the repository.
+    """
+
+    result = query(
+        Path.cwd(),
+        "prereqs",
+        {
+            "json": json_output,
+            "require_tasks": require_tasks,
+            "include_tasks": include_tasks,
+            "paths_only": paths_only,
+        },
+    )
+    # Written verbatim: agents parse this output
+    sys.stderr.write(result["stderr"])
+    sys.stdout.write(result["stdout"])
+    if result["exit_code"]:
+        raise typer.Exit(result["exit_code"])
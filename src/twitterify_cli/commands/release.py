@@ -0,0 +1,528 @@
+"""Twitter-Init-Kit Release Commands - Template Packaging"""
+
+import json
+import time
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from ..delta import apply_delta, diff_releases
+from ..packager import Packager, archive_name
+from ..release_notes import write_release_notes
+from ..smoke import archive_variants, smoke_test, source_variants
+from ..validator import find_archives, validate_archives
+
+console = Console()
+
+release_app = typer.Typer(
+    help="Build, validate, smoke test and diff release template packages",
+    no_args_is_help=True,
+)
+
+
+def _split_list(value: Optional[str]) -> Optional[List[str]]:
+    """Split a space/comma-separated option (AGENTS="claude,gemini")."""
+    if not value:
+        return None
+    return [item for item in value.replace(",", " ").split() if item]
+
+
+@release_app.command("build")
+def build_command(
+    version: str = typer.Argument(
+        ...,
+        help="Release version (e.g., v0.1.0)",
+    ),
+    output: Path = typer.Option(
+        Path(".genreleases"),
+        "--output",
+        "-o",
+        envvar="GENRELEASES_DIR",
+        help="Directory to write archives to",
+    ),
+    source: Path = typer.Option(
+        Path(".twitterkit"),
+        "--source",
+        help="Path to the .twitterkit/ directory to package",
+    ),
+    agents: Optional[str] = typer.Option(
+        None,
+        "--agents",
+        envvar="AGENTS",
+        help="Space/comma-separated agents to package (default: all)",
+    ),
+    scripts: Optional[str] = typer.Option(
+        None,
+        "--scripts",
+        envvar="SCRIPTS",
+        help="Space/comma-separated script types: sh, ps (default: both)",
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Number of worker processes (default: CPU count)",
+    ),
+    check: bool = typer.Option(
+        False,
+        "--check",
+        help="Rebuild in memory and verify the existing archives are byte-identical",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Rebuild every variant, ignoring the build manifest",
+    ),
+    clean: bool = typer.Option(
+        False,
+        "--clean",
+        help="Delete other archives (e.g., older versions) from the output directory",
+    ),
+    python_prereqs: bool = typer.Option(
+        False,
+        "--python-prereqs",
+        help="Have command files call `twitterify prereqs` instead of check-prerequisites.sh",
+    ),
+    debug: bool = typer.Option(
+        False,
+        "--debug",
+        help="Enable debug output",
+    ),
+) -> None:
+    """Build template archives for every agent × script variant.
+
+    Archives are reproducible: set SOURCE_DATE_EPOCH to control the
+    timestamp recorded for every entry. Variants whose inputs are unchanged
+    since the last build (per build-manifest.json) are reused. The manifest
+    and CHECKSUMS.sha256 are written alongside the archives.
+    """
+
+    if not source.is_dir():
+        console.print(f"[red]Error: Source directory {source} not found[/red]")
+        raise typer.Exit(1)
+
+    started = time.perf_counter()
+    try:
+        results = Packager(source, debug=debug).build(
+            version,
+            output,
+            agents=_split_list(agents),
+            scripts=_split_list(scripts),
+            jobs=jobs,
+            check=check,
+            force=force,
+            clean=clean,
+            python_prereqs=python_prereqs,
+        )
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    elapsed = time.perf_counter() - started
+
+    if check:
+        _report_check(results, version, elapsed)
+        return
+
+    table = Table(title=f"Release {version}")
+    table.add_column("Archive", style="cyan")
+    table.add_column("Status")
+    table.add_column("Size", justify="right")
+    table.add_column("SHA-256", style="dim")
+    for result in results:
+        table.add_row(
+            archive_name(result["agent"], result["script"], version),
+            "[dim]up to date[/dim]" if result["skipped"] else "[green]built[/green]",
+            f"{result['size']:,}",
+            result["sha256"][:16],
+        )
+    console.print(table)
+
+    built = sum(not result["skipped"] for result in results)
+    console.print(
+        f"[green]✓[/green] Built {built} variant(s), {len(results) - built} up to date, "
+        f"in {elapsed * 1000:.0f} ms → {output}/"
+    )
+
+
+def _report_check(results: List[Dict[str, Any]], version: str, elapsed: float) -> None:
+    """Print reproducibility check results and exit non-zero on mismatch."""
+    table = Table(title=f"Reproducibility check {version}")
+    table.add_column("Archive", style="cyan")
+    table.add_column("Status")
+    table.add_column("SHA-256", style="dim")
+
+    failures = 0
+    for result in results:
+        name = archive_name(result["agent"], result["script"], version)
+        if result["expected"] is None:
+            status = "[red]missing[/red]"
+        elif result["expected"] != result["sha256"]:
+            status = "[red]differs[/red]"
+        else:
+            status = "[green]identical[/green]"
+        failures += result["expected"] != result["sha256"]
+        table.add_row(name, status, result["sha256"][:16])
+    console.print(table)
+
+    if failures:
+        console.print(f"[red]✗[/red] {failures} of {len(results)} archive(s) are not reproducible")
+        raise typer.Exit(1)
+    console.print(f"[green]✓[/green] All {len(results)} archive(s) reproduced byte-for-byte in {elapsed * 1000:.0f} ms")
+
+
+@release_app.command("validate")
+def validate_command(
+    path: Path = typer.Argument(
+        ...,
+        help="Template ZIP or directory of ZIPs",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output the report as JSON",
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Number of archives to validate concurrently",
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Show every check, not only failures and warnings",
+    ),
+) -> None:
+    """Validate template archives without extracting them."""
+
+    try:
+        archives = find_archives(path)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    if not archives:
+        console.print(f"[yellow]⚠[/yellow] No ZIP files found in {path}")
+        raise typer.Exit(1)
+
+    started = time.perf_counter()
+    results = validate_archives(archives, jobs=jobs)
+    elapsed = time.perf_counter() - started
+    failed = [result for result in results if not result["passed"]]
+
+    if json_output:
+        report = {
+            "total": len(results),
+            "passed": len(results) - len(failed),
+            "failed": len(failed),
+            "seconds": round(elapsed, 3),
+            "archives": results,
+        }
+        print(json.dumps(report, indent=2))
+    else:
+        for result in results:
+            mark = "[green]✓[/green]" if result["passed"] else "[red]✗[/red]"
+            console.print(f"{mark} {result['archive']}")
+            for check in result["checks"]:
+                if not check["passed"]:
+                    console.print(f"    [red]✗[/red] {check['message']}")
+                elif check["warning"]:
+                    console.print(f"    [yellow]⚠[/yellow] {check['message']}")
+                elif verbose:
+                    console.print(f"    [dim]✓ {check['message']}[/dim]")
+
+        console.print()
+        if failed:
+            console.print(f"[red]✗[/red] {len(failed)} of {len(results)} template(s) failed validation")
+        else:
+            console.print(f"[green]✓[/green] All {len(results)} template(s) passed in {elapsed * 1000:.0f} ms")
+
+    if failed:
+        raise typer.Exit(1)
+
+
+@release_app.command("notes")
+def notes_command(
+    version: str = typer.Argument(
+        ...,
+        help="Release version the notes are for (must match the build manifest)",
+    ),
+    previous: Optional[str] = typer.Option(
+        None,
+        "--previous",
+        "-p",
+        help="Previous release tag; the changelog lists commits since it",
+    ),
+    release_dir: Path = typer.Option(
+        Path(".genreleases"),
+        "--dir",
+        "-d",
+        envvar="GENRELEASES_DIR",
+        help="Directory the release was built into",
+    ),
+    output: Path = typer.Option(
+        Path("release_notes.md"),
+        "--output",
+        "-o",
+        help="Markdown file to write",
+    ),
+) -> None:
+    """Write release notes from the build manifest and one git log.
+
+    Variants, sizes and SHA-256 hashes come from build-manifest.json, so
+    only archives that were actually built are listed.
+    """
+
+    try:
+        summary = write_release_notes(release_dir, output, version, previous=previous)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    console.print(
+        f"[green]✓[/green] Release notes for {version}: {summary['variants']} variant(s), "
+        f"{summary['commits']} commit(s) → {output}"
+    )
+
+
+@release_app.command("smoke")
+def smoke_command(
+    path: Optional[Path] = typer.Argument(
+        None,
+        help="Template ZIP or directory of ZIPs (default: build from --source in memory)",
+    ),
+    source: Path = typer.Option(
+        Path(".twitterkit"),
+        "--source",
+        help="Path to the .twitterkit/ directory to build when no archives are given",
+    ),
+    agents: Optional[str] = typer.Option(
+        None,
+        "--agents",
+        envvar="AGENTS",
+        help="Space/comma-separated agents to test (default: all)",
+    ),
+    scripts: Optional[str] = typer.Option(
+        None,
+        "--scripts",
+        envvar="SCRIPTS",
+        help="Space/comma-separated script types: sh, ps (default: both)",
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Number of variants to install concurrently (default: CPU count)",
+    ),
+    keep: Optional[Path] = typer.Option(
+        None,
+        "--keep",
+        help="Install into this directory and keep it for inspection",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output the report as JSON",
+    ),
+) -> None:
+    """Install every variant and run its bundled check-prerequisites script.
+
+    Each variant is extracted into its own directory (on /dev/shm when
+    available) and checked for one command file per template in the
+    agent's command directory. The bundled check-prerequisites script is
+    then run with --json --paths-only and must resolve REPO_ROOT to the
+    install. PowerShell variants are only run when pwsh is installed.
+    """
+
+    try:
+        if path is None:
+            if not source.is_dir():
+                console.print(f"[red]Error: Source directory {source} not found[/red]")
+                raise typer.Exit(1)
+            variants = source_variants(source, agents=_split_list(agents), scripts=_split_list(scripts))
+        else:
+            variants = archive_variants(find_archives(path), agents=_split_list(agents), scripts=_split_list(scripts))
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    if not variants:
+        console.print(f"[yellow]⚠[/yellow] No template variants to test in {path}")
+        raise typer.Exit(1)
+
+    started = time.perf_counter()
+    results = smoke_test(variants, jobs=jobs, work_dir=keep)
+    elapsed = time.perf_counter() - started
+    failed = [result for result in results if not result["passed"]]
+    skipped = [result for result in results if result["skipped"]]
+
+    if json_output:
+        report = {
+            "total": len(results),
+            "passed": len(results) - len(failed),
+            "failed": len(failed),
+            "skipped": len(skipped),
+            "seconds": round(elapsed, 3),
+            "variants": results,
+        }
+        print(json.dumps(report, indent=2))
+    else:
+        table = Table(title="Smoke test")
+        table.add_column("Variant", style="cyan")
+        table.add_column("Result")
+        table.add_column("Files", justify="right")
+        table.add_column("Extract ms", justify="right")
+        table.add_column("Script ms", justify="right")
+        table.add_column("Total ms", justify="right")
+        for result in results:
+            if not result["passed"]:
+                status = "[red]failed[/red]"
+            elif result["skipped"]:
+                status = "[yellow]script skipped[/yellow]"
+            else:
+                status = "[green]passed[/green]"
+            timings = result["timings"]
+            table.add_row(
+                f"{result['agent']}-{result['script']}",
+                status,
+                str(result["files"]),
+                f"{timings.get('extract_ms', 0):.0f}",
+                f"{timings['script_ms']:.0f}" if "script_ms" in timings else "-",
+                f"{timings['total_ms']:.0f}",
+            )
+        console.print(table)
+
+        for result in failed:
+            console.print(f"[red]✗[/red] {result['agent']}-{result['script']}")
+            for failure in result["failures"]:
+                console.print(f"    [red]✗[/red] {failure}")
+        for reason in sorted({result["skipped"] for result in skipped}):
+            count = sum(result["skipped"] == reason for result in skipped)
+            console.print(f"[yellow]⚠[/yellow] Scripts not run for {count} variant(s): {reason}")
+        if keep is not None:
+            console.print(f"[dim]Installs kept in {keep}/[/dim]")
+
+        if failed:
+            console.print(f"[red]✗[/red] {len(failed)} of {len(results)} variant(s) failed the smoke test")
+        else:
+            console.print(
+                f"[green]✓[/green] All {len(results)} variant(s) passed the smoke test in {elapsed * 1000:.0f} ms"
+            )
+
+    if failed:
+        raise typer.Exit(1)
+
+
+@release_app.command("diff")
+def diff_command(
+    old_dir: Path = typer.Argument(
+        ...,
+        help="Directory with the previous release's archives",
+    ),
+    new_dir: Path = typer.Argument(
+        ...,
+        help="Directory with the new release's archives",
+    ),
+    output: Path = typer.Option(
+        Path(".gendeltas"),
+        "--output",
+        "-o",
+        help="Directory to write delta packages to",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output the report as JSON",
+    ),
+) -> None:
+    """Write delta packages with only the entries that changed between releases."""
+
+    for directory in (old_dir, new_dir):
+        if not directory.is_dir():
+            console.print(f"[red]Error: {directory} is not a directory[/red]")
+            raise typer.Exit(1)
+
+    report = diff_releases(old_dir, new_dir, output)
+
+    if json_output:
+        print(json.dumps(report, indent=2))
+        return
+
+    table = Table(title=f"Deltas {old_dir} → {new_dir}")
+    table.add_column("Delta package", style="cyan")
+    table.add_column("Changed", justify="right")
+    table.add_column("Removed", justify="right")
+    table.add_column("Size", justify="right")
+    table.add_column("Full archive", justify="right", style="dim")
+    for delta in report["deltas"]:
+        table.add_row(
+            Path(delta["path"]).name,
+            str(delta["changed"]),
+            str(delta["removed"]),
+            f"{delta['size']:,}",
+            f"{delta['full_size']:,}",
+        )
+    console.print(table)
+
+    console.print(
+        f"[green]✓[/green] {len(report['deltas'])} delta package(s), "
+        f"{len(report['unchanged'])} unchanged variant(s) → {output}/"
+    )
+    for name in report["added"]:
+        console.print(f"[yellow]⚠[/yellow] New variant without a previous release: {name}")
+    for name in report["dropped"]:
+        console.print(f"[yellow]⚠[/yellow] Variant dropped from the new release: {name}")
+
+
+@release_app.command("apply")
+def apply_command(
+    delta: Path = typer.Argument(
+        ...,
+        help="Delta package written by `twitterify release diff`",
+    ),
+    project: Path = typer.Argument(
+        Path("."),
+        help="Project directory to patch",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Overwrite files that were modified locally",
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="Show what would change without modifying files",
+    ),
+) -> None:
+    """Patch an installed project in place from a delta package."""
+
+    if not delta.is_file():
+        console.print(f"[red]Error: {delta} not found[/red]")
+        raise typer.Exit(1)
+
+    try:
+        result = apply_delta(delta, project, force=force, dry_run=dry_run)
+    except (ValueError, zipfile.BadZipFile) as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    prefix = "Would update" if dry_run else "Updated"
+    for name in result["updated"]:
+        console.print(f"[green]✓[/green] {prefix} {name}")
+    for name in result["removed"]:
+        console.print(f"[green]✓[/green] {'Would remove' if dry_run else 'Removed'} {name}")
+    for name in result["conflicts"]:
+        console.print(f"[yellow]⚠[/yellow] Skipped locally modified {name} (use --force to overwrite)")
+
+    console.print(
+        f"{len(result['updated'])} updated, {len(result['removed'])} removed, "
+        f"{len(result['skipped'])} already current, {len(result['conflicts'])} conflict(s)"
+    )
+    if result["conflicts"]:
+        raise typer.Exit(1)
@@ -0,0 +1,66 @@
+"""Twitter-Init-Kit Serve Command - Per-Repository Query Daemon"""
+
+from pathlib import Path
+
+import typer
+from rich.console import Console
+
+from ..daemon import DEFAULT_IDLE_TIMEOUT, DaemonError, DaemonUnavailable, request, serve
+from ..workspace import repo_root
+
+console = Console()
+
+
+def serve_command(
+    idle_timeout: float = typer.Option(
+        DEFAULT_IDLE_TIMEOUT,
+        "--idle-timeout",
+        help="Exit after this many seconds without a request (0: never)",
+    ),
+    status: bool = typer.Option(
+        False,
+        "--status",
+        help="Report whether a daemon is running for this repository",
+    ),
+    stop: bool = typer.Option(
+        False,
+        "--stop",
+        help="Stop the daemon running for this repository",
+    ),
+) -> None:
+    """Run a daemon answering paths, prereqs, render and campaign-number queries.
+
+    The daemon listens on .twitterkit/state/daemon.sock and speaks JSON
+    lines: {"method": "prereqs", "params": {"json": true}} in, {"result": ...}
+    out. It keeps the specs index, resolved git directory and rendered
+    command templates warm. `twitterify paths` and `twitterify prereqs` use
+    it when it runs and work in-process otherwise.
+    """
+
+    root = repo_root(Path.cwd())
+
+    if status or stop:
+        try:
+            info = request(root, "shutdown" if stop else "ping")
+        except DaemonUnavailable:
+            console.print(f"[yellow]No daemon running for {root}[/yellow]")
+            raise typer.Exit(1)
+        if stop:
+            console.print(f"[green]✓[/green] Stopped daemon for {root}")
+        else:
+            console.print(
+                f"[green]✓[/green] Daemon for {info['root']} (pid {info['pid']}), "
+                f"up {info['uptime']:.0f}s, {info['requests']} request(s)"
+            )
+        return
+
+    def ready(path: Path) -> None:
+        console.print(f"[green]✓[/green] Serving {root} on {path}")
+
+    try:
+        serve(root, idle_timeout=idle_timeout or None, on_ready=ready)
+    except DaemonError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,178 @@
+"""Twitter-Init-Kit Status Command - Fleet Git Status"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from ..git_utils import GitUtils
+
+console = Console()
+
+# Directories never worth descending into while looking for projects
+SKIP_DIRS = {"node_modules", "__pycache__", "venv", "dist", "build"}
+
+
+def status_command(
+    root: Path = typer.Argument(
+        Path("."),
+        help="Directory containing twitterify-initialized projects",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output results as JSON",
+    ),
+    max_depth: int = typer.Option(
+        3,
+        "--max-depth",
+        help="Maximum directory depth to search for projects",
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Number of repositories to query concurrently (default: all)",
+    ),
+    debug: bool = typer.Option(
+        False,
+        "--debug",
+        help="Enable debug output",
+    ),
+) -> None:
+    """Show git branch and status for every twitterkit project under ROOT."""
+
+    root = root.resolve()
+    if not root.is_dir():
+        console.print(f"[red]Error: {root} is not a directory[/red]")
+        raise typer.Exit(1)
+
+    projects = discover_projects(root, max_depth)
+
+    if debug:
+        console.print(f"[dim]Found {len(projects)} project(s) under {root}[/dim]")
+
+    results = collect_status(projects, jobs=jobs, debug=debug)
+
+    if json_output:
+        for result in results:
+            result["path"] = _relative(result["path"], root)
+        print(json.dumps(results, indent=2))
+        return
+
+    if not results:
+        console.print(f"[yellow]No twitterkit projects found under {root}[/yellow]")
+        return
+
+    table = Table(title=f"Twitterkit Projects ({len(results)})")
+    table.add_column("Project", style="cyan")
+    table.add_column("Branch", style="white")
+    table.add_column("Changes", justify="right")
+    table.add_column("Status", style="white")
+
+    for result in results:
+        if result["error"]:
+            status = f"[red]✗ {result['error']}[/red]"
+            changes = "-"
+        elif result["clean"]:
+            status = "[green]✓ Clean[/green]"
+            changes = "0"
+        else:
+            status = "[yellow]● Modified[/yellow]"
+            changes = str(len(result["changes"]))
+        table.add_row(_relative(result["path"], root), result["branch"] or "-", changes, status)
+
+    console.print(table)
+
+    dirty = sum(1 for result in results if not result["clean"] and not result["error"])
+    if dirty:
+        console.print(f"\n[yellow]{dirty} project(s) with uncommitted changes[/yellow]")
+
+
+def discover_projects(root: Path, max_depth: int = 3) -> List[Path]:
+    """Find directories containing a .twitterkit/ package.
+
+    Args:
+        root: Directory to search
+        max_depth: Maximum depth below root to descend
+
+    Returns:
+        Sorted list of project directories
+    """
+    projects = []
+    pending = [(root, 0)]
+
+    while pending:
+        directory, depth = pending.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+
+        if any(entry.name == ".twitterkit" and entry.is_dir() for entry in entries):
+            projects.append(directory)
+            continue
+
+        if depth >= max_depth:
+            continue
+
+        for entry in entries:
+            if entry.name.startswith(".") or entry.name in SKIP_DIRS:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                pending.append((Path(entry.path), depth + 1))
+
+    return sorted(projects)
+
+
+def collect_status(
+    projects: List[Path],
+    jobs: Optional[int] = None,
+    debug: bool = False,
+) -> List[Dict]:
+    """Query branch and short status for each project concurrently.
+
+    Args:
+        projects: Project directories to query
+        jobs: Maximum number of concurrent queries (default: one per project)
+        debug: Enable debug output
+
+    Returns:
+        List of result dictionaries in the same order as projects
+    """
+    if not projects:
+        return []
+
+    git_utils = GitUtils(debug=debug)
+
+    def query(project: Path) -> Dict:
+        status, error = git_utils.status_or_error(project)
+        if status is None:
+            return {"path": str(project), "branch": None, "clean": False, "changes": [], "error": error}
+
+        changes = [line for line in status.splitlines() if line.strip()]
+        return {
+            "path": str(project),
+            "branch": git_utils.get_current_branch(project),
+            "clean": not changes,
+            "changes": changes,
+            "error": None,
+        }
+
+    workers = max(1, min(jobs or len(projects), len(projects)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(query, projects))
+
+
+def _relative(path: str, root: Path) -> str:
+    """Render a project path relative to the search root."""
+    try:
+        relative = Path(path).relative_to(root)
+    except ValueError:
+        return path
+    return str(relative) if str(relative) != "." else root.name
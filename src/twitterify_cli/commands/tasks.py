@@ -0,0 +1,94 @@
+"""Twitter-Init-Kit Tasks Command - Task Execution Planning"""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from ..artifacts import ArtifactCache
+from ..scheduler import DEFAULT_WORKERS, TaskPlanError, plan_tasks
+from ..workspace import feature_paths
+
+console = Console()
+
+tasks_app = typer.Typer(
+    help="Plan and inspect campaign tasks",
+    no_args_is_help=True,
+)
+
+
+@tasks_app.command("plan")
+def plan_command(
+    workers: int = typer.Option(
+        DEFAULT_WORKERS,
+        "--workers",
+        "-n",
+        min=0,
+        help="Agents working at once (0: unlimited)",
+    ),
+    feature: Optional[str] = typer.Option(
+        None,
+        "--feature",
+        help="Feature directory in specs/ (default: the current branch's)",
+    ),
+    include_done: bool = typer.Option(
+        False,
+        "--include-done",
+        help="Also schedule tasks that are already checked off",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output in JSON format",
+    ),
+) -> None:
+    """Compute a parallel execution plan for the feature's tasks.md.
+
+    Tasks form a DAG: phases run in order, tasks without [P] run in order
+    within their section, and "depends on T001" references add edges.
+    Reports the critical path and, for N workers, the tasks each worker
+    starts at every step, so /twitterkit.implement can be dispatched to
+    several agents at once.
+    """
+
+    paths = feature_paths(Path.cwd(), feature=feature)
+    with ArtifactCache(Path(paths["REPO_ROOT"])) as cache:
+        try:
+            artifact = cache.load(Path(paths["TASKS"]))
+        except FileNotFoundError:
+            console.print(f"[red]Error: tasks.md not found in {paths['FEATURE_DIR']}[/red]")
+            console.print("Run /twitterkit.tasks first to create the task list.")
+            raise typer.Exit(1)
+
+    try:
+        plan = plan_tasks(artifact, workers=workers, include_done=include_done)
+    except TaskPlanError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    plan = {"feature": Path(paths["FEATURE_DIR"]).name, **plan}
+
+    if json_output:
+        print(json.dumps(plan, indent=2, ensure_ascii=False))
+        return
+
+    for warning in plan["warnings"]:
+        console.print(f"[yellow]Warning: {warning}[/yellow]")
+    critical = plan["critical_path"]
+    console.print(
+        f"[bold]{plan['feature']}[/bold]: {len(plan['tasks'])} tasks, {plan['makespan']} steps "
+        f"with {workers or 'unlimited'} workers, critical path {critical['length']} tasks"
+    )
+    if critical["tasks"]:
+        console.print(f"Critical path: {' → '.join(critical['tasks'])}")
+
+    table = Table()
+    table.add_column("Step", justify="right", style="cyan")
+    for lane in plan["lanes"]:
+        table.add_column(f"Worker {lane['worker']}")
+    on_path = set(critical["tasks"])
+    for number, step in enumerate(plan["steps"], 1):
+        table.add_row(str(number), *[f"[bold]{task}[/bold]" if task in on_path else task for task in step])
+    console.print(table)
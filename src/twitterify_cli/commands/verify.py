@@ -0,0 +1,73 @@
+"""Twitter-Init-Kit Verify Command - Archive Checksum Verification"""
+
+import json
+import time
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+
+from ..checksums import verify_directory
+
+console = Console()
+
+ISSUE_LABELS = {
+    "missing": "listed but not found",
+    "unlisted": "not listed",
+    "sha256": "SHA-256 mismatch",
+    "size": "size mismatch",
+}
+
+
+def verify_command(
+    directory: Path = typer.Argument(
+        Path("dist/templates"),
+        help="Directory containing template archives and CHECKSUMS.sha256",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output results as JSON",
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Number of archives to hash concurrently",
+    ),
+) -> None:
+    """Verify archives against CHECKSUMS.sha256 and build-manifest.json."""
+
+    if not directory.is_dir():
+        console.print(f"[red]Error: {directory} is not a directory[/red]")
+        raise typer.Exit(1)
+
+    started = time.perf_counter()
+    try:
+        report = verify_directory(directory, jobs=jobs)
+    except (ValueError, KeyError) as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    elapsed = time.perf_counter() - started
+
+    if json_output:
+        print(json.dumps(report, indent=2))
+    else:
+        console.print(f"[dim]Checked against: {', '.join(report['sources'])}[/dim]")
+        for problem in report["problems"]:
+            console.print(f"[red]✗[/red] {problem['file']}: {ISSUE_LABELS[problem['issue']]} ({problem['source']})")
+            if "expected" in problem:
+                console.print(f"    expected {problem['expected']}")
+                console.print(f"    actual   {problem['actual']}")
+
+        if report["problems"]:
+            failed = len({problem["file"] for problem in report["problems"]})
+            console.print(f"\n[red]✗[/red] {failed} file(s) failed verification, {len(report['verified'])} OK")
+        else:
+            console.print(
+                f"[green]✓[/green] {len(report['verified'])} archive(s) verified in {elapsed * 1000:.0f} ms"
+            )
+
+    if report["problems"]:
+        raise typer.Exit(1)
@@ -0,0 +1,61 @@
+"""Twitter-Init-Kit Watch Command - Incremental Updates on File Changes"""
+
+import time
+from pathlib import Path
+
+import typer
+from rich.console import Console
+
+from ..watch import DEFAULT_DEBOUNCE, DEFAULT_POLL_INTERVAL, watch
+from ..workspace import repo_root
+
+console = Console()
+
+
+def watch_command(
+    debounce: float = typer.Option(
+        DEFAULT_DEBOUNCE,
+        "--debounce",
+        help="Seconds of quiet that end a batch of changes",
+    ),
+    poll: bool = typer.Option(
+        False,
+        "--poll",
+        help="Poll for changes instead of using inotify",
+    ),
+    interval: float = typer.Option(
+        DEFAULT_POLL_INTERVAL,
+        "--interval",
+        help="Seconds between polls",
+    ),
+) -> None:
+    """Keep the specs index, agent commands and agent context up to date.
+
+    Watches specs/, .twitterkit/templates/ and .twitterkit/memory/ (inotify
+    on Linux, polling elsewhere or with --poll). Each debounced batch of
+    changes updates only what it affects: touched feature directories are
+    re-indexed, changed command templates are installed for the installed
+    agents (command files edited locally are skipped), and memory or
+    plan.md changes update the agents' context files.
+    """
+
+    root = repo_root(Path.cwd())
+
+    def ready(backend: str) -> None:
+        console.print(f"[green]✓[/green] Watching {root} ({backend}); press Ctrl+C to stop")
+
+    def report(result) -> None:
+        stamp = time.strftime("%H:%M:%S")
+        if result["features"]:
+            console.print(f"[dim]{stamp}[/dim] Indexed {', '.join(result['features'])}")
+        for path in result["commands"]:
+            console.print(f"[dim]{stamp}[/dim] Installed {path}")
+        for path in result["conflicts"]:
+            console.print(f"[dim]{stamp}[/dim] [yellow]Skipped {path} (edited locally)[/yellow]")
+        for path in result["contexts"]:
+            console.print(f"[dim]{stamp}[/dim] Updated context {path}")
+
+    try:
+        watch(root, report, debounce=debounce, polling=poll, interval=interval, on_ready=ready)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,322 @@
+"""Twitter-Init-Kit Daemon - Warm Per-Repository Query Server"""
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .campaigns import highest_number
+from .client import CLIENT_TIMEOUT, PROTOCOL_VERSION, DaemonError, DaemonUnavailable, request, socket_path
+from .commands.init import AGENT_CONFIG
+from .packager import SCRIPT_DIRS, render_commands
+from .prerequisites import check_prerequisites
+from .workspace import STATE_DIR, SpecsIndex, ensure_state_dir, feature_paths, find_git_dir, repo_root
+
+DEFAULT_IDLE_TIMEOUT = 30 * 60
+
+# Seconds between checks for shutdown and idle timeout
+POLL_INTERVAL = 0.5
+
+COMMAND_TEMPLATES = Path(".twitterkit") / "templates" / "commands"
+
+
+class WorkspaceState:
+    """Warm state for one repository, answering protocol methods.
+
+    Keeps the specs index open, the git directory resolved and rendered
+    command templates cached. HEAD itself is re-read for every query (one
+    small file read) so branch switches are seen immediately.
+    """
+
+    def __init__(self, root: Path):
+        """Open the repository's state.
+
+        Args:
+            root: Project root
+        """
+        self.root = root
+        self.is_git = find_git_dir(root) is not None
+        self.index = SpecsIndex(root)
+        self._templates: Optional[Tuple[Tuple[Any, ...], Dict[str, Tuple[bytes, bool]]]] = None
+        self._rendered: Dict[Tuple[str, str, bool], Dict[str, str]] = {}
+        self.started = time.time()
+        self.requests = 0
+        self.methods: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "ping": self.ping,
+            "paths": self.paths,
+            "features": self.features,
+            "prereqs": self.prereqs,
+            "render": self.render,
+            "campaign_number": self.campaign_number,
+        }
+
+    def close(self) -> None:
+        """Close the specs index."""
+        self.index.close()
+
+    def __enter__(self) -> "WorkspaceState":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def handle(self, method: str, params: Dict[str, Any]) -> Any:
+        """Answer one query.
+
+        Args:
+            method: Protocol method name
+            params: Method parameters
+
+        Returns:
+            JSON-serializable result
+
+        Raises:
+            DaemonError: If the method is unknown or its parameters are invalid
+        """
+        handler = self.methods.get(method)
+        if handler is None:
+            raise DaemonError(f"Unknown method: {method}")
+        self.requests += 1
+        return handler(params)
+
+    def ping(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Daemon identity and counters."""
+        return {
+            "pid": os.getpid(),
+            "root": str(self.root),
+            "protocol": PROTOCOL_VERSION,
+            "uptime": round(time.time() - self.started, 3),
+            "requests": self.requests,
+        }
+
+    def paths(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """feature_paths() for the client's TWITTERKIT_FEATURE."""
+        return feature_paths(self.root, index=self.index, feature=params.get("feature", ""))
+
+    def features(self, params: Dict[str, Any]) -> Any:
+        """Every feature directory with its documents."""
+        self.index.refresh()
+        return self.index.features()
+
+    def prereqs(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """check_prerequisites() output: exit_code, stdout and stderr."""
+        result = check_prerequisites(
+            self.root,
+            json_mode=bool(params.get("json")),
+            require_tasks=bool(params.get("require_tasks")),
+            include_tasks=bool(params.get("include_tasks")),
+            paths_only=bool(params.get("paths_only")),
+            index=self.index,
+            feature=params.get("feature", ""),
+        )
+        return result._asdict()
+
+    def render(self, params: Dict[str, Any]) -> Dict[str, str]:
+        """The project's command templates rendered for an agent and script type."""
+        agent = params.get("agent")
+        script = params.get("script", "sh")
+        if agent not in AGENT_CONFIG:
+            raise DaemonError(f"Unknown agent: {agent}")
+        if script not in SCRIPT_DIRS:
+            raise DaemonError(f"Unknown script type: {script}")
+
+        source = self._command_templates()
+        key = (agent, script, bool(params.get("python_prereqs")))
+        if key not in self._rendered:
+            commands = render_commands(source, agent, script, python_prereqs=key[2])
+            self._rendered[key] = {path: content.decode("utf-8") for path, content in commands.items()}
+        return self._rendered[key]
+
+    def _command_templates(self) -> Dict[str, Tuple[bytes, bool]]:
+        """Command templates as a packager source, re-read when any of them changed."""
+        directory = self.root / COMMAND_TEMPLATES
+        entries = []
+        try:
+            with os.scandir(directory) as scan:
+                for entry in scan:
+                    if entry.name.endswith(".md") and entry.is_file():
+                        info = entry.stat()
+                        entries.append((entry.name, info.st_mtime_ns, info.st_size))
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        signature = tuple(sorted(entries))
+
+        if self._templates is None or self._templates[0] != signature:
+            source = {
+                f"templates/commands/{name}": ((directory / name).read_bytes(), False) for name, _, _ in signature
+            }
+            self._templates = (signature, source)
+            self._rendered.clear()
+        return self._templates[1]
+
+    def campaign_number(self, params: Dict[str, Any]) -> Dict[str, int]:
+        """Highest campaign number in use and the next one to be handed out."""
+        highest = highest_number(self.root, git=self.is_git)
+        return {"highest": highest, "next": highest + 1}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """One client connection: JSON-lines requests in, JSON-lines responses out."""
+
+    timeout = CLIENT_TIMEOUT
+
+    def handle(self) -> None:
+        server: "DaemonServer" = self.server  # type: ignore[assignment]
+        try:
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                response = server.respond(line)
+                self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+                self.wfile.flush()
+        except (socket.timeout, ConnectionError):
+            pass
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server sharing one WorkspaceState between connections."""
+
+    daemon_threads = True
+
+    def __init__(self, path: Path, state: WorkspaceState):
+        """Bind the socket (readable by the owner only).
+
+        Args:
+            path: Socket path
+            state: Repository state answering queries
+        """
+        self.state = state
+        self.lock = threading.Lock()
+        self.last_activity = time.monotonic()
+        self.stopping = False
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(str(path), _Handler)
+        finally:
+            os.umask(old_umask)
+
+    def respond(self, line: bytes) -> Dict[str, Any]:
+        """Answer one request line.
+
+        Args:
+            line: JSON object with "method", optional "params", "id" and
+                "protocol"
+
+        Returns:
+            {"id", "result"} or {"id", "error"}
+        """
+        self.last_activity = time.monotonic()
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+        except ValueError as e:
+            return {"id": None, "error": f"Invalid request: {e}"}
+
+        response: Dict[str, Any] = {"id": request.get("id")}
+        if request.get("protocol", PROTOCOL_VERSION) != PROTOCOL_VERSION:
+            response["error"] = f"Unsupported protocol version: {request.get('protocol')}"
+            return response
+        method = request.get("method")
+        if method == "shutdown":
+            self.stopping = True
+            response["result"] = {"stopping": True}
+            return response
+
+        params = request.get("params") or {}
+        try:
+            with self.lock:
+                response["result"] = self.state.handle(method, params)
+        except (DaemonError, OSError, ValueError) as e:
+            response["error"] = str(e)
+        return response
+
+
+def _listening(path: Path) -> bool:
+    """Whether a daemon accepts connections on path."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CLIENT_TIMEOUT)
+            sock.connect(str(path))
+        return True
+    except OSError:
+        return False
+
+
+def serve(
+    root: Path,
+    idle_timeout: Optional[float] = DEFAULT_IDLE_TIMEOUT,
+    on_ready: Optional[Callable[[Path], None]] = None,
+) -> None:
+    """Run the repository's daemon until shut down or idle.
+
+    Args:
+        root: Project root
+        idle_timeout: Exit after this many seconds without a request (None: never)
+        on_ready: Called with the socket path once it accepts connections
+
+    Raises:
+        DaemonError: If Unix sockets are unsupported or a daemon already runs
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise DaemonError("Unix domain sockets are not supported on this platform")
+
+    path = socket_path(root)
+    if path.parent == root / STATE_DIR:
+        ensure_state_dir(root)
+    if path.exists() or path.is_symlink():
+        if _listening(path):
+            raise DaemonError(f"A daemon is already running on {path}")
+        if not stat.S_ISSOCK(path.lstat().st_mode):
+            raise DaemonError(f"{path} exists and is not a socket")
+        path.unlink()  # left behind by a daemon that was killed
+
+    with WorkspaceState(root) as state:
+        server = DaemonServer(path, state)
+        server.timeout = POLL_INTERVAL
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda signum, frame: setattr(server, "stopping", True))
+        try:
+            if on_ready:
+                on_ready(path)
+            while not server.stopping:
+                server.handle_request()
+                if idle_timeout is not None and time.monotonic() - server.last_activity > idle_timeout:
+                    break
+        finally:
+            server.server_close()
+            path.unlink(missing_ok=True)
+
+
+def query(start: Path, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
+    """Answer a query through the daemon, or in-process when none runs.
+
+    The client's TWITTERKIT_FEATURE is passed along, since the daemon's
+    own environment may differ.
+
+    Args:
+        start: Directory inside the project
+        method: Protocol method
+        params: Method parameters
+
+    Returns:
+        The method's result
+
+    Raises:
+        DaemonError: If the query itself is invalid
+    """
+    root = repo_root(start)
+    params = {"feature": os.environ.get("TWITTERKIT_FEATURE", ""), **(params or {})}
+    try:
+        return request(root, method, params)
+    except DaemonUnavailable:
+        pass
+    with WorkspaceState(root) as state:
+        return state.handle(method, params)
+
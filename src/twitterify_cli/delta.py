@@ -0,0 +1,302 @@
+"""Twitter-Init-Kit Delta Packages - Incremental Template Updates"""
+
+import json
+import os
+import re
+import stat
+import zipfile
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DELTA_FORMAT = 1
+DELTA_MANIFEST = "delta.json"
+DELTA_PREFIX = "twitter-kit-delta"
+
+# <prefix>-template-<agent>-<script>-<version>.zip; agents may contain "-"
+ARCHIVE_PATTERN = re.compile(r"^(?P<prefix>.+-template)-(?P<agent>.+)-(?P<script>sh|ps)-(?P<version>v[^-]\S*)\.zip$")
+
+# Separators between the numeric and text parts of a version
+VERSION_SEPARATORS = re.compile(r"[.+-]")
+
+# Archive path -> (CRC-32, uncompressed size)
+ArchiveIndex = Dict[str, Tuple[int, int]]
+
+
+def parse_archive_name(name: str) -> Optional[Tuple[str, str, str]]:
+    """Split a template archive name into its parts.
+
+    Args:
+        name: Archive file name (e.g., twitter-kit-template-claude-sh-v0.1.0.zip)
+
+    Returns:
+        (agent, script, version), or None if the name doesn't match
+    """
+    match = ARCHIVE_PATTERN.match(name)
+    if not match:
+        return None
+    return match.group("agent"), match.group("script"), match.group("version")
+
+
+def version_key(version: str) -> Tuple[Tuple[int, int, str], ...]:
+    """Sort key comparing versions part by part, numbers numerically.
+
+    Args:
+        version: Version such as v0.10.0
+
+    Returns:
+        Key under which v0.9.0 < v0.10.0
+    """
+    return tuple(
+        (0, int(part), "") if part.isdigit() else (1, 0, part)
+        for part in VERSION_SEPARATORS.split(version.removeprefix("v"))
+    )
+
+
+def archive_index(path: Path) -> ArchiveIndex:
+    """Read an archive's central directory without extracting anything.
+
+    Args:
+        path: Template ZIP
+
+    Returns:
+        Mapping of file path -> (CRC-32, size); directory entries are omitted
+    """
+    with zipfile.ZipFile(path) as archive:
+        return {info.filename: (info.CRC, info.file_size) for info in archive.infolist() if not info.is_dir()}
+
+
+def diff_indexes(old: ArchiveIndex, new: ArchiveIndex) -> Dict[str, List[str]]:
+    """Compare two archive indexes entry by entry.
+
+    Args:
+        old: Index of the installed (older) archive
+        new: Index of the newer archive
+
+    Returns:
+        Sorted "changed" (added or modified) and "removed" paths
+    """
+    return {
+        "changed": sorted(name for name, entry in new.items() if old.get(name) != entry),
+        "removed": sorted(name for name in old if name not in new),
+    }
+
+
+def _releases(directory: Path) -> Dict[Tuple[str, str], Tuple[Path, str]]:
+    """Map (agent, script) -> (archive path, version) for a release directory.
+
+    When a directory holds several versions of a variant, the highest
+    version (by version_key) is used.
+    """
+    releases: Dict[Tuple[str, str], Tuple[Path, str]] = {}
+    for path in sorted(directory.glob("*.zip")):
+        parsed = parse_archive_name(path.name)
+        if parsed:
+            agent, script, version = parsed
+            current = releases.get((agent, script))
+            if current is None or version_key(version) > version_key(current[1]):
+                releases[(agent, script)] = (path, version)
+    return releases
+
+
+def delta_name(agent: str, script: str, old_version: str, new_version: str) -> str:
+    """Return the file name of a delta package.
+
+    Args:
+        agent: Agent key
+        script: Script type (sh or ps)
+        old_version: Version the delta applies to
+        new_version: Version the delta upgrades to
+
+    Returns:
+        File name such as twitter-kit-delta-claude-sh-v0.1.0-to-v0.2.0.zip
+    """
+    return f"{DELTA_PREFIX}-{agent}-{script}-{old_version}-to-{new_version}.zip"
+
+
+def write_delta(old_path: Path, new_path: Path, output_dir: Path) -> Optional[Dict[str, Any]]:
+    """Write a delta package holding only the entries that changed.
+
+    The package contains the changed files from the new archive plus a
+    delta.json listing changed and removed paths, with the CRC each path
+    had in the old and new release so the applier can detect local edits.
+
+    Args:
+        old_path: Older variant archive
+        new_path: Newer variant archive of the same agent and script
+        output_dir: Directory to write the delta package to
+
+    Returns:
+        Summary of the delta, or None if the archives have identical content
+    """
+    old_index = archive_index(old_path)
+    new_index = archive_index(new_path)
+    diff = diff_indexes(old_index, new_index)
+    if not diff["changed"] and not diff["removed"]:
+        return None
+
+    agent, script, old_version = parse_archive_name(old_path.name)
+    new_version = parse_archive_name(new_path.name)[2]
+    manifest = {
+        "format": DELTA_FORMAT,
+        "agent": agent,
+        "script": script,
+        "from": old_version,
+        "to": new_version,
+        "changed": {
+            name: {"old_crc": old_index[name][0] if name in old_index else None, "crc": new_index[name][0]}
+            for name in diff["changed"]
+        },
+        "removed": {name: {"old_crc": old_index[name][0]} for name in diff["removed"]},
+    }
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / delta_name(agent, script, old_version, new_version)
+    with zipfile.ZipFile(new_path) as source, zipfile.ZipFile(path, "w") as delta:
+        for name in diff["changed"]:
+            original = source.getinfo(name)
+            info = zipfile.ZipInfo(name, original.date_time)
+            info.external_attr = original.external_attr
+            info.create_system = original.create_system
+            info.compress_type = zipfile.ZIP_DEFLATED
+            delta.writestr(info, source.read(original))
+        info = zipfile.ZipInfo(DELTA_MANIFEST)
+        info.compress_type = zipfile.ZIP_DEFLATED
+        delta.writestr(info, json.dumps(manifest, indent=2, sort_keys=True))
+
+    return {
+        "agent": agent,
+        "script": script,
+        "path": str(path),
+        "changed": len(diff["changed"]),
+        "removed": len(diff["removed"]),
+        "size": path.stat().st_size,
+        "full_size": new_path.stat().st_size,
+    }
+
+
+def diff_releases(old_dir: Path, new_dir: Path, output_dir: Path) -> Dict[str, Any]:
+    """Write delta packages for every variant present in both releases.
+
+    Args:
+        old_dir: Directory with the older release archives
+        new_dir: Directory with the newer release archives
+        output_dir: Directory to write delta packages to
+
+    Returns:
+        Report with per-variant deltas, unchanged variants, and variants
+        only present in one release (which need a full download)
+    """
+    old = _releases(old_dir)
+    new = _releases(new_dir)
+
+    report: Dict[str, Any] = {"deltas": [], "unchanged": [], "added": [], "dropped": []}
+    for key in sorted(new):
+        if key not in old:
+            report["added"].append(new[key][0].name)
+            continue
+        delta = write_delta(old[key][0], new[key][0], output_dir)
+        if delta:
+            report["deltas"].append(delta)
+        else:
+            report["unchanged"].append(new[key][0].name)
+    report["dropped"] = sorted(old[key][0].name for key in old if key not in new)
+    return report
+
+
+def _file_crc(path: Path) -> Optional[int]:
+    """CRC-32 of a file, or None if it doesn't exist."""
+    try:
+        return zlib.crc32(path.read_bytes())
+    except FileNotFoundError:
+        return None
+
+
+def apply_delta(
+    delta_path: Path,
+    project_dir: Path,
+    force: bool = False,
+    dry_run: bool = False,
+) -> Dict[str, List[str]]:
+    """Patch an installed project in place from a delta package.
+
+    A file is only replaced or removed when it still matches the old
+    release (or is absent); files the user has edited are reported as
+    conflicts and left alone unless force is set. Files already matching
+    the new release are skipped.
+
+    Args:
+        delta_path: Delta package written by write_delta
+        project_dir: Project root containing .twitterkit/
+        force: Overwrite or remove locally modified files
+        dry_run: Report what would change without touching files
+
+    Returns:
+        Lists of "updated", "removed", "skipped" and "conflicts" paths
+
+    Raises:
+        ValueError: If the package is not a delta package, a path escapes
+            the project directory or a changed file is missing from the
+            package; nothing is written or removed in that case
+    """
+    result: Dict[str, List[str]] = {"updated": [], "removed": [], "skipped": [], "conflicts": []}
+    root = project_dir.resolve()
+
+    with zipfile.ZipFile(delta_path) as delta:
+        try:
+            manifest = json.loads(delta.read(DELTA_MANIFEST))
+        except KeyError:
+            raise ValueError(f"{delta_path.name} has no {DELTA_MANIFEST}; not a delta package")
+        if manifest.get("format") != DELTA_FORMAT:
+            raise ValueError(f"Unsupported delta format: {manifest.get('format')}")
+
+        # Check every path before touching anything, so a bad package is
+        # refused without leaving the project partly patched
+        targets: Dict[str, Path] = {}
+        for name in [*manifest["changed"], *manifest["removed"]]:
+            target = (root / name).resolve()
+            if not target.is_relative_to(root):
+                raise ValueError(f"Refusing to write outside the project: {name}")
+            targets[name] = target
+        members = set(delta.namelist())
+        for name in manifest["changed"]:
+            if name not in members:
+                raise ValueError(f"{delta_path.name} is missing changed file {name}")
+
+        for name, entry in sorted(manifest["changed"].items()):
+            target = targets[name]
+            current = _file_crc(target)
+            if current == entry["crc"]:
+                result["skipped"].append(name)
+                continue
+            if current is not None and current != entry["old_crc"] and not force:
+                result["conflicts"].append(name)
+                continue
+
+            result["updated"].append(name)
+            if dry_run:
+                continue
+            info = delta.getinfo(name)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = target.with_name(f".{target.name}.tmp")
+            tmp_path.write_bytes(delta.read(info))
+            mode = stat.S_IMODE(info.external_attr >> 16)
+            if mode:
+                tmp_path.chmod(mode)
+            os.replace(tmp_path, target)
+
+        for name, entry in sorted(manifest["removed"].items()):
+            target = targets[name]
+            current = _file_crc(target)
+            if current is None:
+                result["skipped"].append(name)
+                continue
+            if current != entry["old_crc"] and not force:
+                result["conflicts"].append(name)
+                continue
+
+            result["removed"].append(name)
+            if not dry_run:
+                target.unlink()
+
+    return result
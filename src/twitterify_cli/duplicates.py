@@ -0,0 +1,317 @@
+"""Twitter-Init-Kit Duplicates - Near-Duplicate Requirements and Tasks"""
+
+import hashlib
+import os
+import random
+import re
+from array import array
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from .artifacts import ARTIFACT_DOCS, ArtifactCache
+from .workspace import open_state_db
+
+INDEX_NAME = "duplicates.sqlite"
+
+# Bump when shingling, hashing or banding changes: the index is rebuilt
+INDEX_FORMAT = 1
+
+# MinHash signature length, split into BANDS bands of ROWS rows for LSH.
+# Pairs with Jaccard similarity 0.7 share a bucket with probability ~0.99.
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+
+# Words per shingle
+SHINGLE_SIZE = 3
+
+# Default Jaccard similarity for near-duplicates
+DEFAULT_THRESHOLD = 0.7
+
+# Signatures remembered per index instance: campaigns started from the same
+# template share most of their lines
+SIGNATURE_MEMO_SIZE = 65536
+
+# Mersenne prime for the universal hash family
+PRIME = (1 << 61) - 1
+_rng = random.Random(20251019)  # fixed: signatures are stored across runs
+PERMUTATIONS = [(_rng.randrange(1, PRIME), _rng.randrange(0, PRIME)) for _ in range(NUM_PERM)]
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+ID_PATTERN = re.compile(r"\b(?:[A-Z]{2,5}-\d{3,}|T\d{3,})\b")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS documents (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    feature TEXT NOT NULL,
+    document TEXT NOT NULL,
+    item TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_path ON items (path);
+CREATE TABLE IF NOT EXISTS buckets (
+    band INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    item INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS buckets_bucket ON buckets (band, bucket);
+CREATE INDEX IF NOT EXISTS buckets_item ON buckets (item);
+"""
+
+
+def shingles(text: str) -> Set[str]:
+    """Word shingles of a requirement or task, ignoring IDs, case and punctuation."""
+    words = WORD_PATTERN.findall(ID_PATTERN.sub(" ", text).lower())
+    if len(words) <= SHINGLE_SIZE:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i : i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+
+
+def jaccard(first: Set[str], second: Set[str]) -> float:
+    """Jaccard similarity of two shingle sets."""
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+def minhash(shingle_set: Set[str]) -> List[int]:
+    """MinHash signature of a non-empty shingle set."""
+    hashes = [
+        int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "big") for shingle in shingle_set
+    ]
+    return [min((a * value + b) % PRIME for value in hashes) for a, b in PERMUTATIONS]
+
+
+def band_buckets(signature: List[int]) -> List[int]:
+    """LSH bucket of each band of a signature (as signed 64-bit integers)."""
+    buckets = []
+    for band in range(BANDS):
+        rows = array("Q", signature[band * ROWS : (band + 1) * ROWS]).tobytes()
+        buckets.append(int.from_bytes(hashlib.blake2b(rows, digest_size=8).digest(), "big", signed=True))
+    return buckets
+
+
+class DuplicateIndex:
+    """LSH index of every requirement and task line in specs/.
+
+    Lines are shingled into word 3-grams and MinHashed; signatures are
+    banded into buckets stored in .twitterkit/state/duplicates.sqlite.
+    Refreshing stats each campaign document and only re-indexes those whose
+    mtime or size changed and whose content hash differs, so keeping the
+    index current costs a directory scan.
+    """
+
+    def __init__(self, root: Path, cache: Optional[ArtifactCache] = None, path: Optional[Path] = None):
+        """Open (or create) the index.
+
+        Args:
+            root: Project root
+            cache: Parsed-document cache to use (default: the project's)
+            path: Database file (default: .twitterkit/state/duplicates.sqlite);
+                an in-memory index is used if it can't be written or the
+                project has no .twitterkit/ directory
+        """
+        self.root = root
+        self.conn = open_state_db(root, INDEX_NAME, SCHEMA, INDEX_FORMAT, path)
+        self.own_cache = cache is None
+        self.cache = ArtifactCache(root) if cache is None else cache
+        self.memo: Dict[FrozenSet[str], List[int]] = {}
+
+    def close(self) -> None:
+        """Close the database (and the document cache if it was opened here)."""
+        self.conn.close()
+        if self.own_cache:
+            self.cache.close()
+
+    def __enter__(self) -> "DuplicateIndex":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _documents(self) -> Dict[str, os.stat_result]:
+        """Campaign documents in specs/, by root-relative path."""
+        documents = {}
+        try:
+            with os.scandir(self.root / "specs") as features:
+                feature_names = [entry.name for entry in features if entry.is_dir()]
+        except (FileNotFoundError, NotADirectoryError):
+            return documents
+        for feature in feature_names:
+            for name in ARTIFACT_DOCS.values():
+                rel = f"specs/{feature}/{name}"
+                try:
+                    documents[rel] = (self.root / rel).stat()
+                except (FileNotFoundError, NotADirectoryError):
+                    continue
+        return documents
+
+    def refresh(self) -> List[str]:
+        """Re-index documents that changed since the last refresh.
+
+        Returns:
+            Root-relative paths of documents indexed, re-indexed or dropped
+        """
+        documents = self._documents()
+        indexed = {row["path"]: row for row in self.conn.execute("SELECT * FROM documents")}
+        changed = []
+
+        with self.conn:
+            for rel in sorted(set(indexed) - set(documents)):
+                self._drop(rel)
+                self.conn.execute("DELETE FROM documents WHERE path = ?", (rel,))
+                changed.append(rel)
+
+            for rel, stat in sorted(documents.items()):
+                row = indexed.get(rel)
+                if row is not None and (row["mtime_ns"], row["size"]) == (stat.st_mtime_ns, stat.st_size):
+                    continue
+                try:
+                    artifact = self.cache.load(self.root / rel)
+                except FileNotFoundError:
+                    continue
+                if row is None or row["digest"] != artifact.digest:
+                    self._drop(rel)
+                    self._add(rel, artifact)
+                    changed.append(rel)
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?)",
+                    (rel, stat.st_mtime_ns, stat.st_size, artifact.digest),
+                )
+        return changed
+
+    def _drop(self, rel: str) -> None:
+        """Remove a document's items and buckets."""
+        self.conn.execute("DELETE FROM buckets WHERE item IN (SELECT id FROM items WHERE path = ?)", (rel,))
+        self.conn.execute("DELETE FROM items WHERE path = ?", (rel,))
+
+    def _add(self, rel: str, artifact) -> None:
+        """Index a document's requirements and tasks."""
+        feature = Path(rel).parent.name
+        entries = [(requirement.id, requirement.line, requirement.text) for requirement in artifact.requirements]
+        entries += [(task.id, task.line, task.text) for task in artifact.tasks]
+        for item, line, text in entries:
+            shingle_set = frozenset(shingles(text))
+            if not shingle_set:
+                continue
+            buckets = self.memo.get(shingle_set)
+            if buckets is None:
+                if len(self.memo) >= SIGNATURE_MEMO_SIZE:
+                    self.memo.clear()
+                buckets = self.memo[shingle_set] = band_buckets(minhash(shingle_set))
+            cursor = self.conn.execute(
+                "INSERT INTO items (path, feature, document, item, line, text) VALUES (?, ?, ?, ?, ?, ?)",
+                (rel, feature, artifact.kind, item, line, text),
+            )
+            self.conn.executemany(
+                "INSERT INTO buckets VALUES (?, ?, ?)",
+                [(band, bucket, cursor.lastrowid) for band, bucket in enumerate(buckets)],
+            )
+
+    def candidates(self) -> Set[Tuple[int, int]]:
+        """Candidate pairs: each item paired with the first item of every bucket it shares.
+
+        Pairing with one representative per bucket keeps the number of pairs
+        linear in the bucket sizes, even when hundreds of campaigns repeat
+        the same template line.
+        """
+        pairs: Set[Tuple[int, int]] = set()
+        rows = self.conn.execute(
+            "SELECT group_concat(item) AS items FROM buckets GROUP BY band, bucket HAVING count(*) > 1"
+        )
+        for row in rows:
+            first, *others = sorted({int(item) for item in row["items"].split(",")})
+            pairs.update((first, other) for other in others)
+        return pairs
+
+    def clusters(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        features: Optional[Iterable[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Groups of near-duplicate requirements and tasks.
+
+        Candidate pairs from the LSH buckets are confirmed with their exact
+        shingle Jaccard similarity, and confirmed pairs are merged into
+        clusters.
+
+        Args:
+            threshold: Minimum Jaccard similarity of a pair
+            features: Only report clusters involving these features
+
+        Returns:
+            Clusters (largest first) with "similarity" (lowest confirmed
+            pair), "cross_campaign" and "items" (feature, document, id,
+            line, text)
+        """
+        self.refresh()
+        pairs = self.candidates()
+        ids = sorted({item for pair in pairs for item in pair})
+        items: Dict[int, Dict[str, Any]] = {}
+        for start in range(0, len(ids), 500):
+            chunk = ids[start : start + 500]
+            query = f"SELECT * FROM items WHERE id IN ({','.join('?' * len(chunk))})"
+            for row in self.conn.execute(query, chunk):
+                items[row["id"]] = {
+                    "feature": row["feature"],
+                    "document": row["document"],
+                    "id": row["item"],
+                    "line": row["line"],
+                    "text": row["text"],
+                }
+        shingle_sets = {item: shingles(items[item]["text"]) for item in items}
+
+        parent = {item: item for item in items}
+
+        def find(item: int) -> int:
+            while parent[item] != item:
+                parent[item] = parent[parent[item]]
+                item = parent[item]
+            return item
+
+        confirmed = []
+        for first, second in sorted(pairs):
+            score = jaccard(shingle_sets[first], shingle_sets[second])
+            if score >= threshold:
+                confirmed.append((first, score))
+                parent[find(second)] = find(first)
+
+        similarity: Dict[int, float] = {}
+        for item, score in confirmed:
+            root = find(item)
+            similarity[root] = min(score, similarity.get(root, 1.0))
+        groups: Dict[int, List[int]] = {}
+        for item in items:
+            root = find(item)
+            if root in similarity:
+                groups.setdefault(root, []).append(item)
+
+        wanted = set(features) if features is not None else None
+        clusters = []
+        for root, members in groups.items():
+            entries = sorted(
+                (items[item] for item in members),
+                key=lambda entry: (entry["feature"], entry["document"], entry["line"]),
+            )
+            campaigns = {entry["feature"] for entry in entries}
+            if wanted is not None and not campaigns & wanted:
+                continue
+            clusters.append({
+                "similarity": round(similarity[root], 3),
+                "cross_campaign": len(campaigns) > 1,
+                "items": entries,
+            })
+        clusters.sort(key=lambda cluster: (-len(cluster["items"]), -cluster["similarity"], cluster["items"][0]["line"]))
+        return clusters
@@ -1,11 +1,14 @@
 """Twitter-Init-Kit Git Utilities - Git Operations"""
 
+import os
 import subprocess
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List, Tuple
 
 from rich.console import Console
 
+from .profiling import profiler
+
 console = Console()
 
 
@@ -30,7 +33,7 @@ class GitUtils:
             True if git repository, False otherwise
         """
         try:
-            result = subprocess.run(
+            result = profiler.run(
                 ["git", "rev-parse", "--git-dir"],
                 cwd=path,
                 capture_output=True,
@@ -52,7 +55,7 @@ class GitUtils:
             True if successful, False otherwise
         """
         try:
-            result = subprocess.run(
+            result = profiler.run(
                 ["git", "init"],
                 cwd=path,
                 capture_output=True,
@@ -83,7 +86,7 @@ class GitUtils:
             Branch name or None if not in a git repo
         """
         try:
-            result = subprocess.run(
+            result = profiler.run(
                 ["git", "branch", "--show-current"],
                 cwd=path,
                 capture_output=True,
@@ -100,21 +103,36 @@ class GitUtils:
                 console.print(f"[dim]Git branch check error: {e}[/dim]")
             return None
 
-    def create_branch(self, path: Path, branch_name: str, checkout: bool = True) -> bool:
+    def create_branch(
+        self,
+        path: Path,
+        branch_name: str,
+        checkout: bool = True,
+        worktree_dir: Optional[Path] = None,
+    ) -> bool:
         """Create a new git branch.
 
         Args:
             path: Repository directory
             branch_name: Name of branch to create
             checkout: Whether to checkout the new branch
+            worktree_dir: When given, check the branch out in a new linked
+                worktree at worktree_dir/branch_name instead of switching the
+                current worktree (checkout is ignored). Relative directories
+                are resolved against path.
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            cmd = ["git", "checkout", "-b", branch_name] if checkout else ["git", "branch", branch_name]
+            if worktree_dir is not None:
+                target = self.get_worktree_path(path, branch_name, worktree_dir)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                cmd = ["git", "worktree", "add", "-b", branch_name, str(target)]
+            else:
+                cmd = ["git", "checkout", "-b", branch_name] if checkout else ["git", "branch", branch_name]
 
-            result = subprocess.run(
+            result = profiler.run(
                 cmd,
                 cwd=path,
                 capture_output=True,
@@ -123,7 +141,10 @@ class GitUtils:
 
             if result.returncode == 0:
                 if self.debug:
-                    action = "created and checked out" if checkout else "created"
+                    if worktree_dir is not None:
+                        action = f"created in worktree {target}"
+                    else:
+                        action = "created and checked out" if checkout else "created"
                     console.print(f"[dim]✓ Branch '{branch_name}' {action}[/dim]")
                 return True
             else:
@@ -136,11 +157,145 @@ class GitUtils:
                 console.print(f"[dim]✗ Branch creation error: {e}[/dim]")
             return False
 
+    @staticmethod
+    def get_worktree_path(path: Path, branch_name: str, worktree_dir: Path) -> Path:
+        """Get the directory a branch's linked worktree is created in.
+
+        Args:
+            path: Repository directory
+            branch_name: Branch checked out in the worktree
+            worktree_dir: Directory holding campaign worktrees
+
+        Returns:
+            Absolute worktree path
+        """
+        return (Path(path) / worktree_dir / branch_name).resolve()
+
+    def list_worktrees(self, path: Path) -> List[Dict[str, str]]:
+        """List all worktrees of a repository.
+
+        Args:
+            path: Repository directory
+
+        Returns:
+            List of worktree records with 'path', 'head' and 'branch' keys,
+            plus any flags git reports ('detached', 'locked', 'prunable', ...)
+        """
+        try:
+            result = profiler.run(
+                ["git", "worktree", "list", "--porcelain"],
+                cwd=path,
+                capture_output=True,
+                timeout=5,
+                text=True,
+            )
+
+            if result.returncode != 0:
+                return []
+
+            worktrees = []
+            for block in result.stdout.strip().split("\n\n"):
+                record: Dict[str, str] = {}
+                for line in block.splitlines():
+                    key, _, value = line.partition(" ")
+                    if key == "worktree":
+                        record["path"] = value
+                    elif key == "HEAD":
+                        record["head"] = value
+                    elif key == "branch":
+                        record["branch"] = value.removeprefix("refs/heads/")
+                    else:
+                        record[key] = value or "true"
+                if record:
+                    worktrees.append(record)
+            return worktrees
+
+        except Exception as e:
+            if self.debug:
+                console.print(f"[dim]Git worktree list error: {e}[/dim]")
+            return []
+
+    def prune_worktrees(self, path: Path) -> bool:
+        """Prune administrative data for worktrees whose directory is gone.
+
+        Args:
+            path: Repository directory
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            result = profiler.run(
+                ["git", "worktree", "prune"],
+                cwd=path,
+                capture_output=True,
+                timeout=10,
+            )
+
+            if result.returncode == 0:
+                if self.debug:
+                    console.print("[dim]✓ Pruned stale worktrees[/dim]")
+                return True
+            else:
+                if self.debug:
+                    console.print(f"[dim]✗ Worktree prune failed: {result.stderr.decode()}[/dim]")
+                return False
+
+        except Exception as e:
+            if self.debug:
+                console.print(f"[dim]✗ Worktree prune error: {e}[/dim]")
+            return False
+
+    def stage_paths(self, path: Path, paths: Iterable[Path]) -> bool:
+        """Stage exactly the given paths.
+
+        Paths are streamed to ``git add`` over stdin (NUL-separated) so the
+        list size is never limited by argv, and they are matched literally so
+        names containing glob characters are not expanded.
+
+        Args:
+            path: Repository directory
+            paths: Files to stage, absolute or relative to path
+
+        Returns:
+            True if successful, False otherwise
+        """
+        pathspec = b"".join(os.fsencode(p) + b"\0" for p in paths)
+        if not pathspec:
+            return True
+
+        try:
+            result = profiler.run(
+                [
+                    "git",
+                    "--literal-pathspecs",
+                    "add",
+                    "--pathspec-from-file=-",
+                    "--pathspec-file-nul",
+                ],
+                cwd=path,
+                input=pathspec,
+                capture_output=True,
+                timeout=60,
+            )
+
+            if result.returncode != 0:
+                if self.debug:
+                    console.print(f"[dim]✗ Git add failed: {result.stderr.decode()}[/dim]")
+                return False
+            return True
+
+        except Exception as e:
+            if self.debug:
+                console.print(f"[dim]✗ Git add error: {e}[/dim]")
+            return False
+
     def commit_changes(
         self,
         path: Path,
         message: str,
         add_all: bool = True,
+        paths: Optional[Iterable[Path]] = None,
     ) -> bool:
         """Commit changes to git repository.
 
@@ -148,14 +303,20 @@ class GitUtils:
             path: Repository directory
             message: Commit message
             add_all: Whether to add all changes before committing
+            paths: Exact files to stage before committing. When given, only
+                these paths are added and add_all is ignored.
 
         Returns:
             True if successful, False otherwise
         """
         try:
+            if paths is not None:
+                if not self.stage_paths(path, paths):
+                    return False
+
             # Add all changes if requested
-            if add_all:
-                add_result = subprocess.run(
+            elif add_all:
+                add_result = profiler.run(
                     ["git", "add", "."],
                     cwd=path,
                     capture_output=True,
@@ -168,7 +329,7 @@ class GitUtils:
                     return False
 
             # Commit changes
-            commit_result = subprocess.run(
+            commit_result = profiler.run(
                 ["git", "commit", "-m", message],
                 cwd=path,
                 capture_output=True,
@@ -189,6 +350,166 @@ class GitUtils:
                 console.print(f"[dim]✗ Git commit error: {e}[/dim]")
             return False
 
+    def commit_generated(
+        self,
+        path: Path,
+        paths: Iterable[Path],
+        message: str,
+    ) -> Optional[str]:
+        """Commit generated files on top of HEAD using git plumbing only.
+
+        Blobs are written by a single ``git hash-object --stdin-paths``, the
+        trees touched by the new files are built by a single ``git mktree
+        --batch`` and the commit is recorded with ``commit-tree`` and
+        ``update-ref``. The committed entries are then recorded in the index
+        with ``update-index --index-info``, so ``git status`` shows them as
+        unchanged and the next commit keeps them. The working tree is never
+        scanned, so the number of processes is constant regardless of how
+        many files are committed.
+
+        Args:
+            path: Repository root directory
+            paths: Files to commit, absolute or relative to path
+            message: Commit message
+
+        Returns:
+            SHA of the new HEAD commit (or the unchanged HEAD when the files
+            already match it), or None on failure
+        """
+        try:
+            root = Path(path).resolve()
+            files = {}
+            for file_path in paths:
+                absolute = (root / file_path).resolve()
+                relative = absolute.relative_to(root).as_posix()
+                if "\n" in relative:
+                    raise ValueError(f"Unsupported file name: {relative!r}")
+                files[relative] = "100755" if absolute.stat().st_mode & 0o111 else "100644"
+            if not files:
+                raise ValueError("No files to commit")
+
+            names = sorted(files)
+            shas = self._plumbing(
+                root, "hash-object", "-w", "--stdin-paths", input="\n".join(names) + "\n"
+            ).split()
+            blobs = {name: (files[name], "blob", sha) for name, sha in zip(names, shas)}
+
+            parent = self._plumbing(root, "rev-parse", "--verify", "-q", "HEAD^{commit}", check=False).strip()
+            tree = self._write_trees(root, parent or None, blobs)
+
+            index_info = "".join(f"{mode} {sha}\t{name}\n" for name, (mode, _, sha) in blobs.items())
+            if parent and self._plumbing(root, "rev-parse", f"{parent}^{{tree}}").strip() == tree:
+                self._plumbing(root, "update-index", "--add", "--index-info", input=index_info)
+                if self.debug:
+                    console.print("[dim]Generated files already match HEAD, nothing to commit[/dim]")
+                return parent
+
+            commit_args = ["commit-tree", tree] + (["-p", parent] if parent else [])
+            commit = self._plumbing(root, *commit_args, input=message).strip()
+            self._plumbing(root, "update-ref", "-m", f"commit: {message.splitlines()[0]}", "HEAD", commit, parent)
+            self._plumbing(root, "update-index", "--add", "--index-info", input=index_info)
+
+            if self.debug:
+                console.print(f"[dim]✓ Committed {len(blobs)} generated files as {commit[:12]}[/dim]")
+            return commit
+
+        except Exception as e:
+            if self.debug:
+                console.print(f"[dim]✗ Plumbing commit error: {e}[/dim]")
+            return None
+
+    def _write_trees(self, root: Path, parent: Optional[str], blobs: dict) -> str:
+        """Build the tree objects for HEAD's tree overlaid with new blobs.
+
+        Only directories that contain new files are rewritten; every other
+        subtree keeps the object it already has in HEAD.
+
+        Args:
+            root: Repository root directory
+            parent: Parent commit SHA, or None for an unborn branch
+            blobs: Mapping of repo-relative path -> (mode, type, sha)
+
+        Returns:
+            SHA of the new root tree
+        """
+        touched = {""}
+        for name in blobs:
+            parts = name.split("/")[:-1]
+            touched.update("/".join(parts[:i]) for i in range(1, len(parts) + 1))
+
+        # Existing entries of every touched directory, from at most two listings
+        entries = {directory: {} for directory in touched}
+        if parent:
+            listing = self._plumbing(root, "ls-tree", "-z", parent)
+            top_dirs = sorted({name.split("/")[0] for name in touched if name})
+            if top_dirs:
+                listing += self._plumbing(root, "ls-tree", "-z", "-r", "-t", parent, "--", *top_dirs)
+            for record in listing.split("\0"):
+                if not record:
+                    continue
+                meta, name = record.split("\t", 1)
+                mode, obj_type, sha = meta.split()
+                directory, _, base = name.rpartition("/")
+                if directory in entries:
+                    entries[directory][base] = (mode, obj_type, sha)
+
+        for name, entry in blobs.items():
+            directory, _, base = name.rpartition("/")
+            entries[directory][base] = entry
+
+        # Write deepest directories first so parents can reference them
+        with profiler.span("git mktree", "subprocess", trees=len(touched)):
+            process = subprocess.Popen(
+                ["git", "mktree", "-z", "--batch"],
+                cwd=root,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+            try:
+                tree = ""
+                for directory in sorted(touched, key=lambda d: (-d.count("/") - bool(d), d)):
+                    record = b"".join(
+                        f"{mode} {obj_type} {sha}\t".encode() + os.fsencode(base) + b"\0"
+                        for base, (mode, obj_type, sha) in entries[directory].items()
+                    )
+                    process.stdin.write(record + b"\0")
+                    process.stdin.flush()
+                    tree = process.stdout.readline().decode().strip()
+                    if not tree:
+                        raise RuntimeError(f"git mktree failed: {process.stderr.read().decode()}")
+                    if directory:
+                        parent_dir, _, base = directory.rpartition("/")
+                        entries[parent_dir][base] = ("040000", "tree", tree)
+                return tree
+            finally:
+                process.stdin.close()
+                process.wait(timeout=10)
+
+    def _plumbing(self, path: Path, *args: str, input: Optional[str] = None, check: bool = True) -> str:
+        """Run a git plumbing command and return its stdout.
+
+        Args:
+            path: Repository directory
+            *args: Git subcommand and arguments
+            input: Text to feed on stdin
+            check: Raise RuntimeError when the command fails
+
+        Returns:
+            Command stdout
+        """
+        result = profiler.run(
+            ["git", *args],
+            cwd=path,
+            input=input,
+            capture_output=True,
+            timeout=60,
+            text=True,
+        )
+        if check and result.returncode != 0:
+            raise RuntimeError(f"git {args[0]} failed: {result.stderr.strip()}")
+        return result.stdout
+
     def get_status(self, path: Path) -> Optional[str]:
         """Get git status output.
 
@@ -198,23 +519,41 @@ class GitUtils:
         Returns:
             Status output or None if error
         """
+        return self.status_or_error(path)[0]
+
+    def status_or_error(self, path: Path, timeout: float = 5) -> Tuple[Optional[str], Optional[str]]:
+        """Get git status output, or why it couldn't be read.
+
+        Args:
+            path: Repository directory
+            timeout: Seconds to wait for git
+
+        Returns:
+            (status output, None), or (None, error): git's own error message
+            (e.g. "not a git repository" or a locked index), or the timeout
+            or failure to run git
+        """
         try:
-            result = subprocess.run(
+            result = profiler.run(
                 ["git", "status", "--short"],
                 cwd=path,
                 capture_output=True,
-                timeout=5,
+                timeout=timeout,
                 text=True,
             )
-
+        except subprocess.TimeoutExpired:
+            error = f"git status timed out after {timeout:g}s"
+        except Exception as e:
+            error = f"git failed to run: {e}"
+        else:
             if result.returncode == 0:
-                return result.stdout
-            return None
+                return result.stdout, None
+            lines = [line.strip() for line in result.stderr.splitlines() if line.strip()]
+            error = lines[0].removeprefix("fatal: ") if lines else f"git status exited with status {result.returncode}"
 
-        except Exception as e:
-            if self.debug:
-                console.print(f"[dim]Git status error: {e}[/dim]")
-            return None
+        if self.debug:
+            console.print(f"[dim]Git status error: {error}[/dim]")
+        return None, error
 
     def list_branches(self, path: Path) -> List[str]:
         """List all git branches.
@@ -226,7 +565,7 @@ class GitUtils:
             List of branch names
         """
         try:
-            result = subprocess.run(
+            result = profiler.run(
                 ["git", "branch", "--format=%(refname:short)"],
                 cwd=path,
                 capture_output=True,
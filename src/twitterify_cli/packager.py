@@ -0,0 +1,669 @@
+"""Twitter-Init-Kit Packager - Release Template Variants"""
+
+import hashlib
+import io
+import json
+import os
+import platform
+import stat
+import struct
+import subprocess
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from rich.console import Console
+
+from .commands.init import AGENT_CONFIG
+from .profiling import profiler
+
+console = Console()
+
+# Agents packaged for release. "cursor" is an alias of "cursor-agent" for
+# init and shares its command directory, so it gets no archive of its own.
+RELEASE_AGENTS = [agent for agent in AGENT_CONFIG if agent != "cursor"]
+
+# Script type -> directory under .twitterkit/scripts/
+SCRIPT_DIRS = {"sh": "bash", "ps": "powershell"}
+
+# Agents whose command files use a different argument placeholder
+ARGS_FORMAT = {"gemini": "{{args}}", "qwen": "{{args}}"}
+
+# Extra files and empty directories shipped with specific agents
+AGENT_EXTRA_FILES = {
+    "copilot": {".vscode/settings.json": b'{"github.copilot.enable": {"*": true}}\n'},
+}
+AGENT_EXTRA_DIRS = {
+    "copilot": [".github/prompts"],
+}
+
+# check-prerequisites.sh invocation in command templates, and the
+# equivalent CLI command it can be swapped for (same flags and output)
+PREREQS_SCRIPT = ".twitterkit/scripts/{SCRIPT}/check-prerequisites.sh"
+PREREQS_COMMAND = "twitterify prereqs"
+
+ARCHIVE_PREFIX = "twitter-kit-template"
+
+# Fixed archive settings so the same source always yields the same bytes.
+# Timestamps come from SOURCE_DATE_EPOCH, defaulting to the earliest time
+# a ZIP can record (1980-01-01).
+ZIP_EPOCH = 315532800
+ZIP_COMPRESSLEVEL = 9
+ZIP_CREATE_SYSTEM = 3  # Unix, so permission bits are honoured on extract
+ZIP_VERSION = 20  # 2.0: deflate and directories
+ZIP_STORED = 0
+ZIP_DEFLATED = 8
+ZIP_UTF8_FLAG = 0x800
+
+# Build manifest written next to the archives, recording each variant's
+# input digest so unchanged variants are not rebuilt
+MANIFEST_NAME = "build-manifest.json"
+CHECKSUMS_NAME = "CHECKSUMS.sha256"
+
+# Bump whenever archive layout or command transforms change, so archives
+# built by an older packager are not reused
+PACKAGER_FORMAT = 1
+
+# Source snapshot: path relative to .twitterkit/ -> (content, executable)
+Source = Dict[str, Tuple[bytes, bool]]
+
+
+class CompressedEntry(NamedTuple):
+    """A ZIP member's data, compressed once and spliced into any archive."""
+
+    crc: int
+    size: int
+    data: bytes
+    method: int
+    mode: int
+
+
+DIRECTORY_ENTRY = CompressedEntry(crc=0, size=0, data=b"", method=ZIP_STORED, mode=stat.S_IFDIR | 0o755)
+
+
+class HashingWriter:
+    """File-like sink that hashes and counts bytes as they are written.
+
+    Archives are hashed while they stream to disk, so they never have to be
+    read back to compute their checksum.
+    """
+
+    def __init__(self, out: Optional[BinaryIO] = None):
+        """Initialize writer.
+
+        Args:
+            out: File to forward writes to, or None to only hash
+        """
+        self.out = out
+        self.size = 0
+        self._sha256 = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        """Hash data and forward it to the underlying file."""
+        self._sha256.update(data)
+        self.size += len(data)
+        if self.out is not None:
+            self.out.write(data)
+        return len(data)
+
+    def hexdigest(self) -> str:
+        """Return the SHA-256 of everything written so far."""
+        return self._sha256.hexdigest()
+
+
+# Snapshot and pre-compressed shared payload, set once per worker by _init_worker
+_worker_source: Source = {}
+_worker_shared: Dict[str, CompressedEntry] = {}
+
+
+def archive_name(agent: str, script: str, version: str) -> str:
+    """Return the archive file name for a variant.
+
+    Args:
+        agent: Agent key
+        script: Script type (sh or ps)
+        version: Release version (e.g., v0.1.0)
+
+    Returns:
+        File name such as twitter-kit-template-claude-sh-v0.1.0.zip
+    """
+    return f"{ARCHIVE_PREFIX}-{agent}-{script}-{version}.zip"
+
+
+def source_date_epoch() -> int:
+    """Return the timestamp recorded for every archive entry.
+
+    Returns:
+        SOURCE_DATE_EPOCH if set (clamped to the ZIP range), else 1980-01-01
+    """
+    value = os.environ.get("SOURCE_DATE_EPOCH", "")
+    try:
+        return max(int(value), ZIP_EPOCH)
+    except ValueError:
+        return ZIP_EPOCH
+
+
+def load_source(source_dir: Path) -> Source:
+    """Read the packaged parts of .twitterkit/ into memory.
+
+    Args:
+        source_dir: Path to the .twitterkit/ directory
+
+    Returns:
+        Snapshot of memory/, templates/ and every script variant
+    """
+    source: Source = {}
+    roots = ["memory", "templates"] + [f"scripts/{name}" for name in SCRIPT_DIRS.values()]
+    for root in roots:
+        base = source_dir / root
+        if not base.is_dir():
+            continue
+        for dirpath, dirnames, filenames in os.walk(base):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                path = Path(dirpath) / filename
+                rel = path.relative_to(source_dir).as_posix()
+                executable = bool(path.stat().st_mode & stat.S_IXUSR)
+                source[rel] = (path.read_bytes(), executable)
+    return source
+
+
+def render_commands(source: Source, agent: str, script: str, python_prereqs: bool = False) -> Dict[str, bytes]:
+    """Transform command templates into an agent's command files.
+
+    Args:
+        source: Source snapshot
+        agent: Agent key
+        script: Script type (sh or ps)
+        python_prereqs: Call `twitterify prereqs` instead of check-prerequisites.sh
+
+    Returns:
+        Mapping of archive path -> rendered content
+    """
+    agent_dir, extension = AGENT_CONFIG[agent]
+    args_format = ARGS_FORMAT.get(agent, "$ARGUMENTS")
+    commands: Dict[str, bytes] = {}
+
+    for rel in sorted(source):
+        directory, _, filename = rel.rpartition("/")
+        if directory != "templates/commands" or not filename.endswith(".md"):
+            continue
+        command = filename[: -len(".md")]
+        if not command.startswith("twitterkit."):
+            command = f"twitterkit.{command}"
+        text = source[rel][0].decode("utf-8")
+        if python_prereqs:
+            text = text.replace(PREREQS_SCRIPT, PREREQS_COMMAND)
+        text = (
+            text.replace("__AGENT__", command)
+            .replace("$ARGUMENTS", args_format)
+            .replace("{SCRIPT}", script)
+        )
+        commands[f"{agent_dir}/{command}{extension}"] = text.encode("utf-8")
+
+    return commands
+
+
+def input_digest(source: Source, agent: str, script: str, version: str, python_prereqs: bool = False) -> str:
+    """Hash everything that determines a variant archive's bytes.
+
+    Covers the .twitterkit files the variant ships, the agent's command
+    configuration, the script type, the version and the archive settings.
+
+    Args:
+        source: Source snapshot
+        agent: Agent key
+        script: Script type (sh or ps)
+        version: Release version
+        python_prereqs: Commands call `twitterify prereqs`
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    config = {
+        "format": PACKAGER_FORMAT,
+        "agent": agent,
+        "agent_config": list(AGENT_CONFIG[agent]),
+        "args_format": ARGS_FORMAT.get(agent, "$ARGUMENTS"),
+        "extra_files": {path: content.hex() for path, content in AGENT_EXTRA_FILES.get(agent, {}).items()},
+        "extra_dirs": AGENT_EXTRA_DIRS.get(agent, []),
+        "script": script,
+        "python_prereqs": python_prereqs,
+        "version": version,
+        "source_date_epoch": source_date_epoch(),
+        "compresslevel": ZIP_COMPRESSLEVEL,
+    }
+    digest = hashlib.sha256(json.dumps(config, sort_keys=True).encode("utf-8"))
+
+    script_prefix = f"scripts/{SCRIPT_DIRS[script]}/"
+    for rel in sorted(source):
+        if rel.startswith("scripts/") and not rel.startswith(script_prefix):
+            continue
+        content, executable = source[rel]
+        digest.update(f"{rel}\0{int(executable)}\0{len(content)}\0".encode("utf-8"))
+        digest.update(content)
+    return digest.hexdigest()
+
+
+def load_manifest(output_dir: Path) -> Dict[str, Any]:
+    """Read the build manifest from an output directory.
+
+    Args:
+        output_dir: Directory containing the archives
+
+    Returns:
+        Manifest data, or an empty manifest if missing or unreadable
+    """
+    try:
+        manifest = json.loads((output_dir / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return {"variants": {}}
+    if not isinstance(manifest.get("variants"), dict):
+        manifest["variants"] = {}
+    return manifest
+
+
+def write_manifest(output_dir: Path, manifest: Dict[str, Any]) -> None:
+    """Atomically write the build manifest and CHECKSUMS.sha256.
+
+    Args:
+        output_dir: Directory containing the archives
+        manifest: Manifest data
+    """
+    checksums = "".join(
+        f"{entry['sha256']}  {name}\n" for name, entry in sorted(manifest["variants"].items())
+    )
+    for name, content in (
+        (MANIFEST_NAME, json.dumps(manifest, indent=2, sort_keys=True) + "\n"),
+        (CHECKSUMS_NAME, checksums),
+    ):
+        path = output_dir / name
+        tmp_path = path.with_name(f"{name}.tmp")
+        tmp_path.write_text(content)
+        os.replace(tmp_path, path)
+
+
+def build_environment(source_dir: Path) -> Dict[str, str]:
+    """Describe the environment a build ran in, for the manifest.
+
+    Args:
+        source_dir: Path to the .twitterkit/ directory
+
+    Returns:
+        OS, Python version and the git commit of the source tree
+    """
+    try:
+        result = profiler.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=source_dir,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        commit = result.stdout.strip() if result.returncode == 0 else "unknown"
+    except (OSError, subprocess.TimeoutExpired):
+        commit = "unknown"
+
+    return {
+        "os": platform.system(),
+        "python_version": platform.python_version(),
+        "git_commit": commit,
+    }
+
+
+def compress_entry(content: bytes, mode: int) -> CompressedEntry:
+    """Deflate a file's content for a ZIP member.
+
+    Args:
+        content: File content
+        mode: Permission bits (0644 or 0755)
+
+    Returns:
+        Compressed entry
+    """
+    compressor = zlib.compressobj(ZIP_COMPRESSLEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+    data = compressor.compress(content) + compressor.flush()
+    return CompressedEntry(zlib.crc32(content), len(content), data, ZIP_DEFLATED, stat.S_IFREG | mode)
+
+
+def compress_source(source: Source) -> Dict[str, CompressedEntry]:
+    """Compress the shared payload (memory/, templates/, scripts/) once.
+
+    Every variant ships the same .twitterkit/ files, so they are compressed
+    a single time and spliced into each archive; only agent command files
+    are compressed per variant.
+
+    Args:
+        source: Source snapshot
+
+    Returns:
+        Mapping of path relative to .twitterkit/ -> compressed entry
+    """
+    return {
+        rel: compress_entry(content, 0o755 if executable else 0o644)
+        for rel, (content, executable) in source.items()
+    }
+
+
+def write_zip(members: Dict[str, CompressedEntry], out: BinaryIO) -> None:
+    """Stream a ZIP archive assembled from pre-compressed members.
+
+    Members are written in sorted order with the SOURCE_DATE_EPOCH
+    timestamp, so the output is byte-reproducible. Archives are small, so
+    ZIP64 is never needed.
+
+    Args:
+        members: Mapping of archive path (directories end in "/") -> entry
+        out: Binary file-like object to write to
+    """
+    year, month, day, hour, minute, second = time.gmtime(source_date_epoch())[:6]
+    dos_date = (year - 1980) << 9 | month << 5 | day
+    dos_time = hour << 11 | minute << 5 | second // 2
+
+    central: List[bytes] = []
+    offset = 0
+    for name in sorted(members):
+        entry = members[name]
+        encoded = name.encode("utf-8")
+        flags = 0 if encoded.isascii() else ZIP_UTF8_FLAG
+        external_attr = entry.mode << 16 | (0x10 if name.endswith("/") else 0)
+
+        header = struct.pack(
+            "<4sHHHHHIIIHH",
+            b"PK\x03\x04", ZIP_VERSION, flags, entry.method, dos_time, dos_date,
+            entry.crc, len(entry.data), entry.size, len(encoded), 0,
+        )
+        central.append(struct.pack(
+            "<4sHHHHHHIIIHHHHHII",
+            b"PK\x01\x02", ZIP_CREATE_SYSTEM << 8 | ZIP_VERSION, ZIP_VERSION, flags, entry.method,
+            dos_time, dos_date, entry.crc, len(entry.data), entry.size, len(encoded), 0, 0, 0, 0,
+            external_attr, offset,
+        ) + encoded)
+        out.write(header)
+        out.write(encoded)
+        out.write(entry.data)
+        offset += len(header) + len(encoded) + len(entry.data)
+
+    directory = b"".join(central)
+    out.write(directory)
+    out.write(struct.pack("<4sHHHHIIH", b"PK\x05\x06", 0, 0, len(central), len(central), len(directory), offset, 0))
+
+
+def variant_members(
+    source: Source,
+    agent: str,
+    script: str,
+    shared: Dict[str, CompressedEntry],
+    python_prereqs: bool = False,
+) -> Dict[str, CompressedEntry]:
+    """Collect a variant's archive members.
+
+    Args:
+        source: Source snapshot
+        agent: Agent key
+        script: Script type (sh or ps)
+        shared: Pre-compressed payload from compress_source
+        python_prereqs: Commands call `twitterify prereqs`
+
+    Returns:
+        Mapping of archive path (directories end in "/") -> entry
+    """
+    script_prefix = f"scripts/{SCRIPT_DIRS[script]}/"
+    members: Dict[str, CompressedEntry] = {}
+    for rel, entry in shared.items():
+        if rel.startswith("scripts/") and not rel.startswith(script_prefix):
+            continue
+        members[f".twitterkit/{rel}"] = entry
+
+    agent_files = render_commands(source, agent, script, python_prereqs)
+    agent_files.update(AGENT_EXTRA_FILES.get(agent, {}))
+    for path, content in agent_files.items():
+        members[path] = compress_entry(content, 0o644)
+
+    # Directory entries, as `zip -r` would record them
+    directories = set(AGENT_EXTRA_DIRS.get(agent, []))
+    for path in list(members):
+        parts = path.split("/")[:-1]
+        for depth in range(1, len(parts) + 1):
+            directories.add("/".join(parts[:depth]))
+    for directory in directories:
+        members[f"{directory}/"] = DIRECTORY_ENTRY
+
+    return members
+
+
+def build_archive(
+    source: Source,
+    agent: str,
+    script: str,
+    shared: Optional[Dict[str, CompressedEntry]] = None,
+    python_prereqs: bool = False,
+) -> bytes:
+    """Build a variant archive in memory.
+
+    The archive is byte-reproducible: entries are sorted, every entry
+    carries the SOURCE_DATE_EPOCH timestamp, permissions are normalized
+    to 0644/0755 and compression settings are fixed.
+
+    Args:
+        source: Source snapshot
+        agent: Agent key
+        script: Script type (sh or ps)
+        shared: Pre-compressed payload from compress_source (computed if omitted)
+        python_prereqs: Commands call `twitterify prereqs`
+
+    Returns:
+        ZIP file content
+    """
+    if shared is None:
+        shared = compress_source(source)
+
+    buffer = io.BytesIO()
+    write_zip(variant_members(source, agent, script, shared, python_prereqs), buffer)
+    return buffer.getvalue()
+
+
+def _init_worker(source: Source, shared: Dict[str, CompressedEntry]) -> None:
+    """Pool initializer: keep the snapshot and shared payload in the worker process."""
+    global _worker_source, _worker_shared
+    _worker_source = source
+    _worker_shared = shared
+
+
+def _build_variant(
+    agent: str, script: str, version: str, output_dir: str, check: bool, python_prereqs: bool
+) -> Dict[str, Any]:
+    """Build one variant (runs in a pool worker).
+
+    In check mode the archive is not written; instead the digest of the
+    existing file is returned as "expected" for comparison.
+    """
+    started = time.perf_counter()
+    members = variant_members(_worker_source, agent, script, _worker_shared, python_prereqs)
+    path = Path(output_dir) / archive_name(agent, script, version)
+    result: Dict[str, Any] = {"agent": agent, "script": script, "path": str(path)}
+
+    if check:
+        writer = HashingWriter()
+        write_zip(members, writer)
+        result["expected"] = None
+        if path.exists():
+            with path.open("rb") as f:
+                result["expected"] = hashlib.file_digest(f, "sha256").hexdigest()
+    else:
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        with tmp_path.open("wb") as f:
+            writer = HashingWriter(f)
+            write_zip(members, writer)
+        os.replace(tmp_path, path)
+
+    result["size"] = writer.size
+    result["sha256"] = writer.hexdigest()
+    result["seconds"] = time.perf_counter() - started
+    return result
+
+
+class Packager:
+    """Builds release archives for every agent × script variant."""
+
+    def __init__(self, source_dir: Path, debug: bool = False):
+        """Initialize packager.
+
+        Args:
+            source_dir: Path to the .twitterkit/ directory
+            debug: Enable debug output
+        """
+        self.source_dir = source_dir
+        self.debug = debug
+
+    def build(
+        self,
+        version: str,
+        output_dir: Path,
+        agents: Optional[Iterable[str]] = None,
+        scripts: Optional[Iterable[str]] = None,
+        jobs: Optional[int] = None,
+        check: bool = False,
+        force: bool = False,
+        clean: bool = False,
+        python_prereqs: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Build variant archives in parallel, reusing unchanged ones.
+
+        A variant is skipped when its input digest matches the build
+        manifest and its archive is still present with the recorded size.
+        Archives are hashed as they are written; build-manifest.json and
+        CHECKSUMS.sha256 are written alongside them.
+
+        Args:
+            version: Release version (e.g., v0.1.0)
+            output_dir: Directory to write archives to
+            agents: Agents to package (default: all release agents)
+            scripts: Script types to package (default: sh and ps)
+            jobs: Number of worker processes (default: CPU count)
+            check: Rebuild in memory and compare against the archives already
+                in output_dir instead of writing them
+            force: Rebuild every variant regardless of the manifest
+            clean: Delete other archives in output_dir (e.g., other versions)
+            python_prereqs: Have command files call `twitterify prereqs`
+                instead of check-prerequisites.sh
+
+        Returns:
+            One result per variant with agent, script, path, size, sha256 and
+            seconds; in check mode also "expected", the existing file's sha256,
+            otherwise also "input_digest" and "skipped"
+
+        Raises:
+            ValueError: If an agent or script type is unknown
+        """
+        agents = list(agents or RELEASE_AGENTS)
+        scripts = list(scripts or SCRIPT_DIRS)
+
+        unknown = [agent for agent in agents if agent not in AGENT_CONFIG]
+        unknown += [script for script in scripts if script not in SCRIPT_DIRS]
+        if unknown:
+            raise ValueError(f"Unknown agent or script type: {', '.join(unknown)}")
+
+        source = load_source(self.source_dir)
+        if self.debug:
+            console.print(f"[dim]Loaded {len(source)} files from {self.source_dir}[/dim]")
+
+        variants = [(agent, script) for agent in agents for script in scripts]
+        if check:
+            return self._run(
+                source,
+                [(agent, script, version, str(output_dir), True, python_prereqs) for agent, script in variants],
+                jobs,
+            )
+
+        build_started = time.gmtime()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        manifest = load_manifest(output_dir)
+        digests: Dict[str, str] = {}
+        reused: Dict[str, Dict[str, Any]] = {}
+        pending = []
+
+        for agent, script in variants:
+            name = archive_name(agent, script, version)
+            digests[name] = input_digest(source, agent, script, version, python_prereqs)
+            entry = manifest["variants"].get(name)
+            path = output_dir / name
+            if (
+                not force
+                and entry
+                and entry.get("input_digest") == digests[name]
+                and path.is_file()
+                and path.stat().st_size == entry.get("size")
+            ):
+                reused[name] = {
+                    "agent": agent,
+                    "script": script,
+                    "path": str(path),
+                    "size": entry["size"],
+                    "sha256": entry["sha256"],
+                    "seconds": 0.0,
+                    "build_seconds": entry.get("build_seconds", 0.0),
+                }
+            else:
+                pending.append((agent, script, version, str(output_dir), False, python_prereqs))
+
+        if self.debug:
+            console.print(f"[dim]{len(reused)} variant(s) up to date, {len(pending)} to build[/dim]")
+
+        built = {Path(result["path"]).name: result for result in self._run(source, pending, jobs)}
+
+        results = []
+        for agent, script in variants:
+            name = archive_name(agent, script, version)
+            result = reused.get(name) or built[name]
+            result["input_digest"] = digests[name]
+            result["skipped"] = name in reused
+            manifest["variants"][name] = {
+                "agent": agent,
+                "script": script,
+                "input_digest": digests[name],
+                "sha256": result["sha256"],
+                "size": result["size"],
+                "build_seconds": round(result.get("build_seconds", result["seconds"]), 6),
+                "status": "reused" if name in reused else "built",
+            }
+            results.append(result)
+
+        current = {archive_name(agent, script, version) for agent, script in variants}
+        if clean:
+            for stale in output_dir.glob("*.zip"):
+                if stale.name not in current:
+                    stale.unlink()
+        manifest["variants"] = {
+            name: entry for name, entry in manifest["variants"].items() if (output_dir / name).is_file()
+        }
+
+        manifest.update(
+            {
+                "format": PACKAGER_FORMAT,
+                "version": version,
+                "build_id": time.strftime("%Y%m%d-%H%M%S", build_started),
+                "build_started_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", build_started),
+                "build_completed_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "total_size_bytes": sum(entry["size"] for entry in manifest["variants"].values()),
+                "environment": build_environment(self.source_dir),
+            }
+        )
+        write_manifest(output_dir, manifest)
+        return results
+
+    def _run(self, source: Source, variants: List[tuple], jobs: Optional[int]) -> List[Dict[str, Any]]:
+        """Build variants in a process pool, or in-process for a single job."""
+        if not variants:
+            return []
+
+        shared = compress_source(source)
+        jobs = min(jobs or os.cpu_count() or 1, len(variants))
+        if jobs <= 1:
+            _init_worker(source, shared)
+            return [_build_variant(*variant) for variant in variants]
+
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(source, shared)) as pool:
+            return list(pool.map(_build_variant, *zip(*variants)))
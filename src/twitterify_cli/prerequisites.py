@@ -0,0 +1,187 @@
+"""Twitter-Init-Kit Prerequisites - In-Process check-prerequisites.sh"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from .client import DaemonError, request
+from .workspace import FEATURE_PATTERN, SpecsIndex, feature_docs, feature_paths, repo_root
+
+# Optional documents reported by check-prerequisites.sh, in output order
+OPTIONAL_DOCS = ("research.md", "data-model.md", "contracts/", "quickstart.md")
+
+# Keys of the --paths-only output, with the feature_paths() field they show
+PATHS_ONLY_KEYS = {
+    "REPO_ROOT": "REPO_ROOT",
+    "BRANCH": "CURRENT_BRANCH",
+    "FEATURE_DIR": "FEATURE_DIR",
+    "FEATURE_SPEC": "FEATURE_SPEC",
+    "IMPL_PLAN": "IMPL_PLAN",
+    "TASKS": "TASKS",
+}
+
+# check-prerequisites.sh flags, as `prereqs` query parameters
+FLAGS = {
+    "--json": "json",
+    "--require-tasks": "require_tasks",
+    "--include-tasks": "include_tasks",
+    "--paths-only": "paths_only",
+}
+
+
+class PrereqResult(NamedTuple):
+    """What check-prerequisites.sh would print, and its exit status."""
+
+    exit_code: int
+    stdout: str
+    stderr: str
+
+
+def _compact_json(value: Any) -> str:
+    """JSON without whitespace, matching the script's printf output."""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def check_feature_branch(paths: Dict[str, Any]) -> Tuple[bool, List[str]]:
+    """Validate the branch name, like common.sh check_feature_branch.
+
+    Args:
+        paths: feature_paths() result
+
+    Returns:
+        Whether the check passed, and the lines to print on stderr
+    """
+    if not paths["HAS_GIT"]:
+        return True, ["[twitterkit] Warning: Git repository not detected; skipped branch validation"]
+    if not FEATURE_PATTERN.match(paths["CURRENT_BRANCH"]):
+        return False, [
+            f"ERROR: Not on a feature branch. Current branch: {paths['CURRENT_BRANCH']}",
+            "Feature branches should be named like: 001-feature-name",
+        ]
+    return True, []
+
+
+def check_prerequisites(
+    start: Path,
+    json_mode: bool = False,
+    require_tasks: bool = False,
+    include_tasks: bool = False,
+    paths_only: bool = False,
+    index: Optional[SpecsIndex] = None,
+    feature: Optional[str] = None,
+) -> PrereqResult:
+    """Check a feature's prerequisites, like check-prerequisites.sh.
+
+    The repository root is resolved once, the branch is read from .git
+    without running git, and the feature directory's documents are read
+    with a single scandir.
+
+    Args:
+        start: Directory inside the project
+        json_mode: Output in JSON format (--json)
+        require_tasks: Require tasks.md to exist (--require-tasks)
+        include_tasks: Include tasks.md in AVAILABLE_DOCS (--include-tasks)
+        paths_only: Only output path variables, without validation (--paths-only)
+        index: Open index of the project to reuse
+        feature: Value of TWITTERKIT_FEATURE to use instead of the environment's
+
+    Returns:
+        Exit code, stdout and stderr, identical to the script's
+    """
+    paths = feature_paths(start, index=index, feature=feature)
+    stderr = [
+        line
+        for warning in paths["warnings"]
+        for line in (f"ERROR: {warning}", "Please ensure only one spec directory exists per numeric prefix.")
+    ]
+
+    passed, messages = check_feature_branch(paths)
+    stderr_text = "".join(f"{line}\n" for line in stderr + messages)
+    if not passed:
+        return PrereqResult(1, "", stderr_text)
+
+    if paths_only:
+        if json_mode:
+            stdout = _compact_json({key: paths[field] for key, field in PATHS_ONLY_KEYS.items()}) + "\n"
+        else:
+            stdout = "".join(f"{key}: {paths[field]}\n" for key, field in PATHS_ONLY_KEYS.items())
+        return PrereqResult(0, stdout, stderr_text)
+
+    feature_dir = paths["FEATURE_DIR"]
+    try:
+        present = set(feature_docs(Path(feature_dir)))
+    except (FileNotFoundError, NotADirectoryError):
+        return PrereqResult(
+            1,
+            "",
+            stderr_text
+            + f"ERROR: Feature directory not found: {feature_dir}\n"
+            + "Run /twitterkit.specify first to create the feature structure.\n",
+        )
+    if "plan.md" not in present:
+        return PrereqResult(
+            1,
+            "",
+            stderr_text
+            + f"ERROR: plan.md not found in {feature_dir}\n"
+            + "Run /twitterkit.plan first to create the implementation plan.\n",
+        )
+    if require_tasks and "tasks.md" not in present:
+        return PrereqResult(
+            1,
+            "",
+            stderr_text
+            + f"ERROR: tasks.md not found in {feature_dir}\n"
+            + "Run /twitterkit.tasks first to create the task list.\n",
+        )
+
+    checked = list(OPTIONAL_DOCS) + (["tasks.md"] if include_tasks else [])
+    if json_mode:
+        docs = [doc for doc in checked if doc in present]
+        stdout = _compact_json({"FEATURE_DIR": feature_dir, "AVAILABLE_DOCS": docs}) + "\n"
+    else:
+        stdout = f"FEATURE_DIR:{feature_dir}\nAVAILABLE_DOCS:\n"
+        stdout += "".join(f"  {'✓' if doc in present else '✗'} {doc}\n" for doc in checked)
+    return PrereqResult(0, stdout, stderr_text)
+
+
+def run(args: List[str], start: Optional[Path] = None) -> Optional[int]:
+    """Run `twitterify prereqs` without loading the CLI.
+
+    Importing typer, rich and the command modules takes several times as
+    long as the check itself, so the entry point calls this directly. The
+    query goes to `twitterify serve` over its socket when it runs for the
+    repository, and is answered in-process when no daemon answers or the
+    daemon can't answer (an error response, such as an old daemon
+    rejecting the protocol version, or a malformed reply).
+
+    Args:
+        args: Arguments after `prereqs`
+        start: Directory inside the project (default: the current directory)
+
+    Returns:
+        Exit code, or None if an argument needs the full CLI (--help or an
+        unknown option)
+    """
+    if any(arg not in FLAGS for arg in args):
+        return None
+    root = repo_root(Path.cwd() if start is None else start)
+    params = {name: flag in args for flag, name in FLAGS.items()}
+    params["feature"] = os.environ.get("TWITTERKIT_FEATURE", "")
+    try:
+        result = PrereqResult(**request(root, "prereqs", params))
+    except (DaemonError, ValueError, TypeError):
+        result = check_prerequisites(
+            root,
+            json_mode=params["json"],
+            require_tasks=params["require_tasks"],
+            include_tasks=params["include_tasks"],
+            paths_only=params["paths_only"],
+            feature=params["feature"],
+        )
+    # Written verbatim: agents parse this output
+    sys.stderr.write(result.stderr)
+    sys.stdout.write(result.stdout)
+    return result.exit_code
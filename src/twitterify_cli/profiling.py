@@ -0,0 +1,168 @@
+"""Twitter-Init-Kit Profiling - Subprocess Tracing and Phase Timing"""
+
+import json
+import os
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from rich.console import Console
+from rich.table import Table
+
+console = Console(stderr=True)
+
+
+class Profiler:
+    """Collects timed spans for subprocesses, copies, renders and CLI phases.
+
+    Spans are only recorded once the profiler is enabled, so instrumented
+    code paths cost a single attribute check when profiling is off.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a disabled profiler."""
+        self.enabled = False
+        self._events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+    def enable(self) -> None:
+        """Start recording spans, discarding any previous ones."""
+        with self._lock:
+            self._events.clear()
+            self._origin = time.perf_counter()
+            self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording spans."""
+        self.enabled = False
+
+    @contextmanager
+    def span(self, name: str, category: str = "phase", **args: Any) -> Iterator[None]:
+        """Time the enclosed block.
+
+        Args:
+            name: Span name, used to aggregate the summary
+            category: Span category (phase, subprocess, probe, copy, render)
+            **args: Extra details stored with the trace event
+        """
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record(name, category, start, time.perf_counter(), args)
+
+    def run(self, cmd: Sequence[str], category: str = "subprocess", **kwargs: Any) -> subprocess.CompletedProcess:
+        """Run a subprocess inside a span named after its command.
+
+        Args:
+            cmd: Command and arguments (a string when shell=True)
+            category: Span category
+            **kwargs: Passed through to subprocess.run
+
+        Returns:
+            The completed process
+        """
+        if not self.enabled:
+            return subprocess.run(cmd, **kwargs)
+
+        argv = cmd.split() if isinstance(cmd, str) else [str(arg) for arg in cmd]
+        subcommand = next((arg for arg in argv[1:] if not arg.startswith("-")), "")
+        name = f"{argv[0]} {subcommand}".strip()
+        with self.span(name, category, argv=" ".join(argv), cwd=str(kwargs.get("cwd") or "")):
+            return subprocess.run(cmd, **kwargs)
+
+    def _record(self, name: str, category: str, start: float, end: float, args: Dict[str, Any]) -> None:
+        """Store a completed span."""
+        event = {
+            "name": name,
+            "cat": category,
+            "start": start - self._origin,
+            "duration": end - start,
+            "tid": threading.get_ident(),
+            "args": args,
+        }
+        with self._lock:
+            self._events.append(event)
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        """Recorded spans in start order."""
+        with self._lock:
+            return sorted(self._events, key=lambda event: event["start"])
+
+    def summarize(self) -> List[Dict[str, Any]]:
+        """Aggregate spans by category and name.
+
+        Returns:
+            Rows with category, name, count, total and max seconds, slowest first
+        """
+        rows: Dict[tuple, Dict[str, Any]] = {}
+        for event in self.events:
+            key = (event["cat"], event["name"])
+            row = rows.setdefault(key, {"category": key[0], "name": key[1], "count": 0, "total": 0.0, "max": 0.0})
+            row["count"] += 1
+            row["total"] += event["duration"]
+            row["max"] = max(row["max"], event["duration"])
+        return sorted(rows.values(), key=lambda row: row["total"], reverse=True)
+
+    def print_summary(self, wall_time: Optional[float] = None) -> None:
+        """Print the aggregated timing table to stderr.
+
+        Args:
+            wall_time: Total command duration in seconds, if known
+        """
+        title = "Profile"
+        if wall_time is not None:
+            title += f" (wall time {wall_time * 1000:.1f} ms)"
+
+        table = Table(title=title)
+        table.add_column("Category", style="cyan")
+        table.add_column("Name", style="white")
+        table.add_column("Count", justify="right")
+        table.add_column("Total (ms)", justify="right")
+        table.add_column("Max (ms)", justify="right", style="dim")
+
+        for row in self.summarize():
+            table.add_row(
+                row["category"],
+                row["name"],
+                str(row["count"]),
+                f"{row['total'] * 1000:.1f}",
+                f"{row['max'] * 1000:.1f}",
+            )
+
+        console.print(table)
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Write spans as a Chrome trace-event file (chrome://tracing, Perfetto).
+
+        Args:
+            path: Output JSON file
+        """
+        pid = os.getpid()
+        trace_events = [
+            {
+                "name": event["name"],
+                "cat": event["cat"],
+                "ph": "X",
+                "ts": round(event["start"] * 1_000_000, 3),
+                "dur": round(event["duration"] * 1_000_000, 3),
+                "pid": pid,
+                "tid": event["tid"],
+                "args": event["args"],
+            }
+            for event in self.events
+        ]
+        path.write_text(json.dumps({"traceEvents": trace_events, "displayTimeUnit": "ms"}, indent=1))
+        console.print(f"[dim]Trace written to {path}[/dim]")
+
+
+profiler = Profiler()
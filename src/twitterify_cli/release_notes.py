@@ -0,0 +1,237 @@
+"""Twitter-Init-Kit Release Notes - Changelog and Asset List from the Build Manifest"""
+
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .commands.init import AGENT_CONFIG
+from .packager import CHECKSUMS_NAME, MANIFEST_NAME, archive_name, load_manifest
+from .profiling import profiler
+
+REPOSITORY_URL = "https://github.com/agentii-ai/twitter-init-kit"
+
+# Agent key -> product name shown in the notes
+AGENT_NAMES = {
+    "claude": "Claude Code",
+    "cursor-agent": "Cursor Agent",
+    "windsurf": "Windsurf",
+    "gemini": "Google Gemini",
+    "copilot": "GitHub Copilot",
+    "qwen": "Qwen",
+    "opencode": "OpenCode",
+    "codex": "Codex",
+    "kilocode": "KiloCode",
+    "auggie": "Auggie",
+    "codebuddy": "CodeBuddy",
+    "amp": "AMP",
+    "shai": "Shai",
+    "q": "Amazon Q",
+    "bob": "Bob",
+    "roo": "Roo",
+    "qoder": "Qoder",
+}
+
+SCRIPT_NAMES = {"sh": "bash", "ps": "PowerShell"}
+
+
+def changelog(repo_dir: Optional[Path], previous: Optional[str], until: str = "HEAD") -> Optional[List[str]]:
+    """List commit subjects since the previous release with a single git log.
+
+    Args:
+        repo_dir: Repository to read history from (None: current directory)
+        previous: Previous release tag, or None for the first release
+        until: Last commit to include (default: HEAD)
+
+    Returns:
+        Commit subjects, newest first, or None for an initial release (no
+        previous tag, or one git can't resolve)
+    """
+    if not previous:
+        return None
+
+    try:
+        result = profiler.run(
+            ["git", "log", "--no-merges", "--pretty=format:%s", f"{previous}..{until}"],
+            cwd=repo_dir,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+
+    if result.returncode != 0:
+        return None
+    return [line for line in result.stdout.splitlines() if line.strip()]
+
+
+def format_size(size: int) -> str:
+    """Format a byte count for humans (e.g., 45.2 KB)."""
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+def release_variants(manifest: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Select the manifest entries belonging to the manifest's version.
+
+    The manifest also tracks archives of other versions left in the output
+    directory; only the current version's variants are part of the release.
+
+    Args:
+        manifest: Loaded build manifest
+
+    Returns:
+        Variant entries with their archive name, sorted by name
+    """
+    version = manifest.get("version")
+    return [
+        {"name": name, **entry}
+        for name, entry in sorted(manifest.get("variants", {}).items())
+        if name == archive_name(entry.get("agent", ""), entry.get("script", ""), version)
+    ]
+
+
+def render_release_notes(manifest: Dict[str, Any], commits: Optional[List[str]]) -> str:
+    """Render release notes as Markdown.
+
+    Args:
+        manifest: Build manifest of the release directory
+        commits: Changelog entries, or None for an initial release
+
+    Returns:
+        Markdown document
+    """
+    version = manifest["version"]
+    variants = release_variants(manifest)
+    # Agents and scripts since removed from AGENT_CONFIG (older manifests) go last
+    agent_order = {agent: index for index, agent in enumerate(AGENT_CONFIG)}
+    script_order = {script: index for index, script in enumerate(SCRIPT_NAMES)}
+    agents = sorted(
+        {variant["agent"] for variant in variants},
+        key=lambda agent: (agent_order.get(agent, len(agent_order)), agent),
+    )
+    scripts = sorted(
+        {variant["script"] for variant in variants},
+        key=lambda script: (script_order.get(script, len(script_order)), script),
+    )
+    if commits is None:
+        commits = ["Initial release"]
+    elif not commits:
+        commits = ["Template rebuild; no new commits"]
+
+    lines = [
+        f"# Twitter-Kit Templates {version}",
+        "",
+        f"This release contains {len(variants)} template variants for Twitter-Kit, supporting "
+        f"{len(agents)} AI coding agents with {' and '.join(SCRIPT_NAMES.get(s, s) for s in scripts)} scripts.",
+        "",
+        "## What's Included",
+        "",
+        "Each template includes:",
+        "- **Twitter-Kit Constitution**: Campaign-focused principles for Twitter content creation",
+        "- **Workflow Templates**: spec.md, plan.md, tasks.md for campaign planning",
+        "- **Slash Commands**: `/twitterkit.*` commands for campaign management",
+        "- **Scripts**: Automation scripts for Twitter campaign execution",
+        "- **Directory Structure**: Templates extract to `.twitterkit/` folder (enables coexistence with other kits)",
+        "",
+        "## Installation",
+        "",
+        "```bash",
+        "# Install Twitter-Kit CLI",
+        f"uv tool install twitterify-cli --from git+{REPOSITORY_URL}.git",
+        "",
+        "# Initialize new campaign project",
+        "twitterify init my-campaign --ai claude",
+        "```",
+        "",
+        "Or download templates manually from the Assets section below.",
+        "",
+        "## Changelog",
+        "",
+        *(f"- {commit}" for commit in commits),
+        "",
+        "## Supported AI Agents",
+        "",
+        *(
+            f"- {AGENT_NAMES.get(agent, agent)} ({AGENT_CONFIG[agent][0]}/)" if agent in AGENT_CONFIG else f"- {agent}"
+            for agent in agents
+        ),
+        "",
+        "## Template Assets",
+        "",
+        f"{len(variants)} template variants with SHA-256 checksums:",
+        "",
+        "| Archive | Size | SHA-256 |",
+        "|---------|------|---------|",
+        *(f"| {v['name']} | {format_size(v['size'])} | `{v['sha256']}` |" for v in variants),
+        "",
+        "## Verification",
+        "",
+        f"Download the archives with `{CHECKSUMS_NAME}` and `{MANIFEST_NAME}`, then verify them:",
+        "",
+        "```bash",
+        f"sha256sum -c {CHECKSUMS_NAME}",
+        "# or",
+        "twitterify verify .",
+        "```",
+        "",
+        "## Documentation",
+        "",
+        f"- [Quick Start Guide]({REPOSITORY_URL}#-get-started)",
+        f"- [CLI Reference]({REPOSITORY_URL}#%EF%B8%8F-cli-reference)",
+        "",
+        "---",
+        "",
+        "**Note**: Templates create `.twitterkit/` directory structure to enable coexistence with other kit "
+        "variants (spec-kit, pmf-kit, etc.).",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def write_release_notes(
+    release_dir: Path,
+    output: Path,
+    version: str,
+    previous: Optional[str] = None,
+    repo_dir: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """Write release notes for a built release directory.
+
+    Everything about the archives comes from build-manifest.json; the
+    changelog runs up to the commit the manifest records as built.
+
+    Args:
+        release_dir: Directory the release was built into
+        output: Markdown file to write
+        version: Release version; must match the manifest
+        previous: Previous release tag for the changelog
+        repo_dir: Repository to read history from (default: current directory)
+
+    Returns:
+        Summary with variants and commits counts
+
+    Raises:
+        ValueError: If release_dir has no build manifest, or it was built
+            for another version
+    """
+    manifest = load_manifest(release_dir)
+    if "version" not in manifest:
+        raise ValueError(f"No {MANIFEST_NAME} in {release_dir}; run `twitterify release build` first")
+    if manifest["version"] != version:
+        raise ValueError(
+            f"{release_dir} was built for {manifest['version']}, not {version}; "
+            f"run `twitterify release build {version}` first"
+        )
+
+    commit = manifest.get("environment", {}).get("git_commit", "unknown")
+    until = commit if commit != "unknown" else "HEAD"
+    commits = changelog(repo_dir, previous, until)
+
+    output.write_text(render_release_notes(manifest, commits))
+    return {
+        "variants": len(release_variants(manifest)),
+        "commits": len(commits or []),
+    }
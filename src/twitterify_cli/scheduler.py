@@ -0,0 +1,217 @@
+"""Twitter-Init-Kit Scheduler - Task DAG, Critical Path and Parallel Lanes"""
+
+import heapq
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .artifacts import Artifact, Task
+
+# Agents working through tasks.md at once when not given
+DEFAULT_WORKERS = 3
+
+
+class TaskPlanError(Exception):
+    """Raised when tasks.md can't be scheduled (dependency cycle)."""
+
+
+def build_graph(artifact: Artifact, include_done: bool = False) -> Tuple[Dict[str, List[str]], List[str]]:
+    """Build the dependency DAG of a tasks.md.
+
+    Edges come from, in order:
+    - Phases: a task waits for the whole previous phase (its checkpoint),
+      through that phase's last tasks
+    - Sequence: within a phase section (e.g., "### A. Profile"), a task
+      without [P] waits for the previous task without [P]; sections run
+      side by side and [P] tasks float freely
+    - Explicit "depends on T001" / "after T001" references
+
+    Args:
+        artifact: Parsed tasks.md
+        include_done: Also schedule tasks that are checked off; otherwise
+            they're left out and count as satisfied
+
+    Returns:
+        Dependencies of each scheduled task (in document order), and
+        warnings for references to unknown tasks
+    """
+    tasks = [task for task in artifact.tasks if include_done or not task.done]
+    scheduled = {task.id for task in tasks}
+    known = {task.id for task in artifact.tasks}
+    warnings = []
+
+    deps: Dict[str, List[str]] = {}
+    last_sequential: Dict[Tuple[Optional[int], Optional[str]], str] = {}
+    for task in tasks:
+        edges = []
+        if not task.parallel:
+            key = (task.phase, task.section)
+            if key in last_sequential:
+                edges.append(last_sequential[key])
+            last_sequential[key] = task.id
+        for dependency in task.depends:
+            if dependency in scheduled:
+                edges.append(dependency)
+            elif dependency not in known:
+                warnings.append(f"{task.id} depends on unknown task {dependency}")
+        deps[task.id] = list(dict.fromkeys(edge for edge in edges if edge != task.id))
+
+    # Phase checkpoints: tasks nothing else in their phase waits for are the
+    # phase's last ones; the next phase's tasks wait for those
+    phases: Dict[int, List[str]] = {}
+    for task in tasks:
+        if task.phase is not None:
+            phases.setdefault(task.phase, []).append(task.id)
+    numbers = sorted(phases)
+    for previous, number in zip(numbers, numbers[1:]):
+        members = set(phases[previous])
+        awaited = {edge for task_id in members for edge in deps[task_id]}
+        last = [task_id for task_id in phases[previous] if task_id not in awaited]
+        for task_id in phases[number]:
+            deps[task_id] = list(dict.fromkeys(last + deps[task_id]))
+    return deps, warnings
+
+
+def topological_order(deps: Dict[str, List[str]]) -> List[str]:
+    """Order tasks so dependencies come first, keeping document order where free.
+
+    Raises:
+        TaskPlanError: If the dependencies form a cycle
+    """
+    position = {task: index for index, task in enumerate(deps)}
+    dependents: Dict[str, List[str]] = {task: [] for task in deps}
+    remaining = {task: len(edges) for task, edges in deps.items()}
+    for task, edges in deps.items():
+        for edge in edges:
+            dependents[edge].append(task)
+
+    ready = [(position[task], task) for task, count in remaining.items() if count == 0]
+    heapq.heapify(ready)
+    order = []
+    while ready:
+        _, task = heapq.heappop(ready)
+        order.append(task)
+        for dependent in dependents[task]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                heapq.heappush(ready, (position[dependent], dependent))
+
+    if len(order) < len(deps):
+        raise TaskPlanError(f"Dependency cycle: {' → '.join(_cycle(deps, set(deps) - set(order)))}")
+    return order
+
+
+def _cycle(deps: Dict[str, List[str]], blocked: Set[str]) -> List[str]:
+    """One cycle among tasks left unordered, for the error message."""
+    task = min(blocked)
+    path: List[str] = []
+    while task not in path:
+        path.append(task)
+        task = next(edge for edge in deps[task] if edge in blocked)
+    cycle = path[path.index(task):]
+    return list(reversed(cycle)) + [cycle[-1]]
+
+
+def critical_path(deps: Dict[str, List[str]], order: List[str]) -> List[str]:
+    """Longest chain of dependent tasks (each task counts as one step)."""
+    length: Dict[str, int] = {}
+    parent: Dict[str, Optional[str]] = {}
+    for task in order:
+        best = max(deps[task], key=lambda edge: length[edge], default=None)
+        length[task] = 1 + (length[best] if best else 0)
+        parent[task] = best
+    if not order:
+        return []
+
+    task: Optional[str] = max(order, key=lambda item: length[item])
+    path = []
+    while task is not None:
+        path.append(task)
+        task = parent[task]
+    return list(reversed(path))
+
+
+def schedule(deps: Dict[str, List[str]], order: List[str], workers: int) -> List[List[str]]:
+    """Assign tasks to steps for a number of workers (unit-length tasks).
+
+    List scheduling by critical path: at each step the ready tasks with the
+    longest remaining chain go first (document order breaks ties), so the
+    critical path is never delayed while workers are free.
+
+    Args:
+        deps: build_graph() dependencies
+        order: topological_order() result
+        workers: Tasks run at the same time (0: unlimited)
+
+    Returns:
+        Tasks started at each step
+    """
+    position = {task: index for index, task in enumerate(deps)}
+    dependents: Dict[str, List[str]] = {task: [] for task in deps}
+    for task, edges in deps.items():
+        for edge in edges:
+            dependents[edge].append(task)
+
+    # Longest chain from each task to the end of the plan
+    rank: Dict[str, int] = {}
+    for task in reversed(order):
+        rank[task] = 1 + max((rank[dependent] for dependent in dependents[task]), default=0)
+
+    remaining = {task: len(edges) for task, edges in deps.items()}
+    ready = [(-rank[task], position[task], task) for task, count in remaining.items() if count == 0]
+    heapq.heapify(ready)
+    steps = []
+    while ready:
+        count = len(ready) if workers <= 0 else min(workers, len(ready))
+        step = [heapq.heappop(ready)[2] for _ in range(count)]
+        steps.append(step)
+        for task in step:
+            for dependent in dependents[task]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    heapq.heappush(ready, (-rank[dependent], position[dependent], dependent))
+    return steps
+
+
+def _task_entry(task: Task) -> Dict[str, Any]:
+    """What the plan reports about a task."""
+    return {"id": task.id, "text": task.text, "line": task.line, "phase": task.phase, "parallel": task.parallel}
+
+
+def plan_tasks(artifact: Artifact, workers: int = DEFAULT_WORKERS, include_done: bool = False) -> Dict[str, Any]:
+    """Plan the execution of a tasks.md.
+
+    Args:
+        artifact: Parsed tasks.md
+        workers: Agents working at once (0: unlimited, giving the
+            topological levels)
+        include_done: Also schedule tasks that are checked off
+
+    Returns:
+        "tasks" (with dependencies), "critical_path", "steps" and "lanes"
+        (each worker's tasks and their start steps, from 1), "makespan" and
+        "warnings"
+
+    Raises:
+        TaskPlanError: If the dependencies form a cycle
+    """
+    deps, warnings = build_graph(artifact, include_done=include_done)
+    order = topological_order(deps)
+    path = critical_path(deps, order)
+    steps = schedule(deps, order, workers)
+
+    lane_count = workers if workers > 0 else max((len(step) for step in steps), default=0)
+    lanes: List[List[Dict[str, Any]]] = [[] for _ in range(lane_count)]
+    for number, step in enumerate(steps, 1):
+        for lane, task in zip(lanes, step):
+            lane.append({"id": task, "step": number})
+
+    tasks = {task.id: task for task in artifact.tasks}
+    return {
+        "workers": workers,
+        "tasks": [{**_task_entry(tasks[task]), "depends": deps[task]} for task in deps],
+        "edges": sum(len(edges) for edges in deps.values()),
+        "critical_path": {"length": len(path), "tasks": path},
+        "makespan": len(steps),
+        "steps": steps,
+        "lanes": [{"worker": number, "tasks": lane} for number, lane in enumerate(lanes, 1)],
+        "warnings": warnings,
+    }
@@ -0,0 +1,364 @@
+"""Twitter-Init-Kit Smoke Tests - Install and Exercise Every Template Variant"""
+
+import io
+import json
+import os
+import shutil
+import stat
+import subprocess
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .commands.init import AGENT_CONFIG
+from .delta import parse_archive_name
+from .packager import RELEASE_AGENTS, SCRIPT_DIRS, build_archive, compress_source, load_source
+
+# Feature branch the bundled scripts are pointed at through TWITTERKIT_FEATURE
+SMOKE_FEATURE = "001-smoke-test"
+
+# Variants are installed on tmpfs when available, keeping the many small
+# writes of 34 parallel installs off the disk
+SHM_DIR = Path("/dev/shm")
+
+# Script type -> prerequisites script shipped under .twitterkit/scripts/<dir>/
+PREREQUISITES_SCRIPTS = {"sh": "check-prerequisites.sh", "ps": "check-prerequisites.ps1"}
+
+# Seconds before a hung prerequisites script counts as a failure
+SCRIPT_TIMEOUT = 60
+
+# (agent, script, archive path or in-memory archive content)
+Variant = Tuple[str, str, Union[Path, bytes]]
+
+
+def scratch_dir() -> Optional[str]:
+    """Return the directory to install variants under.
+
+    Returns:
+        /dev/shm if it is a writable directory, otherwise None (the system
+        temporary directory)
+    """
+    if SHM_DIR.is_dir() and os.access(SHM_DIR, os.W_OK | os.X_OK):
+        return str(SHM_DIR)
+    return None
+
+
+def extract_archive(archive: Union[Path, bytes], target: Path) -> int:
+    """Extract a template archive the way unzip does.
+
+    zipfile drops permission bits on extract; they are restored from the
+    entries so the bundled scripts stay executable, as they are for users.
+
+    Args:
+        archive: Archive path or content
+        target: Directory to extract into
+
+    Returns:
+        Number of files extracted
+    """
+    count = 0
+    with zipfile.ZipFile(io.BytesIO(archive) if isinstance(archive, bytes) else archive) as zf:
+        for info in zf.infolist():
+            path = Path(zf.extract(info, target))
+            mode = stat.S_IMODE(info.external_attr >> 16)
+            if mode:
+                path.chmod(mode)
+            if not info.is_dir():
+                count += 1
+    return count
+
+
+def prerequisites_command(project: Path, script: str) -> Optional[List[str]]:
+    """Build the command line for a variant's bundled prerequisites script.
+
+    Args:
+        project: Installed project directory
+        script: Script type (sh or ps)
+
+    Returns:
+        Command line running the script with JSON, paths-only output, or None
+        if PowerShell is needed but pwsh is not installed
+    """
+    path = project / ".twitterkit" / "scripts" / SCRIPT_DIRS[script] / PREREQUISITES_SCRIPTS[script]
+    if script == "sh":
+        # Executed directly so a lost executable bit fails the smoke test
+        return [str(path), "--json", "--paths-only"]
+
+    pwsh = shutil.which("pwsh")
+    if not pwsh:
+        return None
+    return [pwsh, "-NoLogo", "-NoProfile", "-NonInteractive", "-File", str(path), "-Json", "-PathsOnly"]
+
+
+def smoke_environment(work_dir: Path) -> Dict[str, str]:
+    """Environment for running bundled scripts inside work_dir.
+
+    Git is stopped from discovering a repository above the install (for
+    example when the temporary directory sits inside a checkout), so the
+    scripts exercise their script-relative REPO_ROOT fallback.
+
+    Args:
+        work_dir: Directory containing the installed variants
+
+    Returns:
+        Environment variables
+    """
+    env = {key: value for key, value in os.environ.items() if key not in ("GIT_DIR", "GIT_WORK_TREE")}
+    env["GIT_CEILING_DIRECTORIES"] = str(work_dir.resolve())
+    env["TWITTERKIT_FEATURE"] = SMOKE_FEATURE
+    return env
+
+
+def check_commands(project: Path, agent: str) -> List[str]:
+    """Check an install has one command file per template in the agent's directory.
+
+    Args:
+        project: Installed project directory
+        agent: Agent key
+
+    Returns:
+        Failure messages (empty if the commands are in place)
+    """
+    agent_dir, extension = AGENT_CONFIG[agent]
+    templates = project / ".twitterkit" / "templates" / "commands"
+    expected = set()
+    for template in templates.glob("*.md"):
+        command = template.stem if template.stem.startswith("twitterkit.") else f"twitterkit.{template.stem}"
+        expected.add(f"{command}{extension}")
+    if not expected:
+        return ["No command templates in .twitterkit/templates/commands/"]
+
+    commands_dir = project / agent_dir
+    if not commands_dir.is_dir():
+        return [f"Command directory {agent_dir}/ not found"]
+
+    actual = {path.name for path in commands_dir.iterdir() if path.is_file()}
+    failures = [f"Missing {agent_dir}/{name}" for name in sorted(expected - actual)]
+    failures += [f"Unexpected {agent_dir}/{name}" for name in sorted(actual - expected)]
+    return failures
+
+
+def check_paths(paths: Dict[str, Any], project: Path) -> List[str]:
+    """Check the paths reported by check-prerequisites point into the install.
+
+    Args:
+        paths: Parsed --json --paths-only output
+        project: Installed project directory
+
+    Returns:
+        Failure messages (empty if every path is as expected)
+    """
+    root = project.resolve()
+    feature_dir = root / "specs" / SMOKE_FEATURE
+    expected: Dict[str, Union[Path, str]] = {
+        "REPO_ROOT": root,
+        "BRANCH": SMOKE_FEATURE,
+        "FEATURE_DIR": feature_dir,
+        "FEATURE_SPEC": feature_dir / "spec.md",
+        "IMPL_PLAN": feature_dir / "plan.md",
+        "TASKS": feature_dir / "tasks.md",
+    }
+
+    failures = []
+    for key, value in expected.items():
+        actual = paths.get(key)
+        if actual is None:
+            failures.append(f"{key} missing from check-prerequisites output")
+        elif (Path(actual).resolve() if isinstance(value, Path) else actual) != value:
+            failures.append(f"{key} is {actual}, expected {value}")
+    return failures
+
+
+def smoke_variant(agent: str, script: str, archive: Union[Path, bytes], work_dir: Path) -> Dict[str, Any]:
+    """Install one variant into its own directory and exercise it.
+
+    Args:
+        agent: Agent key
+        script: Script type (sh or ps)
+        archive: Archive path or content
+        work_dir: Directory to create the install directory in
+
+    Returns:
+        Result with agent, script, project, passed, skipped (reason the
+        script was not run, or None), failures, files, paths and timings
+        in milliseconds (extract, commands, script, total)
+    """
+    started = time.perf_counter()
+    project = Path(tempfile.mkdtemp(prefix=f"{agent}-{script}-", dir=work_dir))
+    result: Dict[str, Any] = {
+        "agent": agent,
+        "script": script,
+        "project": str(project),
+        "passed": False,
+        "skipped": None,
+        "failures": [],
+        "files": 0,
+        "paths": None,
+        "timings": {},
+    }
+    timings = result["timings"]
+
+    def finish() -> Dict[str, Any]:
+        result["passed"] = not result["failures"]
+        timings["total_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return result
+
+    try:
+        result["files"] = extract_archive(archive, project)
+    except (zipfile.BadZipFile, OSError) as e:
+        result["failures"].append(f"Extraction failed: {e}")
+        return finish()
+    timings["extract_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+    step = time.perf_counter()
+    result["failures"] += check_commands(project, agent)
+    timings["commands_ms"] = round((time.perf_counter() - step) * 1000, 1)
+
+    command = prerequisites_command(project, script)
+    if command is None:
+        result["skipped"] = "pwsh not installed"
+        return finish()
+
+    step = time.perf_counter()
+    try:
+        completed = subprocess.run(
+            command,
+            cwd=project,
+            env=smoke_environment(work_dir),
+            capture_output=True,
+            text=True,
+            timeout=SCRIPT_TIMEOUT,
+        )
+    except subprocess.TimeoutExpired:
+        result["failures"].append(f"{PREREQUISITES_SCRIPTS[script]} timed out after {SCRIPT_TIMEOUT}s")
+        return finish()
+    except OSError as e:
+        result["failures"].append(f"Cannot run {PREREQUISITES_SCRIPTS[script]}: {e}")
+        return finish()
+    finally:
+        timings["script_ms"] = round((time.perf_counter() - step) * 1000, 1)
+
+    if completed.returncode != 0:
+        detail = completed.stderr.strip().splitlines()[-1:] or ["no output"]
+        result["failures"].append(
+            f"{PREREQUISITES_SCRIPTS[script]} exited with {completed.returncode}: {detail[0]}"
+        )
+        return finish()
+
+    lines = completed.stdout.strip().splitlines()
+    try:
+        result["paths"] = json.loads(lines[-1])
+    except (IndexError, json.JSONDecodeError):
+        result["failures"].append(f"{PREREQUISITES_SCRIPTS[script]} did not print JSON: {completed.stdout!r}")
+        return finish()
+
+    result["failures"] += check_paths(result["paths"], project)
+    return finish()
+
+
+def archive_variants(
+    archives: Iterable[Path],
+    agents: Optional[Iterable[str]] = None,
+    scripts: Optional[Iterable[str]] = None,
+) -> List[Variant]:
+    """Turn release archives into smoke test variants.
+
+    Args:
+        archives: Template archives
+        agents: Only include these agents (default: all)
+        scripts: Only include these script types (default: all)
+
+    Returns:
+        Variants in archive order
+
+    Raises:
+        ValueError: If an archive name is not a template archive name
+    """
+    agents = set(agents) if agents else None
+    scripts = set(scripts) if scripts else None
+    variants = []
+    for path in archives:
+        parsed = parse_archive_name(path.name)
+        if not parsed:
+            raise ValueError(f"Not a template archive name: {path.name}")
+        agent, script, _ = parsed
+        if agent not in AGENT_CONFIG:
+            raise ValueError(f"Unknown agent in {path.name}: {agent}")
+        if (agents is None or agent in agents) and (scripts is None or script in scripts):
+            variants.append((agent, script, path))
+    return variants
+
+
+def source_variants(
+    source_dir: Path,
+    agents: Optional[Iterable[str]] = None,
+    scripts: Optional[Iterable[str]] = None,
+) -> List[Variant]:
+    """Build variants in memory from a .twitterkit/ directory.
+
+    Args:
+        source_dir: Path to the .twitterkit/ directory
+        agents: Agents to build (default: all release agents)
+        scripts: Script types to build (default: sh and ps)
+
+    Returns:
+        Variants with in-memory archive content
+
+    Raises:
+        ValueError: If an agent or script type is unknown
+    """
+    agents = list(agents or RELEASE_AGENTS)
+    scripts = list(scripts or SCRIPT_DIRS)
+
+    unknown = [agent for agent in agents if agent not in AGENT_CONFIG]
+    unknown += [script for script in scripts if script not in SCRIPT_DIRS]
+    if unknown:
+        raise ValueError(f"Unknown agent or script type: {', '.join(unknown)}")
+
+    source = load_source(source_dir)
+    shared = compress_source(source)
+    return [
+        (agent, script, build_archive(source, agent, script, shared))
+        for agent in agents
+        for script in scripts
+    ]
+
+
+def smoke_test(
+    variants: List[Variant],
+    jobs: Optional[int] = None,
+    work_dir: Optional[Path] = None,
+) -> List[Dict[str, Any]]:
+    """Install and exercise variants concurrently, each in its own directory.
+
+    Each variant spends most of its time waiting on a subprocess, so a
+    thread pool runs them in parallel.
+
+    Args:
+        variants: Variants to test
+        jobs: Number of variants to run at once (default: CPU count)
+        work_dir: Directory to install into and keep afterwards (default: a
+            temporary directory on tmpfs, removed when done)
+
+    Returns:
+        One result per variant (see smoke_variant), in variant order
+    """
+    if not variants:
+        return []
+
+    workers = min(jobs or os.cpu_count() or 1, len(variants))
+
+    def run(root: Path) -> List[Dict[str, Any]]:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(smoke_variant, agent, script, archive, root) for agent, script, archive in variants]
+            return [future.result() for future in futures]
+
+    if work_dir is not None:
+        work_dir.mkdir(parents=True, exist_ok=True)
+        return run(work_dir)
+
+    with tempfile.TemporaryDirectory(prefix="twitterify-smoke-", dir=scratch_dir()) as tmpdir:
+        return run(Path(tmpdir))
@@ -6,6 +6,8 @@ from typing import Dict, List, Optional
 
 from rich.console import Console
 
+from .profiling import profiler
+
 console = Console()
 
 
@@ -41,6 +43,11 @@ class TemplateEngine:
             FileNotFoundError: If template file doesn't exist
             ValueError: If validation fails (missing variables)
         """
+        with profiler.span("render", "render", template=template_path.name):
+            return self._render(template_path, variables, validate)
+
+    def _render(self, template_path: Path, variables: Dict[str, str], validate: bool) -> str:
+        """Render a template; see render_template."""
         if not template_path.exists():
             raise FileNotFoundError(f"Template not found: {template_path}")
 
@@ -0,0 +1,216 @@
+"""Twitter-Init-Kit Validator - Release Template Quality Checks"""
+
+import os
+import re
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .packager import AGENT_EXTRA_FILES, SCRIPT_DIRS
+
+REQUIRED_FILES = [
+    ".twitterkit/memory/constitution.md",
+    ".twitterkit/templates/spec-template.md",
+    ".twitterkit/templates/plan-template.md",
+    ".twitterkit/templates/tasks-template.md",
+]
+REQUIRED_DIRS = ["memory", "scripts", "templates"]
+CONSTITUTION = ".twitterkit/memory/constitution.md"
+COMMAND_TEMPLATES = ".twitterkit/templates/commands/"
+
+# Agent-side files that are not slash commands
+EXTRA_FILES = {path for files in AGENT_EXTRA_FILES.values() for path in files}
+
+COMMAND_SUFFIXES = (".md", ".toml")
+SPECKIT_REFERENCE = b"/speckit."
+SCRIPT_TYPE_PATTERN = re.compile(r"-(sh|ps)-")
+
+
+def _check(name: str, passed: bool, message: str, warning: bool = False) -> Dict[str, Any]:
+    """Build a check result."""
+    return {"name": name, "passed": passed, "warning": warning, "message": message}
+
+
+def _names(names: List[str], limit: int = 5) -> str:
+    """Join member names for a message, truncating long lists."""
+    shown = ", ".join(sorted(names)[:limit])
+    if len(names) > limit:
+        shown += f" (+{len(names) - limit} more)"
+    return shown
+
+
+def validate_archive(path: Path) -> Dict[str, Any]:
+    """Validate one template archive in a single pass over its members.
+
+    Every member is read exactly once, which also verifies its CRC, and the
+    data is fed to all checks that need it: command namespace and count,
+    required files, /speckit. references, directory structure, constitution
+    content and script consistency.
+
+    Args:
+        path: Path to the template ZIP
+
+    Returns:
+        Result with archive name, passed flag and a list of checks
+    """
+    result: Dict[str, Any] = {"archive": path.name, "passed": False, "checks": []}
+    checks: List[Dict[str, Any]] = result["checks"]
+
+    members = set()
+    command_templates = 0
+    command_files: List[str] = []
+    misnamed: List[str] = []
+    speckit_refs: List[str] = []
+    constitution: Optional[bytes] = None
+
+    try:
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                name = info.filename
+                members.add(name)
+                if info.is_dir():
+                    continue
+                data = archive.read(info)
+
+                if name.startswith(".twitterkit/"):
+                    if name == CONSTITUTION:
+                        constitution = data
+                    elif name.startswith(COMMAND_TEMPLATES) and name.endswith(".md"):
+                        command_templates += 1
+                    continue
+
+                if name in EXTRA_FILES or not name.endswith(COMMAND_SUFFIXES):
+                    continue
+                command_files.append(name)
+                if not name.rsplit("/", 1)[-1].startswith("twitterkit."):
+                    misnamed.append(name)
+                if SPECKIT_REFERENCE in data:
+                    speckit_refs.append(name)
+    except (zipfile.BadZipFile, OSError, EOFError) as e:
+        checks.append(_check("zip_integrity", False, f"ZIP file is corrupted or invalid: {e}"))
+        return result
+
+    checks.append(_check("zip_integrity", True, "ZIP file integrity verified"))
+
+    # Namespace and command count
+    if not command_files:
+        checks.append(_check("namespace", False, "No agent command files found"))
+    elif misnamed:
+        checks.append(_check("namespace", False, f"Command files without twitterkit.* naming: {_names(misnamed)}"))
+    elif command_templates and len(command_files) != command_templates:
+        checks.append(
+            _check(
+                "namespace",
+                False,
+                f"Command file count: found {len(command_files)}, expected {command_templates}",
+            )
+        )
+    else:
+        checks.append(_check("namespace", True, f"{len(command_files)} command files use twitterkit.* namespace"))
+
+    # Required files
+    missing = [name for name in REQUIRED_FILES if name not in members]
+    if missing:
+        checks.append(_check("required_files", False, f"Missing required files: {_names(missing)}"))
+    else:
+        checks.append(_check("required_files", True, "All required files present"))
+
+    # /speckit. references in command files
+    if speckit_refs:
+        checks.append(
+            _check("speckit_references", False, f"/speckit.* references in: {_names(speckit_refs)}")
+        )
+    else:
+        checks.append(_check("speckit_references", True, "No /speckit.* references in command files"))
+
+    # Directory structure (directory entries are optional in a ZIP)
+    missing_dirs = [
+        directory
+        for directory in REQUIRED_DIRS
+        if not any(name.startswith(f".twitterkit/{directory}/") for name in members)
+    ]
+    if missing_dirs:
+        checks.append(
+            _check("directory_structure", False, f"Missing .twitterkit/ directories: {', '.join(missing_dirs)}")
+        )
+    else:
+        checks.append(_check("directory_structure", True, "Directory structure is correct"))
+
+    # Constitution content
+    if constitution is None:
+        checks.append(_check("constitution", False, "Constitution file not found"))
+    elif b"twitter" not in constitution.lower():
+        checks.append(_check("constitution", False, "Constitution doesn't appear to be twitter-focused"))
+    else:
+        checks.append(_check("constitution", True, "Constitution is twitter-focused"))
+
+    # Script consistency
+    match = SCRIPT_TYPE_PATTERN.search(path.name)
+    if not match:
+        checks.append(_check("script_consistency", True, "Could not determine script type from filename", warning=True))
+    else:
+        script = match.group(1)
+        other = SCRIPT_DIRS["ps" if script == "sh" else "sh"]
+        if not any(name.startswith(f".twitterkit/scripts/{SCRIPT_DIRS[script]}/") for name in members):
+            checks.append(
+                _check(
+                    "script_consistency",
+                    False,
+                    f"Script type is '{script}' but no {SCRIPT_DIRS[script]}/ scripts directory found",
+                )
+            )
+        elif any(name.startswith(f".twitterkit/scripts/{other}/") for name in members):
+            checks.append(
+                _check(
+                    "script_consistency",
+                    True,
+                    f"Script type is '{script}' but {other}/ directory found (should not exist)",
+                    warning=True,
+                )
+            )
+        else:
+            checks.append(_check("script_consistency", True, f"Script consistency check passed ({script})"))
+
+    result["passed"] = all(check["passed"] for check in checks)
+    return result
+
+
+def find_archives(path: Path) -> List[Path]:
+    """Resolve a ZIP file or a directory of ZIPs to archive paths.
+
+    Args:
+        path: ZIP file or directory
+
+    Returns:
+        Sorted archive paths
+
+    Raises:
+        ValueError: If path is neither a ZIP file nor a directory
+    """
+    if path.is_file() and path.suffix == ".zip":
+        return [path]
+    if path.is_dir():
+        return sorted(p for p in path.glob("*.zip") if p.is_file())
+    raise ValueError(f"Input must be a ZIP file or directory containing ZIPs: {path}")
+
+
+def validate_archives(archives: List[Path], jobs: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Validate archives concurrently.
+
+    Decompression releases the GIL, so a thread pool keeps every core busy
+    without copying archives between processes.
+
+    Args:
+        archives: Archive paths
+        jobs: Number of worker threads (default: CPU count + 4, at most one per archive)
+
+    Returns:
+        One result per archive, in input order
+    """
+    if not archives:
+        return []
+
+    workers = min(jobs or (os.cpu_count() or 1) + 4, len(archives))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(validate_archive, archives))
@@ -0,0 +1,485 @@
+"""Twitter-Init-Kit Watch - Incremental Updates on File Changes"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .agent_context import update_agent_context
+from .commands.init import AGENT_CONFIG, command_file_name
+from .packager import RELEASE_AGENTS
+from .workspace import SpecsIndex
+
+COMMAND_TEMPLATES = Path(".twitterkit") / "templates" / "commands"
+MEMORY_DIR = Path(".twitterkit") / "memory"
+
+# Trees watched for changes, relative to the project root
+WATCH_TARGETS = (Path("specs"), Path(".twitterkit") / "templates", MEMORY_DIR)
+
+DEFAULT_DEBOUNCE = 0.2
+DEFAULT_POLL_INTERVAL = 1.0
+
+# Longest a burst of changes can postpone handling
+MAX_DEBOUNCE_DELAY = 2.0
+
+# inotify(7) constants
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+TREE_MASK = (
+    IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+)
+ANCHOR_MASK = IN_CREATE | IN_MOVED_TO | IN_ONLYDIR
+
+EVENT_HEADER = struct.Struct("iIII")
+
+
+class PollingWatcher:
+    """Detects changes by comparing stat snapshots of the watched trees."""
+
+    def __init__(self, root: Path, targets: Iterable[Path] = WATCH_TARGETS, interval: float = DEFAULT_POLL_INTERVAL):
+        """Take the initial snapshot.
+
+        Args:
+            root: Project root
+            targets: Directories to watch, relative to root
+            interval: Seconds between snapshots
+        """
+        self.root = root
+        self.targets = list(targets)
+        self.interval = interval
+        self.snapshot = self._snapshot()
+
+    def _snapshot(self) -> Dict[Path, Tuple[int, int, bool]]:
+        """(mtime_ns, size, is_dir) of every file and directory under the targets."""
+        snapshot: Dict[Path, Tuple[int, int, bool]] = {}
+        for target in self.targets:
+            if (self.root / target).is_dir():
+                snapshot[target] = (0, 0, True)
+        stack = [self.root / target for target in self.targets]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            info = entry.stat(follow_symlinks=False)
+                        except FileNotFoundError:
+                            continue
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                        snapshot[Path(entry.path).relative_to(self.root)] = (info.st_mtime_ns, info.st_size, is_dir)
+                        if is_dir:
+                            stack.append(Path(entry.path))
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+        return snapshot
+
+    def wait(self, timeout: Optional[float]) -> Set[Path]:
+        """Wait for changes.
+
+        Args:
+            timeout: Seconds to wait (None: until something changes)
+
+        Returns:
+            Changed paths relative to the root (empty on timeout); directories
+            are only reported when added or removed, since their contents are
+            reported individually
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = self.interval if deadline is None else min(self.interval, max(deadline - time.monotonic(), 0))
+            time.sleep(delay)
+            snapshot = self._snapshot()
+            changed = set()
+            for path in snapshot.keys() | self.snapshot.keys():
+                old, new = self.snapshot.get(path), snapshot.get(path)
+                if old != new and not (old and new and old[2] and new[2]):
+                    changed.add(path)
+            self.snapshot = snapshot
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+class InotifyWatcher:
+    """Linux inotify watches on every directory of the watched trees.
+
+    inotify isn't recursive, so directories created later get their own
+    watch (their contents are reported as changed, since files may appear
+    before the watch does). The project root and .twitterkit/ are watched
+    for targets that don't exist yet.
+    """
+
+    def __init__(self, root: Path, targets: Iterable[Path] = WATCH_TARGETS):
+        """Create the inotify instance and add the initial watches.
+
+        Args:
+            root: Project root
+            targets: Directories to watch, relative to root
+
+        Raises:
+            OSError: If inotify is unavailable or watches can't be added
+        """
+        if not sys.platform.startswith("linux"):
+            raise OSError(errno.ENOSYS, "inotify is only available on Linux")
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        if not hasattr(self.libc, "inotify_init1"):
+            raise OSError(errno.ENOSYS, "inotify is not available")
+        self.libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+
+        self.root = root
+        self.targets = list(targets)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs: Dict[int, Path] = {}
+        self.anchors: Dict[int, Path] = {}
+        try:
+            for anchor in {parent for target in self.targets for parent in target.parents}:
+                self._add_anchor(anchor)
+            for target in self.targets:
+                self._add_tree(target)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_watch(self, rel: Path, mask: int) -> int:
+        """Add one watch, returning its descriptor."""
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(self.root / rel), mask)
+        if wd < 0:
+            code = ctypes.get_errno()
+            raise OSError(code, os.strerror(code), str(self.root / rel))
+        return wd
+
+    def _add_anchor(self, rel: Path) -> None:
+        """Watch a directory for targets being created in it."""
+        try:
+            self.anchors[self._add_watch(rel, ANCHOR_MASK)] = rel
+        except FileNotFoundError:
+            pass
+
+    def _add_tree(self, rel: Path) -> Set[Path]:
+        """Watch a directory and its subdirectories.
+
+        Returns:
+            Everything found under it
+        """
+        found: Set[Path] = set()
+        stack = [rel]
+        while stack:
+            directory = stack.pop()
+            try:
+                self.dirs[self._add_watch(directory, TREE_MASK)] = directory
+                with os.scandir(self.root / directory) as entries:
+                    for entry in entries:
+                        path = directory / entry.name
+                        found.add(path)
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(path)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+        return found
+
+    def _read_events(self) -> Set[Path]:
+        """Drain pending events into a set of changed paths."""
+        changed: Set[Path] = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+                name = data[offset + EVENT_HEADER.size : offset + EVENT_HEADER.size + length].rstrip(b"\0")
+                offset += EVENT_HEADER.size + length
+                changed |= self._handle_event(wd, mask, os.fsdecode(name))
+
+    def _handle_event(self, wd: int, mask: int, name: str) -> Set[Path]:
+        """Translate one event into changed paths, updating watches."""
+        if mask & IN_Q_OVERFLOW:
+            # Events were lost: report every target so they are resynced
+            return set(self.targets)
+        if mask & IN_IGNORED:
+            self.dirs.pop(wd, None)
+            self.anchors.pop(wd, None)
+            return set()
+
+        if wd in self.anchors:
+            path = self.anchors[wd] / name if name else self.anchors[wd]
+            changed: Set[Path] = set()
+            if any(path in target.parents for target in self.targets):
+                self._add_anchor(path)
+            for target in self.targets:
+                if (target == path or path in target.parents) and target not in self.dirs.values():
+                    if (self.root / target).is_dir():
+                        changed |= {target} | self._add_tree(target)
+            return changed
+
+        directory = self.dirs.get(wd)
+        if directory is None:
+            return set()
+        path = directory / name if name else directory
+        changed = {path}
+        if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+            changed |= self._add_tree(path)
+        return changed
+
+    def wait(self, timeout: Optional[float]) -> Set[Path]:
+        """Wait for changes.
+
+        Args:
+            timeout: Seconds to wait (None: until something changes)
+
+        Returns:
+            Changed paths relative to the root (empty on timeout)
+        """
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        return self._read_events() if readable else set()
+
+    def close(self) -> None:
+        """Close the inotify instance (removing every watch)."""
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def open_watcher(
+    root: Path,
+    polling: bool = False,
+    interval: float = DEFAULT_POLL_INTERVAL,
+) -> Union[PollingWatcher, InotifyWatcher]:
+    """Watch the project with inotify, falling back to polling.
+
+    Args:
+        root: Project root
+        polling: Always poll
+        interval: Seconds between polls
+
+    Returns:
+        InotifyWatcher or PollingWatcher
+    """
+    if not polling:
+        try:
+            return InotifyWatcher(root)
+        except OSError:
+            pass
+    return PollingWatcher(root, interval=interval)
+
+
+def installed_agents(root: Path) -> List[str]:
+    """Agents with twitterkit commands installed in the project."""
+    agents = []
+    for agent in RELEASE_AGENTS:
+        try:
+            with os.scandir(root / AGENT_CONFIG[agent][0]) as entries:
+                if any(entry.name.startswith("twitterkit.") for entry in entries):
+                    agents.append(agent)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    return agents
+
+
+def _command_template(name: str) -> bool:
+    """Whether a file in the command templates directory is installed by init."""
+    return name.startswith("twitterkit.") and name.endswith(".md")
+
+
+class ChangeHandler:
+    """Applies a batch of changed paths: only the affected state is updated.
+
+    - specs/: the specs index is refreshed and touched features rescanned
+    - .twitterkit/templates/commands/: changed templates are installed
+      for each installed agent as init does (files are written only if
+      they differ, and never over local edits)
+    - .twitterkit/memory/ and plan.md files: the configured agents' context
+      files are updated (again only if they differ)
+    """
+
+    def __init__(self, root: Path):
+        """Open the specs index and remember the current command templates.
+
+        Args:
+            root: Project root
+        """
+        self.root = root
+        self.index = SpecsIndex(root)
+        self.templates: Dict[str, bytes] = {}
+        for entry in self._templates():
+            try:
+                self.templates[entry.name] = Path(entry.path).read_bytes()
+            except FileNotFoundError:
+                continue
+
+    def close(self) -> None:
+        """Close the specs index."""
+        self.index.close()
+
+    def __enter__(self) -> "ChangeHandler":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def apply(self, changes: Set[Path]) -> Dict[str, List[str]]:
+        """Update what the changed paths affect.
+
+        Args:
+            changes: Changed paths relative to the root
+
+        Returns:
+            "features" rescanned, "commands" written or removed,
+            "conflicts" (command files edited locally, left alone) and
+            "contexts" regenerated, as root-relative paths or names
+        """
+        features: Set[str] = set()
+        templates: Set[str] = set()
+        memory = False
+        for path in changes:
+            parts = path.parts
+            if parts[:1] == ("specs",):
+                features.add(parts[1] if len(parts) > 1 else "")
+                if path.name == "plan.md" or len(parts) <= 2:
+                    memory = True
+            elif path == COMMAND_TEMPLATES.parent:
+                # The whole tree appeared or events were lost
+                templates |= {entry.name for entry in self._templates()}
+            elif path.parent == COMMAND_TEMPLATES and _command_template(path.name):
+                templates.add(path.name)
+            elif parts[:2] == MEMORY_DIR.parts:
+                memory = True
+
+        result: Dict[str, List[str]] = {"features": [], "commands": [], "conflicts": [], "contexts": []}
+        if features:
+            self.index.refresh()
+            if "" in features:
+                features = {feature["name"] for feature in self.index.features()}
+            for name in sorted(features):
+                self.index.feature(name)
+            result["features"] = sorted(features)
+        if templates:
+            result["commands"], result["conflicts"] = self.render(sorted(templates))
+        if memory:
+            updated = update_agent_context(self.root)
+            result["contexts"] = [entry["path"] for entry in updated if entry["status"] != "unchanged"]
+        return result
+
+    def _templates(self) -> List[os.DirEntry]:
+        """Command template files."""
+        try:
+            with os.scandir(self.root / COMMAND_TEMPLATES) as entries:
+                return [entry for entry in entries if _command_template(entry.name) and entry.is_file()]
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+
+    def render(self, names: List[str]) -> Tuple[List[str], List[str]]:
+        """Install changed command templates for every installed agent.
+
+        Command files are what init installs: copies of the templates under
+        the agent's file name. A command file is only replaced or removed
+        while it still matches the template's previous content (or is
+        absent); files edited locally are reported as conflicts and left
+        alone.
+
+        Args:
+            names: Template file names in .twitterkit/templates/commands/
+
+        Returns:
+            Command files written or removed, and command files in conflict
+        """
+        agents = installed_agents(self.root)
+        touched: List[str] = []
+        conflicts: List[str] = []
+        for name in names:
+            previous = self.templates.get(name)
+            try:
+                content: Optional[bytes] = (self.root / COMMAND_TEMPLATES / name).read_bytes()
+            except FileNotFoundError:
+                content = None
+            for agent in agents:
+                commands_dir, file_ext = AGENT_CONFIG[agent]
+                path = f"{commands_dir}/{command_file_name(name, file_ext)}"
+                target = self.root / path
+                try:
+                    current: Optional[bytes] = target.read_bytes()
+                except FileNotFoundError:
+                    current = None
+                if current == content:
+                    continue
+                if current is not None and current != previous:
+                    conflicts.append(path)
+                    continue
+                if content is None:
+                    target.unlink()
+                else:
+                    target.write_bytes(content)
+                touched.append(path)
+            if content is None:
+                self.templates.pop(name, None)
+            else:
+                self.templates[name] = content
+        return touched, conflicts
+
+
+def watch(
+    root: Path,
+    on_batch: Callable[[Dict[str, List[str]]], None],
+    debounce: float = DEFAULT_DEBOUNCE,
+    polling: bool = False,
+    interval: float = DEFAULT_POLL_INTERVAL,
+    stop: Callable[[], bool] = lambda: False,
+    on_ready: Optional[Callable[[str], None]] = None,
+) -> None:
+    """Watch the project and apply debounced batches of changes.
+
+    Args:
+        root: Project root
+        on_batch: Called with ChangeHandler.apply() results for each batch
+            that changed something
+        debounce: Seconds without events that end a batch
+        polling: Poll instead of using inotify
+        interval: Seconds between polls
+        stop: Checked between batches; watching ends when it returns True
+        on_ready: Called with the backend in use ("inotify" or "polling")
+            once watching has started
+    """
+    watcher = open_watcher(root, polling=polling, interval=interval)
+    try:
+        with ChangeHandler(root) as handler:
+            if on_ready:
+                on_ready("inotify" if isinstance(watcher, InotifyWatcher) else "polling")
+            while not stop():
+                changes = watcher.wait(0.5)
+                if not changes:
+                    continue
+                deadline = time.monotonic() + MAX_DEBOUNCE_DELAY
+                while time.monotonic() < deadline:
+                    more = watcher.wait(debounce)
+                    if not more:
+                        break
+                    changes |= more
+                result = handler.apply(changes)
+                if any(result.values()):
+                    on_batch(result)
+    finally:
+        watcher.close()
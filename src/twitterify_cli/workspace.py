@@ -0,0 +1,445 @@
+"""Twitter-Init-Kit Workspace - Repository Paths and Specs Index"""
+
+import json
+import os
+import re
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Local, self-ignoring state under .twitterkit/ (never packaged for release)
+STATE_DIR = Path(".twitterkit") / "state"
+INDEX_NAME = "specs.sqlite"
+INDEX_FORMAT = 1
+
+# Documents tracked per feature directory, in check-prerequisites order
+FEATURE_DOCS = ("spec.md", "plan.md", "tasks.md", "research.md", "data-model.md", "quickstart.md")
+CONTRACTS_DIR = "contracts"
+
+# NNN- prefix shared by feature branches and their specs/ directories
+FEATURE_PATTERN = re.compile(r"^(\d{3})-")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS features (
+    name TEXT PRIMARY KEY,
+    prefix TEXT,
+    mtime_ns INTEGER NOT NULL,
+    contracts_mtime_ns INTEGER,
+    docs TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS features_prefix ON features (prefix);
+"""
+
+
+def ensure_state_dir(root: Path) -> Path:
+    """Create .twitterkit/state/ with a .gitignore that ignores everything in it.
+
+    Args:
+        root: Project root
+
+    Returns:
+        State directory
+    """
+    state_dir = root / STATE_DIR
+    state_dir.mkdir(parents=True, exist_ok=True)
+    gitignore = state_dir / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text("# Local twitterify state\n*\n")
+    return state_dir
+
+
+def _open_db(database: str, schema: str, version: int) -> sqlite3.Connection:
+    """Connect and make sure the schema is current, emptying it on a format change."""
+    # Not tied to one thread: the serve daemon shares connections across
+    # handler threads, serializing access itself
+    conn = sqlite3.connect(database, timeout=5, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    with conn:
+        conn.executescript(schema)
+        row = conn.execute("SELECT value FROM meta WHERE key = 'format'").fetchone()
+        if row is None or row["value"] != str(version):
+            tables = [row["name"] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+            for table in tables:
+                conn.execute(f'DELETE FROM "{table}"')
+            conn.execute("INSERT INTO meta VALUES ('format', ?)", (str(version),))
+    return conn
+
+
+def open_state_db(
+    root: Path,
+    name: str,
+    schema: str,
+    version: int,
+    path: Optional[Path] = None,
+) -> sqlite3.Connection:
+    """Open (or create) a SQLite database in .twitterkit/state/.
+
+    Args:
+        root: Project root
+        name: Database file name in the state directory
+        schema: CREATE ... IF NOT EXISTS statements, including a meta
+            (key, value) table
+        version: Format of the contents; a database of another format is
+            emptied
+        path: Database file to use instead
+
+    Returns:
+        Connection; an in-memory database is used if the file can't be
+        written or the project has no .twitterkit/ directory, and a corrupt
+        file is recreated
+    """
+    if path is None and not (root / ".twitterkit").is_dir():
+        return _open_db(":memory:", schema, version)
+    try:
+        if path is None:
+            path = ensure_state_dir(root) / name
+        return _open_db(str(path), schema, version)
+    except (OSError, sqlite3.OperationalError):
+        # Read-only checkout or locked database: use memory instead
+        return _open_db(":memory:", schema, version)
+    except sqlite3.DatabaseError:
+        # Not a database (e.g., truncated): start over
+        try:
+            path.unlink(missing_ok=True)
+            return _open_db(str(path), schema, version)
+        except (OSError, sqlite3.Error):
+            return _open_db(":memory:", schema, version)
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Modification time of a path in nanoseconds, or None if missing."""
+    try:
+        return path.stat().st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def feature_docs(feature_dir: Path) -> List[str]:
+    """List the documents present in a feature directory with one scandir.
+
+    Args:
+        feature_dir: Feature directory under specs/
+
+    Returns:
+        Documents in FEATURE_DOCS order, followed by "contracts/" if
+        contracts/ exists and is not empty
+
+    Raises:
+        FileNotFoundError: If the directory doesn't exist
+        NotADirectoryError: If the path isn't a directory
+    """
+    files = set()
+    has_contracts = False
+    with os.scandir(feature_dir) as entries:
+        for entry in entries:
+            if entry.name == CONTRACTS_DIR and entry.is_dir():
+                with os.scandir(entry.path) as contracts:
+                    has_contracts = any(True for _ in contracts)
+            elif entry.is_file():
+                files.add(entry.name)
+    docs = [doc for doc in FEATURE_DOCS if doc in files]
+    if has_contracts:
+        docs.append(f"{CONTRACTS_DIR}/")
+    return docs
+
+
+def find_git_dir(start: Path) -> Optional[Tuple[Path, Path]]:
+    """Find the enclosing git work tree without running git.
+
+    Linked worktrees have a .git file pointing at their git directory.
+
+    Args:
+        start: Directory to start from
+
+    Returns:
+        (work tree root, git directory), or None outside a repository
+    """
+    start = start.resolve()
+    for directory in (start, *start.parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            return directory, dot_git
+        if dot_git.is_file():
+            content = dot_git.read_text().strip()
+            if content.startswith("gitdir:"):
+                return directory, (directory / content[len("gitdir:"):].strip()).resolve()
+    return None
+
+
+def head_branch(git_dir: Path) -> Optional[str]:
+    """Read the checked-out branch from HEAD, like `git rev-parse --abbrev-ref HEAD`.
+
+    Args:
+        git_dir: Git directory (.git, or a worktree's git directory)
+
+    Returns:
+        Branch name, "HEAD" when detached, or None when HEAD can't be read
+        or points at a branch without commits
+    """
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+    except OSError:
+        return None
+    if not head.startswith("ref:"):
+        return "HEAD"
+
+    ref = head[len("ref:"):].strip()
+    common_dir = git_dir
+    try:
+        common_dir = (git_dir / (git_dir / "commondir").read_text().strip()).resolve()
+    except OSError:
+        pass
+
+    if not (common_dir / ref).is_file():
+        try:
+            packed = (common_dir / "packed-refs").read_text()
+        except OSError:
+            return None
+        if not any(line.endswith(f" {ref}") for line in packed.splitlines()):
+            return None
+    return ref.removeprefix("refs/heads/")
+
+
+def repo_root(start: Path) -> Path:
+    """Find the project root.
+
+    Args:
+        start: Directory to start from
+
+    Returns:
+        The git work tree root, else the nearest directory containing
+        .twitterkit/, else start itself
+    """
+    git = find_git_dir(start)
+    if git:
+        return git[0]
+    start = start.resolve()
+    for directory in (start, *start.parents):
+        if (directory / ".twitterkit").is_dir():
+            return directory
+    return start
+
+
+class SpecsIndex:
+    """SQLite index of specs/ feature directories, refreshed from mtimes.
+
+    Which directories exist is revalidated with one stat of specs/; each
+    feature's documents are revalidated with a stat of its directory (and
+    contracts/) when it is looked up. Only directories whose mtime changed
+    are rescanned.
+    """
+
+    def __init__(self, root: Path, path: Optional[Path] = None):
+        """Open (or create) the index.
+
+        Args:
+            root: Project root
+            path: Database file (default: .twitterkit/state/specs.sqlite);
+                an in-memory index is used if it can't be written or the
+                project has no .twitterkit/ directory
+        """
+        self.root = root
+        self.specs_dir = root / "specs"
+        self.conn = open_state_db(root, INDEX_NAME, SCHEMA, INDEX_FORMAT, path)
+        self.refresh()
+
+    def close(self) -> None:
+        """Close the database."""
+        self.conn.close()
+
+    def __enter__(self) -> "SpecsIndex":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def refresh(self) -> None:
+        """Sync the set of feature directories if specs/ changed."""
+        specs_mtime = str(_mtime_ns(self.specs_dir))
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'specs_mtime_ns'").fetchone()
+        if row is not None and row["value"] == specs_mtime:
+            return
+
+        names = set()
+        try:
+            with os.scandir(self.specs_dir) as entries:
+                names = {entry.name for entry in entries if entry.is_dir()}
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+
+        with self.conn:
+            indexed = {row["name"] for row in self.conn.execute("SELECT name FROM features")}
+            self.conn.executemany("DELETE FROM features WHERE name = ?", [(name,) for name in indexed - names])
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO features (name, prefix, mtime_ns, docs) VALUES (?, ?, -1, '[]')",
+                [(name, self._prefix(name)) for name in sorted(names - indexed)],
+            )
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('specs_mtime_ns', ?)", (specs_mtime,))
+
+    @staticmethod
+    def _prefix(name: str) -> Optional[str]:
+        """NNN prefix of a feature name, or None."""
+        match = FEATURE_PATTERN.match(name)
+        return match.group(1) if match else None
+
+    def _scan(self, name: str) -> Tuple[int, Optional[int], List[str]]:
+        """Read a feature directory's mtimes and documents."""
+        feature_dir = self.specs_dir / name
+        mtime = _mtime_ns(feature_dir) or -1
+        docs = feature_docs(feature_dir)
+        return mtime, _mtime_ns(feature_dir / CONTRACTS_DIR), docs
+
+    def feature(self, name: str) -> Optional[Dict[str, Any]]:
+        """Look up a feature directory, rescanning it if it changed.
+
+        Args:
+            name: Directory name under specs/
+
+        Returns:
+            name, path and docs (documents present, e.g. "plan.md",
+            "contracts/"), or None if there is no such directory
+        """
+        row = self.conn.execute("SELECT * FROM features WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return None
+
+        docs = json.loads(row["docs"])
+        feature_dir = self.specs_dir / name
+        if (
+            _mtime_ns(feature_dir) != row["mtime_ns"]
+            or _mtime_ns(feature_dir / CONTRACTS_DIR) != row["contracts_mtime_ns"]
+        ):
+            try:
+                mtime, contracts_mtime, docs = self._scan(name)
+            except (FileNotFoundError, NotADirectoryError):
+                return None
+            with self.conn:
+                self.conn.execute(
+                    "UPDATE features SET mtime_ns = ?, contracts_mtime_ns = ?, docs = ? WHERE name = ?",
+                    (mtime, contracts_mtime, json.dumps(docs), name),
+                )
+        return {"name": name, "path": str(feature_dir), "docs": docs}
+
+    def features(self) -> List[Dict[str, Any]]:
+        """All feature directories with their documents, sorted by name."""
+        names = [row["name"] for row in self.conn.execute("SELECT name FROM features ORDER BY name")]
+        return [feature for feature in map(self.feature, names) if feature is not None]
+
+    def with_prefix(self, prefix: str) -> List[str]:
+        """Names of feature directories starting with prefix + "-"."""
+        rows = self.conn.execute("SELECT name FROM features WHERE prefix = ? ORDER BY name", (prefix,))
+        return [row["name"] for row in rows]
+
+    def latest(self) -> Optional[str]:
+        """The highest-numbered NNN-* feature directory, or None."""
+        row = self.conn.execute(
+            "SELECT name FROM features WHERE prefix IS NOT NULL ORDER BY CAST(prefix AS INTEGER) DESC, name LIMIT 1"
+        ).fetchone()
+        return row["name"] if row else None
+
+
+def current_branch(
+    root: Path,
+    index: SpecsIndex,
+    git_dir: Optional[Path] = None,
+    feature: Optional[str] = None,
+) -> str:
+    """Determine the current feature, like common.sh get_current_branch.
+
+    Args:
+        root: Project root
+        index: Specs index of the project
+        git_dir: Git directory, if already known (looked up from root otherwise)
+        feature: Value of TWITTERKIT_FEATURE to use instead of the environment's
+
+    Returns:
+        $TWITTERKIT_FEATURE, else the checked-out branch, else the latest
+        feature directory, else "main"
+    """
+    if feature is None:
+        feature = os.environ.get("TWITTERKIT_FEATURE")
+    if feature:
+        return feature
+
+    if git_dir is None:
+        git = find_git_dir(root)
+        git_dir = git[1] if git else None
+    if git_dir is not None:
+        branch = head_branch(git_dir)
+        if branch:
+            return branch
+
+    return index.latest() or "main"
+
+
+def feature_paths(
+    start: Path,
+    index: Optional[SpecsIndex] = None,
+    feature: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Resolve the current feature's paths, like common.sh get_feature_paths.
+
+    The feature directory is found by the branch's NNN- prefix, so several
+    branches can share one spec.
+
+    Args:
+        start: Directory inside the project
+        index: Open index of the project to reuse (refreshed before use);
+            one is opened for the call otherwise
+        feature: Value of TWITTERKIT_FEATURE to use instead of the environment's
+
+    Returns:
+        REPO_ROOT, CURRENT_BRANCH, HAS_GIT, FEATURE_DIR, FEATURE_SPEC,
+        IMPL_PLAN, TASKS, RESEARCH, DATA_MODEL, QUICKSTART, CONTRACTS_DIR,
+        AVAILABLE_DOCS (documents present in the feature directory) and
+        "warnings"
+    """
+    if index is None:
+        git = find_git_dir(start)
+        root = git[0] if git else repo_root(start)
+        with SpecsIndex(root) as index:
+            return _resolve_feature(root, git, index, feature)
+
+    index.refresh()
+    return _resolve_feature(index.root, find_git_dir(index.root), index, feature)
+
+
+def _resolve_feature(
+    root: Path,
+    git: Optional[Tuple[Path, Path]],
+    index: SpecsIndex,
+    feature: Optional[str],
+) -> Dict[str, Any]:
+    """feature_paths() for a known root, git directory and index."""
+    warnings = []
+    branch = current_branch(root, index, git[1] if git else None, feature)
+    match = FEATURE_PATTERN.match(branch)
+    name = branch
+    if match:
+        matches = index.with_prefix(match.group(1))
+        if len(matches) == 1:
+            name = matches[0]
+        elif len(matches) > 1:
+            warnings.append(f"Multiple spec directories found with prefix '{match.group(1)}': {' '.join(matches)}")
+    entry = index.feature(name)
+
+    feature_dir = root / "specs" / name
+    return {
+        "REPO_ROOT": str(root),
+        "CURRENT_BRANCH": branch,
+        "HAS_GIT": git is not None,
+        "FEATURE_DIR": str(feature_dir),
+        "FEATURE_SPEC": str(feature_dir / "spec.md"),
+        "IMPL_PLAN": str(feature_dir / "plan.md"),
+        "TASKS": str(feature_dir / "tasks.md"),
+        "RESEARCH": str(feature_dir / "research.md"),
+        "DATA_MODEL": str(feature_dir / "data-model.md"),
+        "QUICKSTART": str(feature_dir / "quickstart.md"),
+        "CONTRACTS_DIR": str(feature_dir / CONTRACTS_DIR),
+        "AVAILABLE_DOCS": entry["docs"] if entry else [],
+        "warnings": warnings,
+    }
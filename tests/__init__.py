@@ -5,6 +5,25 @@ This package contains integration tests for:
 - CLI commands (test_init.py)
 - Template rendering (test_templates.py)
 - Agent slash commands (test_agent_commands.py)
+- Fleet status (test_status.py)
+- Git operations (test_git_utils.py)
+- Profiling (test_profiling.py)
+- Release packaging (test_packager.py)
+- Release validation (test_validator.py)
+- Checksum verification (test_verify.py)
+- Delta update packages (test_delta.py)
+- Variant smoke tests (test_smoke.py)
+- Release notes (test_release_notes.py)
+- Campaign creation (test_campaign.py)
+- Workspace paths and specs index (test_workspace.py)
+- Prerequisite checks (test_prereqs.py)
+- Query daemon (test_daemon.py)
+- Watch mode (test_watch.py)
+- Agent context updates (test_agent_context.py)
+- Campaign document parsing (test_artifacts.py)
+- Cross-artifact analysis (test_analyze.py)
+- Near-duplicate detection (test_duplicates.py)
+- Task scheduling (test_scheduler.py)
 """
 
 __version__ = "0.1.0"
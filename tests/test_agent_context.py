@@ -0,0 +1,143 @@
+"""
+Tests for agent context updates.
+
+Covers:
+- Plan parsing, skipping template placeholders
+- Splicing the managed section into context files
+- Multi-agent updates: shared files, unchanged files, plan changes
+- `twitterify context` JSON output
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from twitterify_cli import app
+from twitterify_cli.agent_context import (
+    SECTION_END,
+    SECTION_START,
+    context_agents,
+    parse_plan,
+    splice,
+    update_agent_context,
+)
+
+runner = CliRunner()
+
+PLAN = """# Twitter Growth Plan: Beta Waitlist
+
+## Twitter Context
+
+**Primary Persona**: Indie hackers
+**Twitter Narrative Type**: [Super-Suit (Incremental) OR Digital Employee (Revolutionary)]
+**Core Channels**: Twitter/X, Product Hunt
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """A project without git, with Claude and Codex commands and a planned feature."""
+    (tmp_path / ".twitterkit" / "memory").mkdir(parents=True)
+    (tmp_path / ".twitterkit" / "memory" / "constitution.md").write_text("Be helpful.\n")
+    for commands_dir in (".claude/commands", ".codex/prompts"):
+        (tmp_path / commands_dir).mkdir(parents=True)
+        (tmp_path / commands_dir / "twitterkit.plan.md").write_text("plan\n")
+    (tmp_path / "specs" / "002-waitlist").mkdir(parents=True)
+    (tmp_path / "specs" / "002-waitlist" / "plan.md").write_text(PLAN)
+    return tmp_path
+
+
+class TestParsing:
+    """Test suite for plan parsing and splicing."""
+
+    def test_parse_plan(self, project: Path) -> None:
+        """Filled-in fields are read; placeholders and missing plans are not."""
+        assert parse_plan(project / "specs" / "002-waitlist" / "plan.md") == {
+            "name": "Beta Waitlist",
+            "Primary Persona": "Indie hackers",
+            "Core Channels": "Twitter/X, Product Hunt",
+        }
+        assert parse_plan(project / "specs" / "missing" / "plan.md") is None
+
+        template = Path(__file__).parent.parent / ".twitterkit" / "templates" / "plan-template.md"
+        assert parse_plan(template) == {}
+
+    def test_splice_keeps_manual_content(self) -> None:
+        """Only the marked section is replaced; other files get it appended."""
+        section = f"{SECTION_START}\nnew\n{SECTION_END}\n"
+        existing = f"# Mine\n\n{SECTION_START}\nold\n{SECTION_END}\n\nManual notes\n"
+
+        assert splice(existing, section) == f"# Mine\n\n{section}\nManual notes\n"
+        assert splice("# Mine\n", section) == f"# Mine\n\n{section}"
+        assert splice("# Twitter-Kit Context\n\nold\n---\nLast updated: x\n", section).endswith(f"\n\n{section}")
+        assert "Last updated" not in splice("# Twitter-Kit Context\n\nold\nLast updated: x\n", section)
+
+
+class TestUpdate:
+    """Test suite for update_agent_context()."""
+
+    def test_configured_agents(self, project: Path) -> None:
+        """Agents with commands or a context file are configured."""
+        (project / "GEMINI.md").write_text("# Gemini\n")
+
+        assert context_agents(project) == ["claude", "gemini", "codex"]
+
+    def test_writes_each_file_once(self, project: Path) -> None:
+        """Shared files are written once, with the plan's campaign details."""
+        results = update_agent_context(project, ["claude", "codex", "amp"])
+
+        assert results == [
+            {"path": ".claude/memory.md", "agents": ["claude"], "status": "created"},
+            {"path": "AGENTS.md", "agents": ["codex", "amp"], "status": "created"},
+        ]
+        content = (project / "AGENTS.md").read_text()
+        assert "- **Campaign**: Beta Waitlist (`specs/002-waitlist/plan.md`)" in content
+        assert "- **Primary Persona**: Indie hackers" in content
+        assert "Twitter Narrative Type" not in content
+        assert "Be helpful." in content
+
+    def test_only_changed_files_written(self, project: Path) -> None:
+        """Unchanged files are left alone; plan edits update every file."""
+        update_agent_context(project)
+        agents_md = project / "AGENTS.md"
+        agents_md.write_text(agents_md.read_text() + "\nManual notes\n")
+        stat = agents_md.stat()
+
+        assert {result["status"] for result in update_agent_context(project)} == {"unchanged"}
+        assert agents_md.stat().st_mtime_ns == stat.st_mtime_ns
+
+        plan = project / "specs" / "002-waitlist" / "plan.md"
+        plan.write_text(PLAN.replace("Indie hackers", "Solo founders"))
+        assert {result["status"] for result in update_agent_context(project)} == {"updated"}
+        assert "Solo founders" in agents_md.read_text()
+        assert agents_md.read_text().endswith("\nManual notes\n")
+
+    def test_without_plan(self, project: Path) -> None:
+        """Without a plan the section has no campaign details."""
+        shutil.rmtree(project / "specs")
+
+        update_agent_context(project, ["claude"])
+
+        assert "Active Campaign" not in (project / ".claude" / "memory.md").read_text()
+
+    def test_unknown_agent(self, project: Path) -> None:
+        """Unknown agents are rejected before anything is written."""
+        with pytest.raises(ValueError):
+            update_agent_context(project, ["claude", "nope"])
+        assert not (project / ".claude" / "memory.md").exists()
+
+
+class TestContextCommand:
+    """Test suite for `twitterify context`."""
+
+    def test_json_output(self, project: Path) -> None:
+        """JSON output lists each file with its agents and status."""
+        os.chdir(project / "specs")
+        result = runner.invoke(app, ["context", "--json", "--agent", "gemini"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout) == [{"path": "GEMINI.md", "agents": ["gemini"], "status": "created"}]
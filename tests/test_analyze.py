@@ -0,0 +1,157 @@
+"""
+Tests for the mechanical cross-artifact analysis.
+
+Covers:
+- Requirement coverage, orphan tasks and undefined references
+- Task lists that cite no requirement IDs (as written from the template)
+- Placeholders, duplicate requirements and constitution phrases
+- `twitterify analyze` JSON output and --strict
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from twitterify_cli import app
+from twitterify_cli.analyze import analyze_feature, constitution_rules
+from twitterify_cli.artifacts import ArtifactCache
+
+runner = CliRunner()
+
+CONSTITUTION = """# Constitution
+
+### Principle 6.2: Actionable Over Theoretical
+
+**Anti-pattern**: Vague aspirations like "increase engagement" without metrics.
+"""
+
+SPEC = """# Twitter Campaign Specification: Beta
+
+> [Painful problem] → [Your magic] → [Outcome + metric]
+
+- **FR-001**: Launch thread MUST include the demo video
+- **FR-002**: Waitlist MUST grant access for quote tweets
+- **FR-003**: Waitlist must grant access for quote-tweets!
+- **SC-001**: Increase engagement on launch day
+"""
+
+TASKS = """# Twitter Execution Tasks: Beta
+
+## Phase 1: Launch
+
+- [ ] T001 Record demo for FR-001
+- [ ] T002 [US1] Open waitlist (depends on T001)
+- [ ] T003 Post thread covering FR-009 (after T099)
+- [ ] T004 Schedule posts
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """A project with a constitution and one analyzable feature."""
+    (tmp_path / ".twitterkit" / "memory").mkdir(parents=True)
+    (tmp_path / ".twitterkit" / "memory" / "constitution.md").write_text(CONSTITUTION)
+    feature = tmp_path / "specs" / "005-beta"
+    feature.mkdir(parents=True)
+    (feature / "spec.md").write_text(SPEC)
+    (feature / "plan.md").write_text("# Twitter Growth Plan: Beta\n")
+    (feature / "tasks.md").write_text(TASKS)
+    return tmp_path
+
+
+def _analyze(project: Path) -> dict:
+    with ArtifactCache(project) as cache:
+        return analyze_feature(project, project / "specs" / "005-beta", cache)
+
+
+def _summaries(report: dict, category: str) -> list:
+    return [finding["summary"] for finding in report["findings"] if finding["category"] == category]
+
+
+class TestAnalyze:
+    """Test suite for analyze_feature()."""
+
+    def test_constitution_rules(self, project: Path) -> None:
+        """Quoted phrases on Anti-pattern lines become rules under their principle."""
+        assert constitution_rules(project) == [
+            {"term": "increase engagement", "principle": "Principle 6.2: Actionable Over Theoretical"},
+        ]
+
+    def test_coverage(self, project: Path) -> None:
+        """Requirements map to the tasks that reference them."""
+        report = _analyze(project)
+
+        assert report["coverage"][:2] == [
+            {"requirement": "FR-001", "line": 5, "tasks": ["T001"]},
+            {"requirement": "FR-002", "line": 6, "tasks": []},
+        ]
+        assert report["metrics"]["covered_requirements"] == 1
+        assert report["metrics"]["coverage_percent"] == 25.0
+        assert "FR-002 has no tasks" in _summaries(report, "coverage")
+
+    def test_untraced_tasks(self, project: Path) -> None:
+        """Tasks citing no IDs or stories get one INFO finding instead of coverage and orphan findings."""
+        (project / "specs" / "005-beta" / "tasks.md").write_text(
+            "## Phase 1: Launch\n\n- [ ] T001 Record demo\n- [ ] T002 Open waitlist\n"
+        )
+        report = _analyze(project)
+
+        assert _summaries(report, "coverage") == []
+        assert _summaries(report, "orphan_task") == []
+        assert [(finding["severity"], finding["summary"]) for finding in report["findings"]
+                if finding["category"] == "untraced_tasks"] == [
+            ("INFO", "No task cites a requirement ID or [US#] story; coverage and orphan tasks not checked"),
+        ]
+        assert report["metrics"]["coverage_percent"] is None
+
+    def test_task_checks(self, project: Path) -> None:
+        """Tasks without requirements or stories and undefined references are reported."""
+        report = _analyze(project)
+
+        assert _summaries(report, "orphan_task") == ["T004 maps to no requirement or story"]
+        assert _summaries(report, "unknown_reference") == [
+            "T003 references FR-009, which spec.md doesn't define",
+            "T003 depends on undefined task T099",
+        ]
+
+    def test_text_checks(self, project: Path) -> None:
+        """Placeholders, repeated requirements and banned phrases are reported."""
+        report = _analyze(project)
+
+        assert _summaries(report, "placeholder") == [
+            "Unfilled placeholder [Painful problem]",
+            "Unfilled placeholder [Your magic]",
+            "Unfilled placeholder [Outcome + metric]",
+        ]
+        assert _summaries(report, "duplication") == ["FR-003 repeats FR-002"]
+        assert [(finding["document"], finding["line"]) for finding in report["findings"]
+                if finding["category"] == "constitution"] == [("spec.md", 8)]
+
+    def test_sorted_by_severity(self, project: Path) -> None:
+        """Findings are numbered in severity order."""
+        (project / "specs" / "005-beta" / "plan.md").unlink()
+        report = _analyze(project)
+
+        severities = [finding["severity"] for finding in report["findings"]]
+        assert severities == sorted(severities, key=["CRITICAL", "HIGH", "MEDIUM", "LOW"].index)
+        assert report["findings"][0]["id"] == "F1"
+        assert report["documents"]["plan"] is None
+        assert "plan.md not found" in report["findings"][0]["summary"]
+
+
+class TestAnalyzeCommand:
+    """Test suite for `twitterify analyze`."""
+
+    def test_json_and_strict(self, project: Path) -> None:
+        """JSON output is the report; --strict fails on critical findings."""
+        os.chdir(project)
+        result = runner.invoke(app, ["analyze", "--feature", "005-beta", "--json"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout)["feature"] == "005-beta"
+
+        result = runner.invoke(app, ["analyze", "--feature", "005-beta", "--strict"])
+        assert result.exit_code == 1
@@ -0,0 +1,167 @@
+"""
+Tests for campaign document parsing.
+
+Covers:
+- Sections, requirements, tasks, phases and checklist items
+- Fenced code blocks being skipped
+- Content-hash caching across instances and format changes
+- `twitterify artifacts` JSON output
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from twitterify_cli import app
+from twitterify_cli.artifacts import PARSER_FORMAT, Artifact, ArtifactCache, parse_markdown
+
+runner = CliRunner()
+
+SPEC = """# Twitter Campaign Specification: Beta
+
+## Requirements
+
+- **FR-001**: Launch thread MUST include the demo video
+- **FR-002**: Waitlist MUST grant access for quote tweets
+- **SC-001**: 500 waitlist signups in 48 hours
+
+### Demo Checklist
+
+- [x] Starts in media res
+- [ ] Time-to-Wow < 15 seconds
+"""
+
+TASKS = """# Twitter Execution Tasks: Beta
+
+## Phase 1: Setup
+
+### A. Profile (Owner: Founder)
+
+- [x] T001 Write bio for FR-001
+- [ ] T002 [P] [US1] Design header graphics
+
+```bash
+- [ ] T999 not a task
+# not a heading
+```
+
+## Phase 2: Launch
+
+- [ ] T003 Post launch thread (depends on T001, T002) covering FR-001 and SC-001
+
+## Dependency Graph
+
+- [ ] Exit criteria met
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """A project with one feature's spec and tasks."""
+    (tmp_path / ".twitterkit").mkdir()
+    feature = tmp_path / "specs" / "005-beta"
+    feature.mkdir(parents=True)
+    (feature / "spec.md").write_text(SPEC)
+    (feature / "tasks.md").write_text(TASKS)
+    return tmp_path
+
+
+class TestParser:
+    """Test suite for parse_markdown()."""
+
+    def test_spec(self) -> None:
+        """Requirements and checklist items carry their section and line."""
+        spec = parse_markdown(SPEC, "spec")
+
+        assert [(section.level, section.title) for section in spec.sections] == [
+            (1, "Twitter Campaign Specification: Beta"), (2, "Requirements"), (3, "Demo Checklist"),
+        ]
+        assert [requirement.id for requirement in spec.requirements] == ["FR-001", "FR-002", "SC-001"]
+        assert spec.requirements[0].text == "Launch thread MUST include the demo video"
+        assert spec.requirements[0].line == 5
+        assert [(item.text, item.checked) for item in spec.checklist] == [
+            ("Starts in media res", True), ("Time-to-Wow < 15 seconds", False),
+        ]
+        assert spec.tasks == ()
+
+    def test_tasks(self) -> None:
+        """Tasks have markers, tags, references and phases; code blocks are skipped."""
+        tasks = parse_markdown(TASKS, "tasks")
+
+        assert [task.id for task in tasks.tasks] == ["T001", "T002", "T003"]
+        first, second, third = tasks.tasks
+        assert first.done and not first.parallel and first.requirements == ("FR-001",)
+        assert second.parallel and second.tags == ("US1",) and second.text == "Design header graphics"
+        assert second.section == "A. Profile (Owner: Founder)"
+        assert third.depends == ("T001", "T002")
+        assert third.requirements == ("FR-001", "SC-001")
+        assert [(phase.number, phase.tasks) for phase in tasks.phases] == [
+            (1, ("T001", "T002")), (2, ("T003",)),
+        ]
+        assert [task.phase for task in tasks.tasks] == [1, 1, 2]
+        assert [item.text for item in tasks.checklist] == ["Exit criteria met"]
+        assert "not a heading" not in [section.title for section in tasks.sections]
+
+    def test_round_trip(self) -> None:
+        """The JSON form rebuilds the same model."""
+        tasks = parse_markdown(TASKS, "tasks", "tasks.md")
+
+        assert Artifact.from_dict(json.loads(json.dumps(tasks.to_dict()))) == tasks
+
+
+class TestCache:
+    """Test suite for ArtifactCache."""
+
+    def test_unchanged_documents_not_reparsed(self, project: Path) -> None:
+        """Content seen before, in this or an earlier instance, isn't parsed again."""
+        tasks_path = project / "specs" / "005-beta" / "tasks.md"
+        with ArtifactCache(project) as cache:
+            first = cache.load(tasks_path)
+            assert cache.load(tasks_path) == first
+            assert cache.parsed == 1
+
+        with ArtifactCache(project) as cache:
+            assert cache.load(tasks_path) == first
+            assert cache.parsed == 0
+
+            tasks_path.write_text(TASKS.replace("Write bio", "Rewrite bio"))
+            assert cache.load(tasks_path).tasks[0].text == "Rewrite bio for FR-001"
+            assert cache.parsed == 1
+
+    def test_same_content_other_path(self, project: Path) -> None:
+        """Cached models are reported with the path and kind they were loaded as."""
+        copy = project / "plan.md"
+        copy.write_text(TASKS)
+        with ArtifactCache(project) as cache:
+            cache.load(project / "specs" / "005-beta" / "tasks.md")
+            artifact = cache.load(copy)
+
+        assert (artifact.kind, artifact.path, cache.parsed) == ("plan", str(copy), 1)
+
+    def test_format_change_discards(self, project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A new parser format starts from an empty cache."""
+        tasks_path = project / "specs" / "005-beta" / "tasks.md"
+        with ArtifactCache(project) as cache:
+            cache.load(tasks_path)
+
+        monkeypatch.setattr("twitterify_cli.artifacts.PARSER_FORMAT", PARSER_FORMAT + 1)
+        with ArtifactCache(project) as cache:
+            cache.load(tasks_path)
+            assert cache.parsed == 1
+
+
+class TestArtifactsCommand:
+    """Test suite for `twitterify artifacts`."""
+
+    def test_json_output(self, project: Path) -> None:
+        """The feature's documents are output by kind."""
+        os.chdir(project)
+        result = runner.invoke(app, ["artifacts", "--feature", "005-beta", "--json"])
+
+        assert result.exit_code == 0
+        output = json.loads(result.stdout)
+        assert sorted(output) == ["spec", "tasks"]
+        assert output["tasks"]["tasks"][1]["parallel"] is True
@@ -0,0 +1,157 @@
+"""
+Tests for campaign creation.
+
+Covers:
+- Short name generation matching create-new-campaign.sh
+- Indexed numbering, rebuilds and concurrent creation
+- Branch and worktree creation
+- `twitterify campaign new` JSON output
+"""
+
+import json
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from twitterify_cli import app
+from twitterify_cli.campaigns import (
+    INDEX_NAME,
+    STATE_DIR,
+    CampaignError,
+    create_campaign,
+    load_index,
+    slugify,
+)
+from twitterify_cli.git_utils import GitUtils
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """A project without git, with one existing campaign."""
+    path = tmp_path / "project"
+    (path / ".twitterkit").mkdir(parents=True)
+    (path / "specs" / "004-launch").mkdir(parents=True)
+    return path
+
+
+@pytest.fixture
+def git_project(project: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """The project as a git repository with an initial commit."""
+    for var in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        monkeypatch.setenv(var, "Test")
+    for var in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        monkeypatch.setenv(var, "test@example.com")
+    subprocess.run(["git", "init", "-q", "-b", "main"], cwd=project, check=True)
+    subprocess.run(["git", "commit", "-q", "--allow-empty", "-m", "init"], cwd=project, check=True)
+    return project
+
+
+class TestSlugify:
+    """Test suite for short names."""
+
+    def test_matches_bash_script(self) -> None:
+        """Lowercase, dash-separated, first four words, no stray dashes."""
+        assert slugify("Alpha launch Twitter campaign for devs") == "alpha-launch-twitter-campaign"
+        assert slugify("  Product Hunt -- launch!  ") == "product-hunt-launch"
+
+
+class TestNumbering:
+    """Test suite for campaign numbering."""
+
+    def test_continues_after_highest(self, project: Path) -> None:
+        """The first campaign follows the highest existing number and is indexed."""
+        result = create_campaign(project, "Beta waitlist push")
+
+        assert result["campaign_number"] == 5
+        assert result["branch_name"] == "005-beta-waitlist-push"
+        campaign_dir = Path(result["campaign_dir"])
+        assert sorted(path.name for path in campaign_dir.iterdir()) == [
+            "plan.md", "refs", "research.md", "spec.md", "tasks.md",
+        ]
+        assert load_index(project)["highest"] == 5
+        assert (project / STATE_DIR / ".gitignore").read_text().endswith("*\n")
+
+    def test_index_avoids_rescanning(self, project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """While specs/ is unchanged, numbers come from the index alone."""
+        create_campaign(project, "first")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("specs/ was rescanned")
+
+        monkeypatch.setattr("twitterify_cli.campaigns.scan_highest", fail)
+        assert create_campaign(project, "second")["campaign_number"] == 6
+
+    def test_rebuilds_after_external_changes(self, project: Path) -> None:
+        """Campaigns created by other tools are picked up; corrupt indexes are rebuilt."""
+        create_campaign(project, "first")
+        (project / "specs" / "020-manual").mkdir()
+        assert create_campaign(project, "second")["campaign_number"] == 21
+
+        (project / STATE_DIR / INDEX_NAME).write_text("{not json")
+        assert create_campaign(project, "third")["campaign_number"] == 22
+
+    def test_concurrent_creation(self, project: Path) -> None:
+        """Concurrent callers never get the same number."""
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda i: create_campaign(project, f"parallel {i}"), range(8)))
+
+        assert sorted(result["campaign_number"] for result in results) == list(range(5, 13))
+
+    def test_existing_directory(self, project: Path) -> None:
+        """An explicit number whose directory exists is an error."""
+        (project / "specs" / "009-dup").mkdir()
+
+        with pytest.raises(CampaignError):
+            create_campaign(project, "dup", number=9)
+
+
+class TestBranches:
+    """Test suite for git integration."""
+
+    def test_creates_branch(self, git_project: Path) -> None:
+        """The campaign branch is created and checked out."""
+        result = create_campaign(git_project, "Beta push")
+
+        assert GitUtils().get_current_branch(git_project) == "005-beta-push"
+        assert result["warnings"] == []
+
+    def test_worktree(self, git_project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Worktree campaigns don't switch branches and still advance the counter."""
+        monkeypatch.setenv("TWITTERKIT_WORKTREE_DIR", str(tmp_path / "worktrees"))
+
+        result = create_campaign(git_project, "Side quest", worktree=True)
+
+        worktree = tmp_path / "worktrees" / "005-side-quest"
+        assert result["worktree_path"] == str(worktree.resolve())
+        assert Path(result["campaign_dir"]) == worktree.resolve() / "specs" / "005-side-quest"
+        assert GitUtils().get_current_branch(git_project) == "main"
+        assert create_campaign(git_project, "next")["campaign_number"] == 6
+
+    def test_worktree_requires_git(self, project: Path) -> None:
+        """--worktree outside a repository is an error."""
+        with pytest.raises(CampaignError):
+            create_campaign(project, "x", worktree=True)
+
+
+class TestCampaignCommand:
+    """Test suite for `twitterify campaign new`."""
+
+    def test_json_output(self, project: Path) -> None:
+        """JSON output has the fields create-new-campaign.sh emits."""
+        os.chdir(project / "specs")
+        result = runner.invoke(app, ["campaign", "new", "--json", "Alpha", "launch", "--short-name", "alpha"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout) == {
+            "campaign_number": 5,
+            "campaign_dir": str(project.resolve() / "specs" / "005-alpha"),
+            "branch_name": "005-alpha",
+            "short_name": "alpha",
+            "description": "Alpha launch",
+        }
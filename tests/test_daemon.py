@@ -0,0 +1,226 @@
+"""
+Tests for the per-repository query daemon.
+
+Covers:
+- Answering queries over the Unix socket, matching in-process results
+- Passing the client's TWITTERKIT_FEATURE
+- Cached command renders and their invalidation
+- Stale sockets, duplicate daemons and shutdown
+- In-process fallback when no daemon runs
+- The entry point's client, which doesn't load the CLI
+"""
+
+import json
+import socket
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from twitterify_cli.daemon import DaemonError, DaemonUnavailable, WorkspaceState, query, request, serve, socket_path
+from twitterify_cli.prerequisites import check_prerequisites, run
+
+# Runs `twitterify prereqs --json` and reports which heavy modules it loaded
+CLIENT_SCRIPT = """
+import sys
+from twitterify_cli import main
+sys.argv = ["twitterify", "prereqs", "--json"]
+try:
+    main()
+except SystemExit:
+    pass
+loaded = [name for name in ("typer", "rich", "twitterify_cli.cli", "twitterify_cli.commands", "twitterify_cli.daemon")
+          if name in sys.modules]
+sys.stderr.write(",".join(loaded))
+"""
+
+
+def _git(path: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=path, check=True, capture_output=True)
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A git project on a feature branch with a plan and one command template."""
+    for var in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        monkeypatch.setenv(var, "Test")
+    for var in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        monkeypatch.setenv(var, "test@example.com")
+    monkeypatch.delenv("TWITTERKIT_FEATURE", raising=False)
+
+    path = tmp_path / "p"
+    (path / "specs" / "002-waitlist").mkdir(parents=True)
+    (path / "specs" / "002-waitlist" / "plan.md").touch()
+    (path / "specs" / "003-promo").mkdir()
+    commands = path / ".twitterkit" / "templates" / "commands"
+    commands.mkdir(parents=True)
+    (commands / "analyze.md").write_text("Run `.twitterkit/scripts/{SCRIPT}/check-prerequisites.sh --json` $ARGUMENTS\n")
+    _git(path, "init", "-q", "-b", "main")
+    _git(path, "commit", "-q", "--allow-empty", "-m", "init")
+    _git(path, "checkout", "-q", "-b", "002-waitlist")
+    return path.resolve()
+
+
+@pytest.fixture
+def daemon(project: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """A daemon serving the project from a background thread."""
+    monkeypatch.setattr("twitterify_cli.daemon.POLL_INTERVAL", 0.05)
+    ready = threading.Event()
+    thread = threading.Thread(target=serve, args=(project,), kwargs={"on_ready": lambda path: ready.set()})
+    thread.start()
+    assert ready.wait(10)
+    yield project
+    try:
+        request(project, "shutdown")
+    except DaemonUnavailable:
+        pass
+    thread.join(10)
+    assert not thread.is_alive()
+
+
+class TestQueries:
+    """Test suite for queries answered by the daemon."""
+
+    def test_prereqs_match_in_process(self, daemon: Path) -> None:
+        """The daemon's prereqs output is identical to check_prerequisites()."""
+        result = request(daemon, "prereqs", {"json": True, "include_tasks": True})
+
+        assert result == check_prerequisites(daemon, json_mode=True, include_tasks=True)._asdict()
+        assert request(daemon, "ping")["requests"] == 2
+
+    def test_sees_branch_and_spec_changes(self, daemon: Path) -> None:
+        """Warm state doesn't hide branch switches or new documents."""
+        assert request(daemon, "paths")["AVAILABLE_DOCS"] == ["plan.md"]
+
+        _git(daemon, "checkout", "-q", "-b", "003-promo-v2")
+        (daemon / "specs" / "003-promo" / "spec.md").touch()
+
+        paths = request(daemon, "paths")
+        assert paths["CURRENT_BRANCH"] == "003-promo-v2"
+        assert paths["AVAILABLE_DOCS"] == ["spec.md"]
+
+    def test_client_feature_override(self, daemon: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """TWITTERKIT_FEATURE comes from the client, not the daemon."""
+        monkeypatch.setenv("TWITTERKIT_FEATURE", "003-anything")
+
+        assert query(daemon, "paths")["FEATURE_DIR"] == str(daemon / "specs" / "003-promo")
+        assert request(daemon, "paths")["FEATURE_DIR"] == str(daemon / "specs" / "002-waitlist")
+
+    def test_render_is_cached_until_templates_change(self, daemon: Path) -> None:
+        """Rendered commands are reused until a template changes."""
+        rendered = request(daemon, "render", {"agent": "claude", "script": "sh", "python_prereqs": True})
+        assert rendered == {".claude/commands/twitterkit.analyze.md": "Run `twitterify prereqs --json` $ARGUMENTS\n"}
+
+        (daemon / ".twitterkit" / "templates" / "commands" / "plan.md").write_text("plan\n")
+        rendered = request(daemon, "render", {"agent": "claude", "script": "sh"})
+        assert sorted(rendered) == [".claude/commands/twitterkit.analyze.md", ".claude/commands/twitterkit.plan.md"]
+
+    def test_campaign_number(self, daemon: Path) -> None:
+        """The next campaign number follows the highest in use."""
+        assert request(daemon, "campaign_number") == {"highest": 3, "next": 4}
+
+    def test_errors(self, daemon: Path) -> None:
+        """Unknown methods and bad lines get error responses on the same connection."""
+        with pytest.raises(DaemonError, match="Unknown method"):
+            request(daemon, "nope")
+        with pytest.raises(DaemonError, match="Unknown agent"):
+            request(daemon, "render", {"agent": "nope"})
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path(daemon)))
+            with sock.makefile("rwb") as stream:
+                stream.write(b"not json\n" + b'{"id": 7, "method": "ping"}\n')
+                stream.flush()
+                assert "Invalid request" in json.loads(stream.readline())["error"]
+                assert json.loads(stream.readline())["id"] == 7
+
+
+class TestLifecycle:
+    """Test suite for starting and stopping the daemon."""
+
+    def test_shutdown_removes_socket(self, daemon: Path) -> None:
+        """A shutdown request stops the daemon and removes its socket."""
+        assert request(daemon, "shutdown") == {"stopping": True}
+
+    def test_second_daemon_refused(self, daemon: Path) -> None:
+        """Only one daemon runs per repository."""
+        with pytest.raises(DaemonError, match="already running"):
+            serve(daemon)
+
+    def test_stale_socket_replaced(self, project: Path) -> None:
+        """A socket left by a killed daemon is removed on start."""
+        path = socket_path(project)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(path))
+        stale.close()
+
+        serve(project, idle_timeout=0.1)
+
+        assert not path.exists()
+
+    def test_fallback_without_daemon(self, project: Path) -> None:
+        """Queries run in-process when no daemon is listening."""
+        with pytest.raises(DaemonUnavailable):
+            request(project, "ping")
+
+        assert query(project / "specs", "prereqs", {"json": True})["exit_code"] == 0
+        with WorkspaceState(project) as state:
+            assert query(project, "paths") == state.handle("paths", {})
+
+
+class TestEntryPoint:
+    """Test suite for `twitterify prereqs` through the entry point's client."""
+
+    def _run(self, project: Path) -> subprocess.CompletedProcess:
+        return subprocess.run([sys.executable, "-c", CLIENT_SCRIPT], cwd=project, capture_output=True, text=True)
+
+    def test_answered_by_daemon(self, daemon: Path) -> None:
+        """The daemon answers without typer, rich or the command modules being imported."""
+        result = self._run(daemon)
+
+        assert result.stdout == check_prerequisites(daemon, json_mode=True).stdout
+        assert result.stderr == ""
+        assert request(daemon, "ping")["requests"] == 2
+
+    def test_in_process_without_daemon(self, project: Path) -> None:
+        """Without a daemon the check runs in-process, still without the CLI."""
+        result = self._run(project)
+
+        assert result.stdout == check_prerequisites(project, json_mode=True).stdout
+        assert result.stderr == ""
+
+    @pytest.mark.parametrize(
+        "reply",
+        [b'{"id": 1, "error": "Unsupported protocol version: 1"}\n', b"not json\n", b'{"id": 1, "result": {}}\n'],
+    )
+    def test_in_process_when_daemon_misbehaves(
+        self, project: Path, reply: bytes, capsys: pytest.CaptureFixture
+    ) -> None:
+        """An error response or malformed reply falls back to the in-process check."""
+        path = socket_path(project)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(path))
+        server.listen(1)
+
+        def answer() -> None:
+            connection, _ = server.accept()
+            with connection:
+                connection.makefile("rb").readline()
+                connection.sendall(reply)
+
+        thread = threading.Thread(target=answer)
+        thread.start()
+        try:
+            exit_code = run(["--json"], project)
+        finally:
+            thread.join(5)
+            server.close()
+            path.unlink()
+
+        assert exit_code == 0
+        assert capsys.readouterr().out == check_prerequisites(project, json_mode=True).stdout
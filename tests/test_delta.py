@@ -0,0 +1,167 @@
+"""
+Tests for delta update packages between template releases.
+
+Covers:
+- Archive name parsing and CRC/size diffs
+- Delta package contents
+- Applying deltas to an installed project (conflicts, dry run, idempotence)
+"""
+
+import json
+import shutil
+import zipfile
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from twitterify_cli import app
+from twitterify_cli.delta import (
+    DELTA_MANIFEST,
+    apply_delta,
+    delta_name,
+    diff_releases,
+    parse_archive_name,
+    version_key,
+)
+from twitterify_cli.packager import Packager, archive_name
+
+runner = CliRunner()
+
+SOURCE_DIR = Path(__file__).parent.parent / ".twitterkit"
+PLAN_COMMAND = ".claude/commands/twitterkit.plan.md"
+REMOVED_SCRIPT = ".twitterkit/scripts/bash/setup-plan.sh"
+
+
+@pytest.fixture
+def releases(tmp_path: Path) -> Path:
+    """Build v1 and v2 releases where one command changed and one script was removed."""
+    source = tmp_path / "src" / ".twitterkit"
+    shutil.copytree(SOURCE_DIR, source)
+    Packager(source).build("v1.0.0", tmp_path / "v1", agents=["claude", "gemini"], jobs=1)
+
+    with (source / "templates" / "commands" / "twitterkit.plan.md").open("a") as f:
+        f.write("\nNew planning step\n")
+    (source / "scripts" / "bash" / "setup-plan.sh").unlink()
+    Packager(source).build("v2.0.0", tmp_path / "v2", agents=["claude", "gemini"], jobs=1)
+    return tmp_path
+
+
+@pytest.fixture
+def installed(releases: Path) -> Path:
+    """A project installed from the v1 claude/sh archive."""
+    project = releases / "project"
+    with zipfile.ZipFile(releases / "v1" / archive_name("claude", "sh", "v1.0.0")) as archive:
+        archive.extractall(project)
+    return project
+
+
+def _delta(releases: Path) -> Path:
+    """Write deltas and return the claude/sh package."""
+    diff_releases(releases / "v1", releases / "v2", releases / "deltas")
+    return releases / "deltas" / delta_name("claude", "sh", "v1.0.0", "v2.0.0")
+
+
+class TestDiffReleases:
+    """Test suite for computing delta packages."""
+
+    def test_parse_archive_name(self) -> None:
+        """Agent names with dashes and both archive prefixes are parsed."""
+        assert parse_archive_name("twitter-kit-template-cursor-agent-ps-v0.1.0.zip") == ("cursor-agent", "ps", "v0.1.0")
+        assert parse_archive_name("spec-kit-template-q-sh-v0.0.3.zip") == ("q", "sh", "v0.0.3")
+        assert parse_archive_name("CHECKSUMS.sha256") is None
+
+    def test_highest_version_wins(self, releases: Path) -> None:
+        """A directory holding several versions of a variant is diffed from its highest version."""
+        assert sorted(["v0.10.0", "v0.9.0", "v0.9.1"], key=version_key) == ["v0.9.0", "v0.9.1", "v0.10.0"]
+
+        mixed = releases / "mixed"
+        mixed.mkdir()
+        for release, version in (("v1", "v0.9.0"), ("v2", "v0.10.0")):
+            old_name = archive_name("claude", "sh", f"{release}.0.0")
+            shutil.copy(releases / release / old_name, mixed / archive_name("claude", "sh", version))
+
+        diff_releases(releases / "v1", mixed, releases / "deltas")
+
+        assert (releases / "deltas" / delta_name("claude", "sh", "v1.0.0", "v0.10.0")).is_file()
+
+    def test_delta_contains_only_changes(self, releases: Path) -> None:
+        """Only changed entries are shipped; removals are listed in delta.json."""
+        path = _delta(releases)
+
+        with zipfile.ZipFile(path) as delta:
+            names = set(delta.namelist())
+            manifest = json.loads(delta.read(DELTA_MANIFEST))
+
+        assert names == {PLAN_COMMAND, ".twitterkit/templates/commands/twitterkit.plan.md", DELTA_MANIFEST}
+        assert list(manifest["removed"]) == [REMOVED_SCRIPT]
+        assert (manifest["from"], manifest["to"]) == ("v1.0.0", "v2.0.0")
+        assert path.stat().st_size < (releases / "v2" / archive_name("claude", "sh", "v2.0.0")).stat().st_size / 5
+
+    def test_unchanged_variants(self, releases: Path) -> None:
+        """Variants with identical content produce no delta."""
+        report = diff_releases(releases / "v2", releases / "v2", releases / "deltas")
+
+        assert report["deltas"] == []
+        assert len(report["unchanged"]) == 4
+
+
+class TestApplyDelta:
+    """Test suite for patching an installed project."""
+
+    def test_apply_matches_new_release(self, releases: Path, installed: Path) -> None:
+        """After applying, the project matches a fresh v2 install."""
+        result = apply_delta(_delta(releases), installed)
+
+        assert result["removed"] == [REMOVED_SCRIPT]
+        assert not (installed / REMOVED_SCRIPT).exists()
+        with zipfile.ZipFile(releases / "v2" / archive_name("claude", "sh", "v2.0.0")) as archive:
+            assert (installed / PLAN_COMMAND).read_bytes() == archive.read(PLAN_COMMAND)
+
+        again = apply_delta(_delta(releases), installed)
+        assert again["updated"] == [] and again["removed"] == []
+
+    def test_local_edits_are_conflicts(self, releases: Path, installed: Path) -> None:
+        """Locally modified files are left alone unless forced."""
+        (installed / PLAN_COMMAND).write_text("my own plan command")
+
+        result = apply_delta(_delta(releases), installed)
+        assert result["conflicts"] == [PLAN_COMMAND]
+        assert (installed / PLAN_COMMAND).read_text() == "my own plan command"
+
+        forced = apply_delta(_delta(releases), installed, force=True)
+        assert PLAN_COMMAND in forced["updated"]
+
+    def test_escaping_removal_refused_before_writing(self, releases: Path, installed: Path) -> None:
+        """A removed path outside the project is refused before any file is patched."""
+        delta = _delta(releases)
+        tampered = releases / "tampered.zip"
+        with zipfile.ZipFile(delta) as source, zipfile.ZipFile(tampered, "w") as target:
+            for info in source.infolist():
+                data = source.read(info)
+                if info.filename == DELTA_MANIFEST:
+                    manifest = json.loads(data)
+                    manifest["removed"]["../outside.txt"] = {"old_crc": 0}
+                    data = json.dumps(manifest).encode()
+                target.writestr(info, data)
+        (releases / "outside.txt").write_text("keep")
+        before = (installed / PLAN_COMMAND).read_bytes()
+
+        with pytest.raises(ValueError, match="outside the project"):
+            apply_delta(tampered, installed)
+
+        assert (installed / PLAN_COMMAND).read_bytes() == before
+        assert (installed / REMOVED_SCRIPT).exists()
+        assert (releases / "outside.txt").read_text() == "keep"
+
+    def test_cli_dry_run(self, releases: Path, installed: Path) -> None:
+        """--dry-run reports changes without writing."""
+        delta = _delta(releases)
+        before = (installed / PLAN_COMMAND).read_bytes()
+
+        result = runner.invoke(app, ["release", "apply", str(delta), str(installed), "--dry-run"])
+
+        assert result.exit_code == 0
+        assert "Would update" in result.stdout
+        assert (installed / PLAN_COMMAND).read_bytes() == before
+        assert (installed / REMOVED_SCRIPT).exists()
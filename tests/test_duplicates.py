@@ -0,0 +1,139 @@
+"""
+Tests for near-duplicate detection.
+
+Covers:
+- Shingling and MinHash agreement with exact Jaccard similarity
+- Clusters within and across campaigns
+- Incremental refreshes
+- `twitterify duplicates` JSON output
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from twitterify_cli import app
+from twitterify_cli.duplicates import DuplicateIndex, jaccard, minhash, shingles
+
+runner = CliRunner()
+
+SPEC = """# Spec
+
+- **FR-001**: Launch thread MUST include a sixty second demo video of the hero workflow
+- **FR-002**: Waitlist MUST grant early access to users who quote tweet the launch
+"""
+
+TASKS = """# Tasks
+
+- [ ] T001 Record a sixty second demo video of the hero workflow for the launch thread
+- [ ] T002 Draft the origin story thread for the founder account
+- [ ] T003 Draft the origin story thread for the founder account today
+"""
+
+OTHER_SPEC = """# Spec
+
+- **FR-001**: Launch thread must include a sixty-second demo video of the hero workflow!
+- **FR-002**: Build a Discord server with onboarding channels
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """A project with two campaigns sharing a requirement."""
+    (tmp_path / ".twitterkit").mkdir()
+    (tmp_path / "specs" / "001-alpha").mkdir(parents=True)
+    (tmp_path / "specs" / "001-alpha" / "spec.md").write_text(SPEC)
+    (tmp_path / "specs" / "001-alpha" / "tasks.md").write_text(TASKS)
+    (tmp_path / "specs" / "002-beta").mkdir(parents=True)
+    (tmp_path / "specs" / "002-beta" / "spec.md").write_text(OTHER_SPEC)
+    return tmp_path
+
+
+def _ids(cluster: dict) -> list:
+    return [(item["feature"], item["id"]) for item in cluster["items"]]
+
+
+class TestMinHash:
+    """Test suite for shingling and signatures."""
+
+    def test_shingles_ignore_ids_and_case(self) -> None:
+        """IDs, case and punctuation don't affect shingles."""
+        assert shingles("FR-001: Ship the DEMO!") == shingles("ship the demo") == {"ship the demo"}
+
+    def test_signature_estimates_jaccard(self) -> None:
+        """The share of equal signature rows approximates the exact similarity."""
+        first = shingles("Record a sixty second demo video of the hero workflow for the launch thread")
+        second = shingles("Record a sixty second demo video of the hero workflow for the beta thread")
+        estimate = sum(a == b for a, b in zip(minhash(first), minhash(second))) / 64
+
+        assert abs(estimate - jaccard(first, second)) < 0.2
+        assert minhash(first) == minhash(set(first))
+
+
+class TestClusters:
+    """Test suite for DuplicateIndex."""
+
+    def test_within_and_across_campaigns(self, project: Path) -> None:
+        """Near-identical lines cluster; distinct lines don't."""
+        with DuplicateIndex(project) as index:
+            clusters = index.clusters()
+
+        assert [(_ids(cluster), cluster["cross_campaign"]) for cluster in clusters] == [
+            ([("001-alpha", "FR-001"), ("002-beta", "FR-001")], True),
+            ([("001-alpha", "T002"), ("001-alpha", "T003")], False),
+        ]
+        assert clusters[0]["similarity"] == 1.0
+        assert 0.7 <= clusters[1]["similarity"] < 1.0
+
+    def test_threshold_and_feature_filter(self, project: Path) -> None:
+        """Stricter thresholds and feature filters narrow the result."""
+        with DuplicateIndex(project) as index:
+            assert len(index.clusters(threshold=1.0)) == 1
+            assert [_ids(cluster) for cluster in index.clusters(features=["002-beta"])] == [
+                [("001-alpha", "FR-001"), ("002-beta", "FR-001")],
+            ]
+
+    def test_incremental_refresh(self, project: Path) -> None:
+        """Only changed, new or deleted documents are re-indexed."""
+        with DuplicateIndex(project) as index:
+            assert index.refresh() == [
+                "specs/001-alpha/spec.md", "specs/001-alpha/tasks.md", "specs/002-beta/spec.md",
+            ]
+            assert index.refresh() == []
+
+            (project / "specs" / "002-beta" / "spec.md").write_text("# Spec\n")
+            (project / "specs" / "003-gamma").mkdir()
+            (project / "specs" / "003-gamma" / "tasks.md").write_text(TASKS)
+            (project / "specs" / "001-alpha" / "tasks.md").unlink()
+
+            assert index.refresh() == [
+                "specs/001-alpha/tasks.md", "specs/002-beta/spec.md", "specs/003-gamma/tasks.md",
+            ]
+            assert [_ids(cluster) for cluster in index.clusters()] == [
+                [("003-gamma", "T002"), ("003-gamma", "T003")],
+            ]
+
+    def test_index_persists(self, project: Path) -> None:
+        """A new instance reuses the stored index."""
+        with DuplicateIndex(project) as index:
+            index.refresh()
+        with DuplicateIndex(project) as index:
+            assert index.refresh() == []
+            assert len(index.clusters()) == 2
+
+
+class TestDuplicatesCommand:
+    """Test suite for `twitterify duplicates`."""
+
+    def test_json_output(self, project: Path) -> None:
+        """--cross-campaign keeps clusters spanning campaigns."""
+        os.chdir(project)
+        result = runner.invoke(app, ["duplicates", "--cross-campaign", "--json"])
+
+        assert result.exit_code == 0
+        assert [_ids(cluster) for cluster in json.loads(result.stdout)] == [
+            [("001-alpha", "FR-001"), ("002-beta", "FR-001")],
+        ]
@@ -0,0 +1,197 @@
+"""
+Integration tests for GitUtils.
+
+Covers the git operations used by init and campaign scaffolding:
+- Pathspec-scoped staging and commits
+- Index-free plumbing commits of generated files
+- Worktree-per-campaign branches
+"""
+
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Generator, List
+
+import pytest
+
+from twitterify_cli.git_utils import GitUtils
+
+
+def _git(repo: Path, *args: str) -> str:
+    """Run a git command in repo and return its stdout."""
+    result = subprocess.run(["git", *args], cwd=repo, capture_output=True, text=True, check=True)
+    return result.stdout
+
+
+@pytest.fixture(autouse=True)
+def git_identity(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Provide a commit identity so tests don't depend on global git config."""
+    monkeypatch.setenv("GIT_AUTHOR_NAME", "Test")
+    monkeypatch.setenv("GIT_AUTHOR_EMAIL", "test@example.com")
+    monkeypatch.setenv("GIT_COMMITTER_NAME", "Test")
+    monkeypatch.setenv("GIT_COMMITTER_EMAIL", "test@example.com")
+
+
+@pytest.fixture
+def repo() -> Generator[Path, None, None]:
+    """Create an empty git repository."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir)
+        _git(path, "init", "-q", "-b", "main")
+        yield path
+
+
+class TestPathspecCommits:
+    """Test suite for committing an exact list of paths."""
+
+    def test_commit_only_listed_paths(self, repo: Path) -> None:
+        """Only the listed files are committed; other files stay untracked."""
+        (repo / "generated.md").write_text("generated")
+        (repo / "assets").mkdir()
+        (repo / "assets" / "big.bin").write_bytes(b"\0" * 1024)
+
+        assert GitUtils().commit_changes(repo, "scaffold", paths=[repo / "generated.md"])
+
+        committed = _git(repo, "ls-tree", "-r", "--name-only", "HEAD").split()
+        assert committed == ["generated.md"]
+        assert "?? assets/" in _git(repo, "status", "--short")
+
+    def test_paths_are_literal(self, repo: Path) -> None:
+        """Glob characters in file names are not expanded."""
+        (repo / "a[1].md").write_text("literal")
+        (repo / "a1.md").write_text("glob match")
+
+        assert GitUtils().stage_paths(repo, [Path("a[1].md")])
+
+        staged = _git(repo, "diff", "--cached", "--name-only").split()
+        assert staged == ["a[1].md"]
+
+    def test_large_path_list(self, repo: Path) -> None:
+        """Thousands of paths are staged without hitting argv limits."""
+        paths: List[Path] = []
+        for i in range(3000):
+            path = repo / "specs" / f"{i:04d}-campaign-with-a-long-descriptive-name.md"
+            path.parent.mkdir(exist_ok=True)
+            path.write_text(str(i))
+            paths.append(path)
+
+        assert GitUtils().commit_changes(repo, "bulk", paths=paths)
+        assert len(_git(repo, "ls-tree", "-r", "--name-only", "HEAD").split()) == 3000
+
+    def test_empty_path_list_stages_nothing(self, repo: Path) -> None:
+        """An empty list stages nothing rather than everything."""
+        (repo / "untracked.md").write_text("x")
+
+        assert GitUtils().stage_paths(repo, [])
+        assert _git(repo, "diff", "--cached", "--name-only") == ""
+
+
+class TestPlumbingCommit:
+    """Test suite for index-free commits of generated files."""
+
+    def _scaffold(self, repo: Path, count: int = 3) -> List[Path]:
+        """Write a small generated .twitterkit/ tree and return its files."""
+        paths = []
+        for i in range(count):
+            path = repo / ".twitterkit" / "templates" / "commands" / f"twitterkit.cmd{i}.md"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(f"command {i}")
+            paths.append(path)
+        script = repo / ".twitterkit" / "scripts" / "bash" / "common.sh"
+        script.parent.mkdir(parents=True)
+        script.write_text("#!/usr/bin/env bash\n")
+        script.chmod(0o755)
+        return paths + [script]
+
+    def test_commit_on_unborn_branch(self, repo: Path) -> None:
+        """A first commit is created and its files recorded in the index."""
+        paths = self._scaffold(repo)
+
+        commit = GitUtils().commit_generated(repo, paths, "Scaffold twitterkit")
+
+        assert commit == _git(repo, "rev-parse", "HEAD").strip()
+        tree = _git(repo, "ls-tree", "-r", "HEAD")
+        assert "100755 blob" in tree and "common.sh" in tree
+        assert len(tree.splitlines()) == 4
+        assert _git(repo, "ls-files").split() == _git(repo, "ls-tree", "-r", "--name-only", "HEAD").split()
+        assert _git(repo, "status", "--short") == ""
+
+    def test_preserves_existing_tree(self, repo: Path) -> None:
+        """Files already in HEAD, including siblings of new files, are kept."""
+        (repo / ".twitterkit").mkdir()
+        (repo / ".twitterkit" / "keep.md").write_text("keep")
+        (repo / "README.md").write_text("readme")
+        assert GitUtils().commit_changes(repo, "initial")
+
+        paths = self._scaffold(repo)
+        commit = GitUtils().commit_generated(repo, paths, "Add generated files")
+
+        assert commit is not None
+        names = _git(repo, "ls-tree", "-r", "--name-only", "HEAD").split()
+        assert "README.md" in names
+        assert ".twitterkit/keep.md" in names
+        assert ".twitterkit/templates/commands/twitterkit.cmd0.md" in names
+        assert _git(repo, "rev-parse", "HEAD~1").strip() != commit
+
+    def test_unchanged_files_create_no_commit(self, repo: Path) -> None:
+        """Re-committing identical content leaves HEAD where it was."""
+        paths = self._scaffold(repo)
+        utils = GitUtils()
+        first = utils.commit_generated(repo, paths, "Scaffold")
+
+        assert utils.commit_generated(repo, paths, "Scaffold again") == first
+
+    def test_status_clean_after_commit(self, repo: Path) -> None:
+        """The committed files are not reported as changes, and the next commit keeps them."""
+        (repo / "README.md").write_text("readme")
+        assert GitUtils().commit_changes(repo, "initial")
+        paths = self._scaffold(repo)
+
+        assert GitUtils().commit_generated(repo, paths, "Scaffold")
+        assert _git(repo, "status", "--short") == ""
+
+        (repo / "notes.md").write_text("notes")
+        _git(repo, "add", "notes.md")
+        _git(repo, "commit", "-q", "-m", "notes")
+        assert ".twitterkit/scripts/bash/common.sh" in _git(repo, "ls-tree", "-r", "--name-only", "HEAD").split()
+
+
+class TestWorktreeBranches:
+    """Test suite for worktree-per-campaign branches."""
+
+    @pytest.fixture
+    def committed_repo(self, repo: Path) -> Path:
+        """Repository with one commit so branches can be created."""
+        (repo / "README.md").write_text("readme")
+        assert GitUtils().commit_changes(repo, "initial")
+        return repo
+
+    def test_create_branch_in_worktree(self, committed_repo: Path) -> None:
+        """The campaign branch is checked out in its own worktree."""
+        utils = GitUtils()
+        worktrees = committed_repo / "wt"
+
+        assert utils.create_branch(committed_repo, "001-alpha", worktree_dir=worktrees)
+        assert utils.create_branch(committed_repo, "002-beta", worktree_dir=worktrees)
+
+        # The main worktree never switched branches
+        assert utils.get_current_branch(committed_repo) == "main"
+        assert utils.get_current_branch(worktrees / "001-alpha") == "001-alpha"
+        assert (worktrees / "002-beta" / "README.md").exists()
+
+        listed = {Path(w["path"]).name: w for w in utils.list_worktrees(committed_repo)}
+        assert listed["001-alpha"]["branch"] == "001-alpha"
+        assert listed["002-beta"]["branch"] == "002-beta"
+
+    def test_prune_removed_worktrees(self, committed_repo: Path) -> None:
+        """Worktrees whose directory was deleted are pruned."""
+        utils = GitUtils()
+        worktrees = committed_repo / "wt"
+        assert utils.create_branch(committed_repo, "001-alpha", worktree_dir=worktrees)
+
+        shutil.rmtree(worktrees / "001-alpha")
+        assert any(w.get("prunable") for w in utils.list_worktrees(committed_repo))
+
+        assert utils.prune_worktrees(committed_repo)
+        assert len(utils.list_worktrees(committed_repo)) == 1
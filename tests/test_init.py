@@ -11,6 +11,7 @@ Tests T111-T115 from tasks.md:
 
 import os
 import shutil
+import subprocess
 import tempfile
 from pathlib import Path
 from typing import Generator
@@ -220,6 +221,57 @@ class TestInitCommand:
         # Verify no .git directory
         assert not git_dir.exists()
 
+    def test_init_commits_only_generated_files(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that --commit gives a freshly initialized repo an initial commit.
+
+        Verifies:
+        - Initial commit contains the generated package, commands and README
+        - Pre-existing files are not swept into the commit
+        """
+        for var in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+            monkeypatch.setenv(var, "Test")
+        for var in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+            monkeypatch.setenv(var, "test@example.com")
+
+        project_path = temp_dir / "test-commit"
+        project_path.mkdir()
+        (project_path / "notes.txt").write_text("user content")
+        os.chdir(project_path)
+
+        result = runner.invoke(app, ["init", ".", "--here", "--force", "--commit"])
+
+        assert result.exit_code == 0
+
+        tracked = subprocess.run(
+            ["git", "ls-tree", "-r", "--name-only", "HEAD"],
+            cwd=project_path,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        assert ".twitterkit/memory/constitution.md" in tracked
+        assert ".claude/commands/twitterkit.plan.md" in tracked
+        assert "README.md" in tracked
+        assert "notes.txt" not in tracked
+
+    def test_init_does_not_commit_by_default(self, temp_dir: Path) -> None:
+        """
+        Test that init leaves committing to the user unless --commit is given.
+
+        Verifies:
+        - The repository is created without any commit
+        """
+        project_path = temp_dir / "test-no-commit"
+        os.chdir(temp_dir)
+
+        result = runner.invoke(app, ["init", "test-no-commit"])
+
+        assert result.exit_code == 0
+        head = subprocess.run(["git", "rev-parse", "--verify", "-q", "HEAD"], cwd=project_path, capture_output=True)
+        assert head.returncode != 0
+
     def test_init_in_empty_directory_without_force_fails(self, temp_project_dir: Path) -> None:
         """
         Test that init in current directory requires --force if not empty.
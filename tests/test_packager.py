@@ -0,0 +1,318 @@
+"""
+Tests for the release template packager.
+
+Covers:
+- Agent-specific command rendering
+- Variant archive contents
+- Parallel builds via `twitterify release build`
+- Reproducible archives and incremental rebuilds
+- Shared pre-compressed payload
+- Build manifest and checksums
+"""
+
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Generator
+
+import pytest
+from typer.testing import CliRunner
+
+from twitterify_cli import app, packager
+from twitterify_cli.packager import (
+    CHECKSUMS_NAME,
+    MANIFEST_NAME,
+    RELEASE_AGENTS,
+    Packager,
+    archive_name,
+    build_archive,
+    compress_source,
+    input_digest,
+    load_source,
+    render_commands,
+)
+
+runner = CliRunner()
+
+REPO_ROOT = Path(__file__).parent.parent
+SOURCE_DIR = REPO_ROOT / ".twitterkit"
+
+
+@pytest.fixture
+def temp_dir() -> Generator[Path, None, None]:
+    """Create a temporary directory for test files."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture(scope="module")
+def source():
+    """Snapshot of the repository's .twitterkit/ directory."""
+    return load_source(SOURCE_DIR)
+
+
+class TestRenderCommands:
+    """Test suite for command template transformation."""
+
+    def test_placeholders_replaced(self, source) -> None:
+        """$ARGUMENTS and {SCRIPT} are substituted per agent and script."""
+        commands = render_commands(source, "gemini", "ps")
+
+        analyze = commands[".gemini/commands/twitterkit.analyze.toml"].decode()
+        assert "{{args}}" in analyze
+        assert "$ARGUMENTS" not in analyze
+        assert "{SCRIPT}" not in analyze
+
+    def test_agent_directory_and_extension(self, source) -> None:
+        """Command files land in the agent's directory with its extension."""
+        commands = render_commands(source, "copilot", "sh")
+
+        assert commands
+        assert all(path.startswith(".github/agents/twitterkit.") for path in commands)
+        assert all(path.endswith(".agent.md") for path in commands)
+
+
+class TestBuildArchive:
+    """Test suite for in-memory variant archives."""
+
+    def _names(self, data: bytes) -> list:
+        """Return the member names of an in-memory ZIP."""
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            return archive.namelist()
+
+    def test_only_selected_script_variant(self, source) -> None:
+        """sh archives ship bash scripts only, ps archives PowerShell only."""
+        sh_names = self._names(build_archive(source, "claude", "sh"))
+        ps_names = self._names(build_archive(source, "claude", "ps"))
+
+        assert ".twitterkit/scripts/bash/common.sh" in sh_names
+        assert not any("powershell" in name for name in sh_names)
+        assert ".twitterkit/scripts/powershell/common.ps1" in ps_names
+        assert not any("scripts/bash" in name for name in ps_names)
+
+    def test_copilot_extras(self, source) -> None:
+        """Copilot archives include VS Code settings and a prompts directory."""
+        names = self._names(build_archive(source, "copilot", "sh"))
+
+        assert ".vscode/settings.json" in names
+        assert ".github/prompts/" in names
+
+    def test_script_permissions_preserved(self, source) -> None:
+        """Executable bits from the source tree are recorded in the archive."""
+        data = build_archive(source, "claude", "sh")
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            info = archive.getinfo(".twitterkit/scripts/bash/common.sh")
+
+        mode = info.external_attr >> 16
+        assert mode & 0o111 == (SOURCE_DIR / "scripts" / "bash" / "common.sh").stat().st_mode & 0o111
+
+
+class TestReleaseBuild:
+    """Test suite for `twitterify release build`."""
+
+    def test_builds_all_variants(self, temp_dir: Path) -> None:
+        """Every agent × script variant is written in parallel."""
+        results = Packager(SOURCE_DIR).build("v9.9.9", temp_dir, jobs=4)
+
+        assert len(results) == len(RELEASE_AGENTS) * 2
+        for result in results:
+            assert Path(result["path"]).exists()
+            assert zipfile.is_zipfile(result["path"])
+
+    def test_cli_agents_and_scripts(self, temp_dir: Path) -> None:
+        """AGENTS/SCRIPTS select a subset of variants."""
+        result = runner.invoke(
+            app,
+            ["release", "build", "v1.0.0", "--output", str(temp_dir), "--source", str(SOURCE_DIR)],
+            env={"AGENTS": "claude,gemini", "SCRIPTS": "sh"},
+        )
+
+        assert result.exit_code == 0
+        assert sorted(p.name for p in temp_dir.glob("*.zip")) == [
+            archive_name("claude", "sh", "v1.0.0"),
+            archive_name("gemini", "sh", "v1.0.0"),
+        ]
+
+    def test_cli_unknown_agent(self, temp_dir: Path) -> None:
+        """Unknown agents are rejected before anything is built."""
+        result = runner.invoke(
+            app,
+            ["release", "build", "v1.0.0", "-o", str(temp_dir), "--source", str(SOURCE_DIR), "--agents", "nope"],
+        )
+
+        assert result.exit_code == 1
+        assert "nope" in result.stdout
+        assert not list(temp_dir.glob("*.zip"))
+
+
+class TestReproducibility:
+    """Test suite for byte-reproducible archives."""
+
+    def test_rebuild_is_identical(self, temp_dir: Path) -> None:
+        """Two builds of the same source produce identical bytes."""
+        first = {r["path"]: r["sha256"] for r in Packager(SOURCE_DIR).build("v1", temp_dir / "a", jobs=2)}
+        second = {r["path"]: r["sha256"] for r in Packager(SOURCE_DIR).build("v1", temp_dir / "a", jobs=1)}
+
+        assert first == second
+
+    def test_independent_of_mtimes(self, temp_dir: Path) -> None:
+        """Touching source files does not change the archive."""
+        copy = temp_dir / ".twitterkit"
+        shutil.copytree(SOURCE_DIR, copy)
+        before = build_archive(load_source(copy), "claude", "sh")
+
+        for path in copy.rglob("*.md"):
+            os.utime(path, (1_000_000_000, 1_000_000_000))
+
+        assert build_archive(load_source(copy), "claude", "sh") == before
+
+    def test_source_date_epoch(self, source, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Entry timestamps come from SOURCE_DATE_EPOCH."""
+        monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+        data = build_archive(source, "claude", "sh")
+
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            assert {info.date_time for info in archive.infolist()} == {(2023, 11, 14, 22, 13, 20)}
+
+    def test_cli_check(self, temp_dir: Path) -> None:
+        """--check passes for fresh archives and fails once one changes."""
+        args = ["release", "build", "v1", "-o", str(temp_dir), "--source", str(SOURCE_DIR), "--agents", "claude"]
+        assert runner.invoke(app, args).exit_code == 0
+
+        assert runner.invoke(app, args + ["--check"]).exit_code == 0
+
+        (temp_dir / archive_name("claude", "sh", "v1")).write_bytes(b"tampered")
+        result = runner.invoke(app, args + ["--check"])
+        assert result.exit_code == 1
+        assert "differs" in result.stdout
+
+
+class TestIncrementalBuild:
+    """Test suite for input-digest keyed incremental builds."""
+
+    @pytest.fixture
+    def source_copy(self, temp_dir: Path) -> Path:
+        """Writable copy of .twitterkit/."""
+        copy = temp_dir / "src" / ".twitterkit"
+        shutil.copytree(SOURCE_DIR, copy)
+        return copy
+
+    def test_unchanged_variants_skipped(self, source_copy: Path, temp_dir: Path) -> None:
+        """A second build reuses every archive and records digests."""
+        output = temp_dir / "out"
+        packager = Packager(source_copy)
+        packager.build("v1", output, agents=["claude", "gemini"])
+
+        results = packager.build("v1", output, agents=["claude", "gemini"])
+
+        assert all(result["skipped"] for result in results)
+        manifest = json.loads((output / MANIFEST_NAME).read_text())
+        assert manifest["variants"][archive_name("claude", "sh", "v1")]["input_digest"] == results[0]["input_digest"]
+
+    def test_only_affected_variants_rebuilt(self, source_copy: Path, temp_dir: Path) -> None:
+        """Changing a PowerShell script rebuilds only ps variants."""
+        output = temp_dir / "out"
+        packager = Packager(source_copy)
+        packager.build("v1", output, agents=["claude", "gemini"])
+
+        with (source_copy / "scripts" / "powershell" / "common.ps1").open("a") as f:
+            f.write("# changed\n")
+        results = packager.build("v1", output, agents=["claude", "gemini"])
+
+        rebuilt = {(r["agent"], r["script"]) for r in results if not r["skipped"]}
+        assert rebuilt == {("claude", "ps"), ("gemini", "ps")}
+
+    def test_missing_archive_and_force(self, source_copy: Path, temp_dir: Path) -> None:
+        """Deleted archives are rebuilt; --force rebuilds everything."""
+        output = temp_dir / "out"
+        packager = Packager(source_copy)
+        packager.build("v1", output, agents=["claude"])
+
+        (output / archive_name("claude", "sh", "v1")).unlink()
+        results = packager.build("v1", output, agents=["claude"])
+        assert [r["skipped"] for r in results] == [False, True]
+
+        results = packager.build("v1", output, agents=["claude"], force=True)
+        assert not any(r["skipped"] for r in results)
+
+    def test_digest_depends_on_version_and_epoch(self, source, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Version and SOURCE_DATE_EPOCH are part of the input digest."""
+        base = input_digest(source, "claude", "sh", "v1")
+
+        assert input_digest(source, "claude", "sh", "v2") != base
+        monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+        assert input_digest(source, "claude", "sh", "v1") != base
+
+
+class TestSharedPayload:
+    """Test suite for splicing the pre-compressed shared payload."""
+
+    def test_archives_are_valid(self, source) -> None:
+        """Spliced archives pass CRC checks and round-trip file content."""
+        shared = compress_source(source)
+        data = build_archive(source, "claude", "sh", shared)
+
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            assert archive.testzip() is None
+            assert archive.read(".twitterkit/memory/constitution.md") == source["memory/constitution.md"][0]
+
+    def test_only_agent_files_compressed_per_variant(self, source, monkeypatch: pytest.MonkeyPatch) -> None:
+        """With a shared payload, only command and extra files are compressed."""
+        shared = compress_source(source)
+        calls = []
+        original = packager.compress_entry
+        monkeypatch.setattr(packager, "compress_entry", lambda *a: calls.append(a) or original(*a))
+
+        data = build_archive(source, "copilot", "ps", shared)
+
+        assert len(calls) == len(render_commands(source, "copilot", "ps")) + 1
+        assert data == build_archive(source, "copilot", "ps")
+
+
+class TestBuildManifest:
+    """Test suite for the manifest and checksums written during builds."""
+
+    def test_manifest_matches_archives(self, temp_dir: Path) -> None:
+        """Sizes and hashes recorded while streaming match the files on disk."""
+        Packager(SOURCE_DIR).build("v1.2.3", temp_dir, agents=["claude", "copilot"])
+
+        manifest = json.loads((temp_dir / MANIFEST_NAME).read_text())
+        assert manifest["version"] == "v1.2.3"
+        assert manifest["environment"]["os"]
+        assert len(manifest["variants"]) == 4
+        for name, entry in manifest["variants"].items():
+            data = (temp_dir / name).read_bytes()
+            assert entry["size"] == len(data)
+            assert entry["sha256"] == hashlib.sha256(data).hexdigest()
+            assert entry["build_seconds"] >= 0
+        assert manifest["total_size_bytes"] == sum(e["size"] for e in manifest["variants"].values())
+
+    def test_checksums_file(self, temp_dir: Path) -> None:
+        """CHECKSUMS.sha256 lists every archive in sha256sum format."""
+        Packager(SOURCE_DIR).build("v1", temp_dir, agents=["claude"])
+
+        lines = (temp_dir / CHECKSUMS_NAME).read_text().splitlines()
+        assert [line.split("  ")[1] for line in lines] == [
+            archive_name("claude", "ps", "v1"),
+            archive_name("claude", "sh", "v1"),
+        ]
+        digest, name = lines[0].split("  ")
+        assert hashlib.sha256((temp_dir / name).read_bytes()).hexdigest() == digest
+
+    def test_clean_removes_other_archives(self, temp_dir: Path) -> None:
+        """--clean drops archives and manifest entries from other builds."""
+        packager = Packager(SOURCE_DIR)
+        packager.build("v1", temp_dir, agents=["claude"], scripts=["sh"])
+        (temp_dir / "spec-kit-template-claude-sh-v0.0.3.zip").write_bytes(b"old")
+
+        packager.build("v2", temp_dir, agents=["claude"], scripts=["sh"], clean=True)
+
+        assert sorted(p.name for p in temp_dir.glob("*.zip")) == [archive_name("claude", "sh", "v2")]
+        assert list(json.loads((temp_dir / MANIFEST_NAME).read_text())["variants"]) == [
+            archive_name("claude", "sh", "v2")
+        ]
@@ -0,0 +1,196 @@
+"""
+Tests for the in-process prerequisite checks.
+
+Covers:
+- Output, errors and exit codes identical to check-prerequisites.sh
+- Projects without git
+- `twitterify prereqs` output, with and without the typer app
+- Packaging command files that call `twitterify prereqs`
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from twitterify_cli import app
+from twitterify_cli.packager import load_source, render_commands
+from twitterify_cli.prerequisites import check_prerequisites, run
+
+runner = CliRunner()
+
+SOURCE_DIR = Path(__file__).parent.parent / ".twitterkit"
+CHECK_PREREQUISITES = SOURCE_DIR / "scripts" / "bash" / "check-prerequisites.sh"
+
+MODES = [
+    [],
+    ["--json"],
+    ["--paths-only"],
+    ["--json", "--paths-only"],
+    ["--json", "--require-tasks", "--include-tasks"],
+    ["--include-tasks"],
+]
+
+
+def _git(path: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=path, check=True, capture_output=True)
+
+
+def _bash(project: Path, args: list) -> tuple:
+    result = subprocess.run(["bash", str(CHECK_PREREQUISITES), *args], cwd=project, capture_output=True, text=True)
+    return result.returncode, result.stdout, result.stderr
+
+
+def _python(project: Path, args: list) -> tuple:
+    return tuple(
+        check_prerequisites(
+            project,
+            json_mode="--json" in args,
+            require_tasks="--require-tasks" in args,
+            include_tasks="--include-tasks" in args,
+            paths_only="--paths-only" in args,
+        )
+    )
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A git project on a feature branch with a plan, research and contracts."""
+    for var in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        monkeypatch.setenv(var, "Test")
+    for var in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        monkeypatch.setenv(var, "test@example.com")
+    monkeypatch.delenv("TWITTERKIT_FEATURE", raising=False)
+
+    path = tmp_path / "project"
+    feature = path / "specs" / "002-waitlist"
+    (feature / "contracts").mkdir(parents=True)
+    (feature / "contracts" / "api.md").touch()
+    (feature / "plan.md").touch()
+    (feature / "research.md").touch()
+    (path / ".twitterkit").mkdir()
+    _git(path, "init", "-q", "-b", "main")
+    _git(path, "commit", "-q", "--allow-empty", "-m", "init")
+    _git(path, "checkout", "-q", "-b", "002-waitlist")
+    return path
+
+
+class TestParity:
+    """Test suite comparing against check-prerequisites.sh."""
+
+    @pytest.mark.parametrize("args", MODES)
+    def test_ready_feature(self, project: Path, args: list) -> None:
+        """A feature with a plan produces the same output in every mode."""
+        assert _python(project, args) == _bash(project, args)
+
+    @pytest.mark.parametrize("args", [["--json"], ["--json", "--require-tasks"], ["--paths-only"]])
+    def test_missing_documents(self, project: Path, args: list) -> None:
+        """Missing plan.md or tasks.md fails the same way."""
+        (project / "specs" / "002-waitlist" / "plan.md").unlink()
+
+        expected = _bash(project, args)
+        assert _python(project, args) == expected
+        if "--paths-only" not in args:
+            assert expected[0] == 1
+
+    @pytest.mark.parametrize("args", [["--json"], ["--paths-only"]])
+    def test_not_on_feature_branch(self, project: Path, args: list) -> None:
+        """Branch validation runs in every mode, including --paths-only."""
+        _git(project, "checkout", "-q", "main")
+        (project / "specs" / "001-launch").mkdir()
+
+        assert _python(project, args) == _bash(project, args)
+
+    def test_missing_feature_directory(self, project: Path) -> None:
+        """A branch without a spec directory fails with the script's message."""
+        _git(project, "checkout", "-q", "-b", "007-nothing")
+
+        assert _python(project, ["--json"]) == _bash(project, ["--json"])
+
+    def test_ambiguous_prefix(self, project: Path) -> None:
+        """Duplicate prefixes print the script's error lines but still succeed."""
+        (project / "specs" / "002-other").mkdir()
+        _git(project, "checkout", "-q", "-b", "002-waitlist-v2")
+
+        expected = _bash(project, ["--json", "--paths-only"])
+        assert _python(project, ["--json", "--paths-only"]) == expected
+        assert "Multiple spec directories" in expected[2]
+
+
+class TestWithoutGit:
+    """Test suite for projects that aren't git repositories."""
+
+    def test_warns_and_uses_latest_feature(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Branch validation is skipped and the highest-numbered feature is used."""
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path))
+        monkeypatch.delenv("TWITTERKIT_FEATURE", raising=False)
+        (tmp_path / ".twitterkit").mkdir()
+        (tmp_path / "specs" / "003-promo").mkdir(parents=True)
+        (tmp_path / "specs" / "003-promo" / "plan.md").touch()
+
+        exit_code, stdout, stderr = check_prerequisites(tmp_path, json_mode=True)
+
+        assert exit_code == 0
+        assert stdout == f'{{"FEATURE_DIR":"{tmp_path.resolve()}/specs/003-promo","AVAILABLE_DOCS":[]}}\n'
+        assert stderr == "[twitterkit] Warning: Git repository not detected; skipped branch validation\n"
+
+
+class TestPrereqsCommand:
+    """Test suite for `twitterify prereqs`."""
+
+    def test_text_output(self, project: Path) -> None:
+        """Text mode lists each optional document with its status."""
+        os.chdir(project)
+        result = runner.invoke(app, ["prereqs", "--include-tasks"])
+
+        assert result.exit_code == 0
+        assert result.stdout == (
+            f"FEATURE_DIR:{project.resolve()}/specs/002-waitlist\n"
+            "AVAILABLE_DOCS:\n"
+            "  ✓ research.md\n"
+            "  ✗ data-model.md\n"
+            "  ✓ contracts/\n"
+            "  ✗ quickstart.md\n"
+            "  ✗ tasks.md\n"
+        )
+
+    def test_exit_code(self, project: Path) -> None:
+        """Failures exit with status 1."""
+        os.chdir(project)
+        result = runner.invoke(app, ["prereqs", "--json", "--require-tasks"])
+
+        assert result.exit_code == 1
+        assert result.stdout == ""
+
+    @pytest.mark.parametrize("args", MODES)
+    def test_entry_point(self, project: Path, args: list) -> None:
+        """The entry point answers without the typer app, exactly like the script."""
+        result = subprocess.run(
+            [sys.executable, "-m", "twitterify_cli", "prereqs", *args], cwd=project, capture_output=True, text=True
+        )
+
+        assert (result.returncode, result.stdout, result.stderr) == _bash(project, args)
+
+    def test_help_uses_cli(self, project: Path) -> None:
+        """Arguments other than the script's flags are left to the full CLI."""
+        assert run(["--help"], project) is None
+        assert run(["--json", "--verbose"], project) is None
+
+
+class TestPackagedCommands:
+    """Test suite for packaging command files that call the CLI."""
+
+    def test_python_prereqs(self) -> None:
+        """The script invocation is swapped for `twitterify prereqs`, flags kept."""
+        source = load_source(SOURCE_DIR)
+        default = render_commands(source, "claude", "sh")[".claude/commands/twitterkit.analyze.md"].decode()
+        swapped = render_commands(source, "claude", "sh", python_prereqs=True)[
+            ".claude/commands/twitterkit.analyze.md"
+        ].decode()
+
+        assert "check-prerequisites.sh --json --require-tasks --include-tasks" in default
+        assert "check-prerequisites" not in swapped
+        assert "`twitterify prereqs --json --require-tasks --include-tasks`" in swapped
@@ -0,0 +1,99 @@
+"""
+Tests for the --profile subprocess tracing and phase timing.
+
+Covers:
+- Span recording and aggregation
+- Chrome trace-event output
+- Global --profile / --profile-trace flags
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Generator
+
+import pytest
+from typer.testing import CliRunner
+
+from twitterify_cli import app
+from twitterify_cli.profiling import Profiler, profiler
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def temp_dir() -> Generator[Path, None, None]:
+    """Create a temporary directory for test files."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+class TestProfiler:
+    """Test suite for the Profiler class."""
+
+    def test_disabled_profiler_records_nothing(self) -> None:
+        """Spans are free no-ops until the profiler is enabled."""
+        local = Profiler()
+
+        with local.span("work"):
+            pass
+        local.run([sys.executable, "-c", "pass"])
+
+        assert local.events == []
+
+    def test_spans_are_aggregated(self) -> None:
+        """Spans with the same category and name are summed."""
+        local = Profiler()
+        local.enable()
+
+        for _ in range(3):
+            with local.span("copy file", "copy"):
+                pass
+        local.run([sys.executable, "-c", "pass"])
+
+        rows = {(row["category"], row["name"]): row for row in local.summarize()}
+        assert rows[("copy", "copy file")]["count"] == 3
+        assert rows[("subprocess", f"{sys.executable} pass")]["count"] == 1
+
+    def test_subprocess_named_after_subcommand(self) -> None:
+        """Git calls are grouped by subcommand, skipping global options."""
+        local = Profiler()
+        local.enable()
+
+        local.run(["git", "--literal-pathspecs", "rev-parse", "--git-dir"], capture_output=True)
+
+        assert [event["name"] for event in local.events] == ["git rev-parse"]
+
+    def test_chrome_trace_format(self, temp_dir: Path) -> None:
+        """Trace files contain complete ('X') events in microseconds."""
+        local = Profiler()
+        local.enable()
+        with local.span("phase one", detail="x"):
+            pass
+
+        trace_path = temp_dir / "trace.json"
+        local.write_chrome_trace(trace_path)
+
+        events = json.loads(trace_path.read_text())["traceEvents"]
+        assert events[0]["ph"] == "X"
+        assert events[0]["name"] == "phase one"
+        assert events[0]["args"] == {"detail": "x"}
+        assert events[0]["dur"] >= 0
+
+
+class TestProfileFlag:
+    """Test suite for the global --profile flag."""
+
+    def test_profile_init_writes_trace(self, temp_dir: Path) -> None:
+        """init under --profile-trace records git, copy and render spans."""
+        os.chdir(temp_dir)
+        trace_path = temp_dir / "trace.json"
+
+        result = runner.invoke(app, ["--profile-trace", str(trace_path), "init", "demo", "--no-git"])
+
+        assert result.exit_code == 0
+        categories = {event["cat"] for event in json.loads(trace_path.read_text())["traceEvents"]}
+        assert {"copy", "render", "phase"} <= categories
+        assert profiler.enabled is False
@@ -0,0 +1,112 @@
+"""
+Tests for release notes generation.
+
+Covers:
+- Changelog from a single git log between releases
+- Asset list taken from the build manifest
+- `twitterify release notes` version checks
+"""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from twitterify_cli import app
+from twitterify_cli.packager import Packager, archive_name, load_manifest
+from twitterify_cli.release_notes import changelog, format_size, render_release_notes, write_release_notes
+
+runner = CliRunner()
+
+SOURCE_DIR = Path(__file__).parent.parent / ".twitterkit"
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A git repository with a tagged release followed by two commits."""
+    for var in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        monkeypatch.setenv(var, "Test")
+    for var in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        monkeypatch.setenv(var, "test@example.com")
+
+    path = tmp_path / "repo"
+    path.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=path, check=True)
+    for message in ("Initial templates", "Add plan command", "Fix tasks template"):
+        subprocess.run(["git", "commit", "-q", "--allow-empty", "-m", message], cwd=path, check=True)
+        if message == "Initial templates":
+            subprocess.run(["git", "tag", "v1.0.0"], cwd=path, check=True)
+    return path
+
+
+class TestChangelog:
+    """Test suite for the changelog."""
+
+    def test_commits_since_previous(self, repo: Path) -> None:
+        """Commits after the previous tag are listed newest first."""
+        assert changelog(repo, "v1.0.0") == ["Fix tasks template", "Add plan command"]
+        assert changelog(repo, "v1.0.0", until="HEAD~1") == ["Add plan command"]
+
+    def test_initial_release(self, repo: Path) -> None:
+        """No previous tag, or an unknown one, means an initial release."""
+        assert changelog(repo, None) is None
+        assert changelog(repo, "v0.9.9") is None
+
+    def test_format_size(self) -> None:
+        """Sizes are shown in B, KB or MB."""
+        assert format_size(900) == "900 B"
+        assert format_size(62_566) == "61.1 KB"
+        assert format_size(3 * 1024 * 1024) == "3.0 MB"
+
+
+class TestReleaseNotes:
+    """Test suite for writing release notes from the manifest."""
+
+    def test_lists_built_variants(self, tmp_path: Path, repo: Path) -> None:
+        """Only the manifest's version is listed, with sizes and hashes."""
+        release = tmp_path / "release"
+        Packager(SOURCE_DIR).build("v1.0.0", release, agents=["claude"], jobs=1)
+        Packager(SOURCE_DIR).build("v2.0.0", release, agents=["claude", "gemini"], scripts=["sh"], jobs=1)
+        output = tmp_path / "release_notes.md"
+
+        summary = write_release_notes(release, output, "v2.0.0", previous="v1.0.0", repo_dir=repo)
+
+        notes = output.read_text()
+        manifest = load_manifest(release)
+        assert summary["variants"] == 2
+        assert "This release contains 2 template variants" in notes
+        assert "supporting 2 AI coding agents with bash scripts" in notes
+        for agent in ("claude", "gemini"):
+            name = archive_name(agent, "sh", "v2.0.0")
+            assert f"| {name} |" in notes
+            assert manifest["variants"][name]["sha256"] in notes
+        assert archive_name("claude", "sh", "v1.0.0") not in notes
+        assert "- Google Gemini (.gemini/commands/)" in notes
+
+    def test_unknown_agent_listed_last(self) -> None:
+        """Agents no longer in AGENT_CONFIG (older manifests) are listed last instead of failing."""
+        variants = {
+            archive_name(agent, "sh", "v1.0.0"): {"agent": agent, "script": "sh", "size": 1024, "sha256": "0" * 64}
+            for agent in ("retired-agent", "claude")
+        }
+
+        notes = render_release_notes({"version": "v1.0.0", "variants": variants}, None)
+
+        assert "supporting 2 AI coding agents with bash scripts" in notes
+        assert notes.index("(.claude/commands/)") < notes.index("- retired-agent")
+
+    def test_cli_rejects_other_version(self, tmp_path: Path) -> None:
+        """Notes can't be written for a version the directory wasn't built for."""
+        Packager(SOURCE_DIR).build("v1.0.0", tmp_path, agents=["claude"], jobs=1)
+        output = tmp_path / "release_notes.md"
+
+        result = runner.invoke(app, ["release", "notes", "v2.0.0", "--dir", str(tmp_path), "-o", str(output)])
+
+        assert result.exit_code == 1
+        assert "built for v1.0.0, not v2.0.0" in " ".join(result.stdout.split())
+        assert not output.exists()
+
+        result = runner.invoke(app, ["release", "notes", "v1.0.0", "--dir", str(tmp_path), "-o", str(output)])
+        assert result.exit_code == 0
+        assert "- Initial release" in output.read_text()
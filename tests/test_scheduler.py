@@ -0,0 +1,130 @@
+"""
+Tests for task execution planning.
+
+Covers:
+- Dependency edges from phases, sections, [P] markers and explicit references
+- Cycles, unknown references and checked-off tasks
+- Critical path and scheduling for a number of workers
+- `twitterify tasks plan` JSON output
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from twitterify_cli import app
+from twitterify_cli.artifacts import parse_markdown
+from twitterify_cli.scheduler import TaskPlanError, build_graph, plan_tasks, topological_order
+
+runner = CliRunner()
+
+TASKS = """# Twitter Execution Tasks: Launch
+
+## Phase 1: Setup
+
+- [ ] T001 Create profile
+- [ ] T002 [P] Draft bio
+- [ ] T003 Pin tweet
+
+## Phase 2: Launch
+
+### A. Threads
+
+- [ ] T004 Write thread
+- [ ] T005 Schedule thread
+
+### B. Replies
+
+- [x] T006 Set up reply templates
+- [ ] T007 Reply to mentions
+- [ ] T008 [P] Engage with partners (depends on T005, T099)
+"""
+
+
+def _tasks(text: str = TASKS):
+    return parse_markdown(text, "tasks", "tasks.md")
+
+
+class TestBuildGraph:
+    """Test suite for build_graph()."""
+
+    def test_edges(self) -> None:
+        """Sequential tasks chain per section, phases wait for the previous one, references add edges."""
+        deps, warnings = build_graph(_tasks())
+
+        assert deps == {
+            "T001": [],
+            "T002": [],
+            "T003": ["T001"],
+            "T004": ["T002", "T003"],
+            "T005": ["T002", "T003", "T004"],
+            "T007": ["T002", "T003"],
+            "T008": ["T002", "T003", "T005"],
+        }
+        assert warnings == ["T008 depends on unknown task T099"]
+
+    def test_include_done(self) -> None:
+        """Checked-off tasks are scheduled too when asked."""
+        deps, _ = build_graph(_tasks(), include_done=True)
+
+        assert deps["T006"] == ["T002", "T003"]
+        assert deps["T007"] == ["T002", "T003", "T006"]
+
+    def test_cycle(self) -> None:
+        """A dependency cycle is reported with the tasks in it."""
+        text = "- [ ] T001 [P] Draft (after T002)\n- [ ] T002 [P] Review (after T001)\n- [ ] T003 [P] Post\n"
+        deps, _ = build_graph(_tasks(text))
+
+        with pytest.raises(TaskPlanError, match="T001 → T002 → T001|T002 → T001 → T002"):
+            topological_order(deps)
+
+
+class TestPlanTasks:
+    """Test suite for plan_tasks()."""
+
+    def test_critical_path_and_lanes(self) -> None:
+        """Critical-path tasks go first and each worker gets its own lane."""
+        plan = plan_tasks(_tasks(), workers=2)
+
+        assert plan["critical_path"] == {"length": 5, "tasks": ["T001", "T003", "T004", "T005", "T008"]}
+        assert plan["steps"] == [["T001", "T002"], ["T003"], ["T004", "T007"], ["T005"], ["T008"]]
+        assert plan["makespan"] == 5
+        assert plan["lanes"][1] == {"worker": 2, "tasks": [{"id": "T002", "step": 1}, {"id": "T007", "step": 3}]}
+
+    def test_workers(self) -> None:
+        """One worker runs everything in turn; unlimited workers take the critical path's length."""
+        assert plan_tasks(_tasks(), workers=1)["makespan"] == 7
+        unlimited = plan_tasks(_tasks(), workers=0)
+        assert unlimited["makespan"] == unlimited["critical_path"]["length"]
+        assert len(unlimited["lanes"]) == 2
+
+
+class TestTasksPlanCommand:
+    """Test suite for `twitterify tasks plan`."""
+
+    def test_json(self, tmp_path: Path) -> None:
+        """JSON output is the plan for the feature's tasks.md."""
+        feature = tmp_path / "specs" / "003-launch"
+        feature.mkdir(parents=True)
+        (feature / "tasks.md").write_text(TASKS)
+        os.chdir(tmp_path)
+
+        result = runner.invoke(app, ["tasks", "plan", "--feature", "003-launch", "--workers", "2", "--json"])
+
+        assert result.exit_code == 0
+        plan = json.loads(result.stdout)
+        assert plan["feature"] == "003-launch"
+        assert plan["makespan"] == 5
+
+    def test_missing_tasks(self, tmp_path: Path) -> None:
+        """A feature without tasks.md is an error."""
+        (tmp_path / "specs" / "003-launch").mkdir(parents=True)
+        os.chdir(tmp_path)
+
+        result = runner.invoke(app, ["tasks", "plan", "--feature", "003-launch"])
+
+        assert result.exit_code == 1
+        assert "tasks.md not found" in result.stdout
@@ -0,0 +1,135 @@
+"""
+Tests for the end-to-end template smoke test.
+
+Covers:
+- Extraction that keeps bundled scripts executable
+- Command file placement checks against AGENT_CONFIG
+- Running the bundled check-prerequisites script in each install
+- `twitterify release smoke` exit codes and JSON report
+"""
+
+import io
+import json
+import os
+import zipfile
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from twitterify_cli import app
+from twitterify_cli.packager import Packager, archive_name
+from twitterify_cli.smoke import SMOKE_FEATURE, check_commands, extract_archive, smoke_test, source_variants
+
+runner = CliRunner()
+
+SOURCE_DIR = Path(__file__).parent.parent / ".twitterkit"
+PLAN_COMMAND = ".claude/commands/twitterkit.plan.md"
+
+
+@pytest.fixture
+def no_pwsh(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Behave as if PowerShell is not installed."""
+    monkeypatch.setattr("twitterify_cli.smoke.shutil.which", lambda name: None)
+
+
+def _without(archive: bytes, removed: str) -> bytes:
+    """Copy an archive, dropping one entry."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(archive)) as source, zipfile.ZipFile(buffer, "w") as target:
+        for info in source.infolist():
+            if info.filename != removed:
+                target.writestr(info, source.read(info))
+    return buffer.getvalue()
+
+
+class TestInstall:
+    """Test suite for installing a variant."""
+
+    def test_extract_keeps_scripts_executable(self, tmp_path: Path) -> None:
+        """Permission bits recorded in the archive are restored."""
+        (_, _, archive), = source_variants(SOURCE_DIR, agents=["claude"], scripts=["sh"])
+        extract_archive(archive, tmp_path)
+
+        script = tmp_path / ".twitterkit" / "scripts" / "bash" / "check-prerequisites.sh"
+        assert os.access(script, os.X_OK)
+
+    def test_check_commands(self, tmp_path: Path) -> None:
+        """Missing and misnamed command files are reported."""
+        (_, _, archive), = source_variants(SOURCE_DIR, agents=["gemini"], scripts=["sh"])
+        extract_archive(archive, tmp_path)
+        assert check_commands(tmp_path, "gemini") == []
+
+        commands = tmp_path / ".gemini" / "commands"
+        (commands / "twitterkit.plan.toml").rename(commands / "twitterkit.plan.md")
+
+        assert check_commands(tmp_path, "gemini") == [
+            "Missing .gemini/commands/twitterkit.plan.toml",
+            "Unexpected .gemini/commands/twitterkit.plan.md",
+        ]
+
+
+class TestSmokeTest:
+    """Test suite for running variants end to end."""
+
+    def test_scripts_resolve_install(self, tmp_path: Path, no_pwsh: None) -> None:
+        """check-prerequisites reports paths inside each install; ps is skipped without pwsh."""
+        variants = source_variants(SOURCE_DIR, agents=["claude", "copilot"])
+        results = smoke_test(variants, jobs=4, work_dir=tmp_path)
+
+        assert [(r["agent"], r["script"]) for r in results] == [
+            ("claude", "sh"), ("claude", "ps"), ("copilot", "sh"), ("copilot", "ps"),
+        ]
+        assert all(result["passed"] for result in results)
+        for result in results:
+            if result["script"] == "sh":
+                project = Path(result["project"]).resolve()
+                assert result["skipped"] is None
+                assert Path(result["paths"]["REPO_ROOT"]) == project
+                assert Path(result["paths"]["FEATURE_DIR"]) == project / "specs" / SMOKE_FEATURE
+                assert result["timings"]["script_ms"] > 0
+            else:
+                assert result["skipped"] == "pwsh not installed"
+
+    def test_missing_command_fails(self, tmp_path: Path) -> None:
+        """A variant missing a command file fails with a precise message."""
+        (agent, script, archive), = source_variants(SOURCE_DIR, agents=["claude"], scripts=["sh"])
+        (result,) = smoke_test([(agent, script, _without(archive, PLAN_COMMAND))], work_dir=tmp_path)
+
+        assert not result["passed"]
+        assert result["failures"] == [f"Missing {PLAN_COMMAND}"]
+
+    def test_non_executable_script_fails(self, tmp_path: Path) -> None:
+        """A script that lost its executable bit cannot run and fails the variant."""
+        (agent, script, archive), = source_variants(SOURCE_DIR, agents=["claude"], scripts=["sh"])
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(io.BytesIO(archive)) as source, zipfile.ZipFile(buffer, "w") as target:
+            for info in source.infolist():
+                info.external_attr = (0o100644 if not info.is_dir() else 0o40755) << 16
+                target.writestr(info, source.read(info))
+
+        (result,) = smoke_test([(agent, script, buffer.getvalue())], work_dir=tmp_path)
+
+        assert not result["passed"]
+        assert result["failures"][0].startswith("Cannot run check-prerequisites.sh")
+
+
+class TestSmokeCommand:
+    """Test suite for `twitterify release smoke`."""
+
+    def test_release_directory(self, tmp_path: Path, no_pwsh: None) -> None:
+        """Archives in a release directory are tested and reported as JSON."""
+        Packager(SOURCE_DIR).build("v1.0.0", tmp_path, agents=["claude", "gemini"], jobs=1)
+
+        result = runner.invoke(app, ["release", "smoke", str(tmp_path), "--scripts", "sh", "--json"])
+
+        assert result.exit_code == 0
+        report = json.loads(result.stdout)
+        assert (report["total"], report["passed"], report["failed"]) == (2, 2, 0)
+
+        archive = tmp_path / archive_name("claude", "sh", "v1.0.0")
+        archive.write_bytes(_without(archive.read_bytes(), PLAN_COMMAND))
+
+        result = runner.invoke(app, ["release", "smoke", str(tmp_path), "--scripts", "sh"])
+        assert result.exit_code == 1
+        assert f"Missing {PLAN_COMMAND}" in result.stdout
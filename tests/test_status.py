@@ -0,0 +1,104 @@
+"""
+Integration tests for the twitterify status command.
+
+Covers fleet status across many twitterkit projects:
+- Project discovery (directories containing .twitterkit/)
+- Concurrent branch/status collection
+- Reporting why git status failed
+- JSON output
+"""
+
+import json
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Generator
+
+import pytest
+from typer.testing import CliRunner
+
+from twitterify_cli import app
+from twitterify_cli.commands.status import collect_status, discover_projects
+from twitterify_cli.profiling import profiler
+
+runner = CliRunner()
+
+
+def _make_project(path: Path, git: bool = True) -> Path:
+    """Create a minimal twitterkit project, optionally as a git repo."""
+    (path / ".twitterkit" / "memory").mkdir(parents=True)
+    if git:
+        subprocess.run(["git", "init", "-q", "-b", "main"], cwd=path, check=True)
+    return path
+
+
+@pytest.fixture
+def fleet_root() -> Generator[Path, None, None]:
+    """Create a directory holding several twitterkit projects."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        _make_project(root / "alpha")
+        _make_project(root / "group" / "beta")
+        _make_project(root / "plain", git=False)
+        (root / "not-a-project").mkdir()
+        yield root
+
+
+class TestProjectDiscovery:
+    """Test suite for project discovery."""
+
+    def test_discovers_nested_projects(self, fleet_root: Path) -> None:
+        """Projects at any depth up to max_depth are found, others ignored."""
+        projects = discover_projects(fleet_root)
+
+        names = [p.relative_to(fleet_root).as_posix() for p in projects]
+        assert names == ["alpha", "group/beta", "plain"]
+
+    def test_respects_max_depth(self, fleet_root: Path) -> None:
+        """Projects deeper than max_depth are skipped."""
+        projects = discover_projects(fleet_root, max_depth=1)
+
+        names = [p.relative_to(fleet_root).as_posix() for p in projects]
+        assert "group/beta" not in names
+
+
+class TestCollectStatus:
+    """Test suite for concurrent status collection."""
+
+    def test_reports_dirty_and_clean(self, fleet_root: Path) -> None:
+        """Untracked files mark a project as modified."""
+        (fleet_root / "alpha" / "draft.md").write_text("draft")
+        projects = [fleet_root / "alpha", fleet_root / "group" / "beta"]
+
+        results = collect_status(projects, jobs=2)
+
+        by_name = {Path(r["path"]).name: r for r in results}
+        assert by_name["alpha"]["clean"] is False
+        assert any("draft.md" in line for line in by_name["alpha"]["changes"])
+        assert by_name["alpha"]["branch"] == "main"
+        assert by_name["beta"]["error"] is None
+
+    def test_reports_git_errors(self, fleet_root: Path) -> None:
+        """Git's own error is reported for directories that aren't repositories."""
+        result = collect_status([fleet_root / "plain"])[0]
+
+        assert result["error"].startswith("not a git repository")
+
+    def test_reports_timeouts(self, fleet_root: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A slow or locked repository is reported as timed out, not as missing."""
+
+        def slow(args, **kwargs):
+            raise subprocess.TimeoutExpired(args, kwargs["timeout"])
+
+        monkeypatch.setattr(profiler, "run", slow)
+        result = collect_status([fleet_root / "alpha"])[0]
+
+        assert result["error"] == "git status timed out after 5s"
+
+    def test_status_command_json(self, fleet_root: Path) -> None:
+        """--json prints one entry per project with relative paths."""
+        result = runner.invoke(app, ["status", str(fleet_root), "--json"])
+
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert [entry["path"] for entry in data] == ["alpha", "group/beta", "plain"]
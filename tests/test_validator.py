@@ -0,0 +1,138 @@
+"""
+Tests for the release template validator.
+
+Covers:
+- Single-pass archive checks
+- Failure detection (namespace, /speckit. references, missing files, corruption)
+- `twitterify release validate` JSON report
+"""
+
+import io
+import json
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Dict, Generator
+
+import pytest
+from typer.testing import CliRunner
+
+from twitterify_cli import app
+from twitterify_cli.packager import archive_name, build_archive, load_source
+from twitterify_cli.validator import validate_archive, validate_archives
+
+runner = CliRunner()
+
+SOURCE_DIR = Path(__file__).parent.parent / ".twitterkit"
+
+
+@pytest.fixture
+def temp_dir() -> Generator[Path, None, None]:
+    """Create a temporary directory for test files."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+def _members(agent: str = "claude", script: str = "sh") -> Dict[str, bytes]:
+    """Return the files of a freshly built variant."""
+    data = build_archive(load_source(SOURCE_DIR), agent, script)
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        return {name: archive.read(name) for name in archive.namelist() if not name.endswith("/")}
+
+
+def _write(path: Path, members: Dict[str, bytes]) -> Path:
+    """Write members to a ZIP at path."""
+    with zipfile.ZipFile(path, "w") as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    return path
+
+
+def _failed(result: dict) -> set:
+    """Names of the failed checks in a result."""
+    return {check["name"] for check in result["checks"] if not check["passed"]}
+
+
+class TestValidateArchive:
+    """Test suite for validating a single archive."""
+
+    @pytest.mark.parametrize("agent", ["claude", "gemini", "copilot"])
+    def test_built_variant_passes(self, temp_dir: Path, agent: str) -> None:
+        """Archives from the packager pass every check, Copilot included."""
+        path = _write(temp_dir / archive_name(agent, "ps", "v1"), _members(agent, "ps"))
+
+        result = validate_archive(path)
+
+        assert result["passed"], result["checks"]
+
+    def test_every_command_file_scanned(self, temp_dir: Path) -> None:
+        """A /speckit. reference in any command file is reported, not just a sample."""
+        members = _members()
+        members[".claude/commands/twitterkit.tasks.md"] += b"\nRun /speckit.tasks next\n"
+        path = _write(temp_dir / archive_name("claude", "sh", "v1"), members)
+
+        result = validate_archive(path)
+
+        assert _failed(result) == {"speckit_references"}
+
+    def test_misnamed_and_missing_commands(self, temp_dir: Path) -> None:
+        """Commands must use twitterkit.* naming and match the template count."""
+        members = _members()
+        members[".claude/commands/speckit.plan.md"] = members.pop(".claude/commands/twitterkit.plan.md")
+        misnamed = validate_archive(_write(temp_dir / "a-sh-v1.zip", members))
+
+        del members[".claude/commands/speckit.plan.md"]
+        missing = validate_archive(_write(temp_dir / "b-sh-v1.zip", members))
+
+        assert _failed(misnamed) == {"namespace"}
+        assert "expected" in next(c for c in missing["checks"] if c["name"] == "namespace")["message"]
+
+    def test_missing_required_files_and_scripts(self, temp_dir: Path) -> None:
+        """Required files and the script directory for the variant are checked."""
+        members = {
+            name: content
+            for name, content in _members().items()
+            if name != ".twitterkit/templates/plan-template.md" and "/scripts/" not in name
+        }
+        result = validate_archive(_write(temp_dir / archive_name("claude", "sh", "v1"), members))
+
+        assert _failed(result) == {"required_files", "directory_structure", "script_consistency"}
+
+    def test_corrupt_archive(self, temp_dir: Path) -> None:
+        """A CRC mismatch fails the integrity check."""
+        path = _write(temp_dir / archive_name("claude", "sh", "v1"), _members())
+        data = bytearray(path.read_bytes())
+        offset = data.index(b"twitter", 200)
+        data[offset] ^= 0xFF
+        path.write_bytes(bytes(data))
+
+        result = validate_archive(path)
+
+        assert not result["passed"]
+        assert _failed(result) == {"zip_integrity"}
+
+
+class TestReleaseValidate:
+    """Test suite for `twitterify release validate`."""
+
+    def test_json_report(self, temp_dir: Path) -> None:
+        """A directory is validated in parallel and reported as JSON."""
+        _write(temp_dir / archive_name("claude", "sh", "v1"), _members())
+        bad = _members("gemini", "sh")
+        del bad[".twitterkit/memory/constitution.md"]
+        _write(temp_dir / archive_name("gemini", "sh", "v1"), bad)
+
+        result = runner.invoke(app, ["release", "validate", str(temp_dir), "--json"])
+
+        assert result.exit_code == 1
+        report = json.loads(result.stdout)
+        assert (report["total"], report["passed"], report["failed"]) == (2, 1, 1)
+        assert [a["passed"] for a in report["archives"]] == [True, False]
+
+    def test_results_keep_input_order(self, temp_dir: Path) -> None:
+        """Concurrent validation returns results in archive order."""
+        paths = [_write(temp_dir / archive_name(a, "sh", "v1"), _members(a)) for a in ("roo", "amp", "q")]
+
+        results = validate_archives(paths, jobs=3)
+
+        assert [r["archive"] for r in results] == [p.name for p in paths]
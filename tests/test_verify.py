@@ -0,0 +1,118 @@
+"""
+Tests for archive checksum verification.
+
+Covers:
+- Parsing sha256sum-format checksum files
+- Verification against CHECKSUMS.sha256 and build-manifest.json
+- Legacy list-format manifests
+- `twitterify verify` exit codes and JSON report
+"""
+
+import json
+import tempfile
+from pathlib import Path
+from typing import Generator
+
+import pytest
+from typer.testing import CliRunner
+
+from twitterify_cli import app
+from twitterify_cli.checksums import read_checksums, verify_directory
+from twitterify_cli.packager import CHECKSUMS_NAME, MANIFEST_NAME, Packager, archive_name
+
+runner = CliRunner()
+
+SOURCE_DIR = Path(__file__).parent.parent / ".twitterkit"
+
+
+@pytest.fixture
+def release_dir() -> Generator[Path, None, None]:
+    """Build a small release with manifest and checksums."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir)
+        Packager(SOURCE_DIR).build("v1", path, agents=["claude", "gemini"], jobs=1)
+        yield path
+
+
+class TestReadChecksums:
+    """Test suite for checksum file parsing."""
+
+    def test_sha256sum_formats(self, tmp_path: Path) -> None:
+        """Text, binary (*) and ./-prefixed entries are all understood."""
+        path = tmp_path / CHECKSUMS_NAME
+        path.write_text("AAAA  a.zip\nbbbb *b.zip\ncccc  ./c.zip\n\n")
+
+        assert read_checksums(path) == {"a.zip": "aaaa", "b.zip": "bbbb", "c.zip": "cccc"}
+
+
+class TestVerifyDirectory:
+    """Test suite for verifying a release directory."""
+
+    def test_clean_release(self, release_dir: Path) -> None:
+        """A freshly built release verifies against both sources."""
+        report = verify_directory(release_dir)
+
+        assert report["sources"] == [CHECKSUMS_NAME, MANIFEST_NAME]
+        assert len(report["verified"]) == 4
+        assert report["problems"] == []
+
+    def test_reports_precise_diff(self, release_dir: Path) -> None:
+        """Corrupt, missing and unlisted archives are each reported."""
+        corrupt = archive_name("claude", "sh", "v1")
+        with (release_dir / corrupt).open("ab") as f:
+            f.write(b"x")
+        (release_dir / archive_name("gemini", "ps", "v1")).unlink()
+        (release_dir / "stray.zip").write_bytes(b"stray")
+
+        report = verify_directory(release_dir)
+
+        issues = {(p["file"], p["issue"], p["source"]) for p in report["problems"]}
+        assert (corrupt, "sha256", CHECKSUMS_NAME) in issues
+        assert (corrupt, "size", MANIFEST_NAME) in issues
+        assert (archive_name("gemini", "ps", "v1"), "missing", CHECKSUMS_NAME) in issues
+        assert ("stray.zip", "unlisted", MANIFEST_NAME) in issues
+        assert corrupt not in report["verified"]
+
+    def test_requires_a_source(self, tmp_path: Path) -> None:
+        """Directories without checksums or manifest are rejected."""
+        with pytest.raises(ValueError):
+            verify_directory(tmp_path)
+
+    def test_legacy_list_manifest(self, release_dir: Path) -> None:
+        """A list-format manifest is skipped; checksums are still verified."""
+        (release_dir / MANIFEST_NAME).write_text(json.dumps({"variants": [{"agent": "claude"}]}))
+
+        report = verify_directory(release_dir)
+
+        assert report["sources"] == [CHECKSUMS_NAME]
+        assert report["problems"] == []
+
+        (release_dir / CHECKSUMS_NAME).unlink()
+        with pytest.raises(ValueError, match="no variants mapping"):
+            verify_directory(release_dir)
+
+
+class TestVerifyCommand:
+    """Test suite for `twitterify verify`."""
+
+    def test_exit_codes(self, release_dir: Path) -> None:
+        """Exit 0 when everything matches, 1 with a diff otherwise."""
+        assert runner.invoke(app, ["verify", str(release_dir)]).exit_code == 0
+
+        (release_dir / archive_name("gemini", "sh", "v1")).write_bytes(b"tampered")
+        result = runner.invoke(app, ["verify", str(release_dir), "--json"])
+
+        assert result.exit_code == 1
+        report = json.loads(result.stdout)
+        assert {p["issue"] for p in report["problems"]} == {"sha256", "size"}
+
+    def test_legacy_manifest_without_checksums(self, release_dir: Path) -> None:
+        """A list-format manifest alone is reported as an error, not a traceback."""
+        (release_dir / MANIFEST_NAME).write_text(json.dumps({"variants": []}))
+        (release_dir / CHECKSUMS_NAME).unlink()
+
+        result = runner.invoke(app, ["verify", str(release_dir)])
+
+        assert result.exit_code == 1
+        assert result.exception is None or isinstance(result.exception, SystemExit)
+        assert "no variants mapping" in result.stdout
@@ -0,0 +1,222 @@
+"""
+Tests for watch mode.
+
+Covers:
+- inotify and polling change detection, including new directories
+- Incremental handling: index updates, command installs, context regeneration
+- Command files edited locally are left alone
+- Debounced batches from `watch()`
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Set
+
+import pytest
+
+from twitterify_cli.watch import (
+    ChangeHandler,
+    InotifyWatcher,
+    PollingWatcher,
+    installed_agents,
+    watch,
+)
+from twitterify_cli.workspace import SpecsIndex
+
+TEMPLATE = "Run `.twitterkit/scripts/bash/check-prerequisites.sh` with $ARGUMENTS\n"
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """A project with Claude commands and context installed and one feature."""
+    (tmp_path / ".twitterkit" / "templates" / "commands").mkdir(parents=True)
+    (tmp_path / ".twitterkit" / "templates" / "commands" / "twitterkit.plan.md").write_text(TEMPLATE)
+    (tmp_path / ".twitterkit" / "scripts" / "bash").mkdir(parents=True)
+    (tmp_path / ".twitterkit" / "memory").mkdir()
+    (tmp_path / ".twitterkit" / "memory" / "constitution.md").write_text("Be helpful.\n")
+    (tmp_path / ".claude" / "commands").mkdir(parents=True)
+    (tmp_path / ".claude" / "commands" / "twitterkit.plan.md").write_text(TEMPLATE)
+    (tmp_path / ".claude" / "memory.md").write_text("old\n")
+    (tmp_path / "specs" / "001-launch").mkdir(parents=True)
+    return tmp_path
+
+
+def _inotify(root: Path):
+    try:
+        return InotifyWatcher(root)
+    except OSError:
+        pytest.skip("inotify not available")
+
+
+WATCHERS = {
+    "inotify": _inotify,
+    "polling": lambda root: PollingWatcher(root, interval=0.05),
+}
+
+
+def _collect(watcher, until: Set[Path], timeout: float = 5.0) -> Set[Path]:
+    """Gather reported changes until the expected paths are all seen."""
+    seen: Set[Path] = set()
+    deadline = time.monotonic() + timeout
+    while not until <= seen and time.monotonic() < deadline:
+        seen |= watcher.wait(0.2)
+    return seen
+
+
+class TestWatchers:
+    """Test suite for the change detection backends."""
+
+    @pytest.mark.parametrize("backend", WATCHERS)
+    def test_file_changes(self, project: Path, backend: str) -> None:
+        """Edits, new files and deletions are reported relative to the root."""
+        watcher = WATCHERS[backend](project)
+        try:
+            (project / "specs" / "001-launch" / "plan.md").write_text("plan\n")
+            (project / ".twitterkit" / "memory" / "constitution.md").unlink()
+            expected = {Path("specs/001-launch/plan.md"), Path(".twitterkit/memory/constitution.md")}
+
+            assert expected <= _collect(watcher, expected)
+        finally:
+            watcher.close()
+
+    @pytest.mark.parametrize("backend", WATCHERS)
+    def test_new_directories(self, project: Path, backend: str) -> None:
+        """Files in directories created after the watch started are seen."""
+        watcher = WATCHERS[backend](project)
+        try:
+            (project / "specs" / "002-waitlist" / "contracts").mkdir(parents=True)
+            (project / "specs" / "002-waitlist" / "contracts" / "api.md").write_text("api\n")
+            assert Path("specs/002-waitlist/contracts/api.md") in _collect(
+                watcher, {Path("specs/002-waitlist/contracts/api.md")}
+            )
+
+            (project / "specs" / "002-waitlist" / "contracts" / "api.md").write_text("changed\n")
+            assert Path("specs/002-waitlist/contracts/api.md") in _collect(
+                watcher, {Path("specs/002-waitlist/contracts/api.md")}
+            )
+        finally:
+            watcher.close()
+
+    def test_target_created_later(self, tmp_path: Path) -> None:
+        """A specs/ directory that didn't exist at start is watched once created."""
+        watcher = _inotify(tmp_path)
+        try:
+            (tmp_path / "specs" / "001-launch").mkdir(parents=True)
+            assert Path("specs/001-launch") in _collect(watcher, {Path("specs/001-launch")})
+
+            (tmp_path / "specs" / "001-launch" / "spec.md").touch()
+            assert Path("specs/001-launch/spec.md") in _collect(watcher, {Path("specs/001-launch/spec.md")})
+        finally:
+            watcher.close()
+
+
+class TestChangeHandler:
+    """Test suite for applying batches of changes."""
+
+    def test_template_installed_for_installed_agents(self, project: Path) -> None:
+        """Only installed agents get the changed command, copied as init does; unchanged files aren't rewritten."""
+        template = project / ".twitterkit" / "templates" / "commands" / "twitterkit.plan.md"
+        with ChangeHandler(project) as handler:
+            template.write_text(TEMPLATE + "Then {SCRIPT}.\n")
+            result = handler.apply({Path(".twitterkit/templates/commands/twitterkit.plan.md")})
+
+            assert installed_agents(project) == ["claude"]
+            assert result["commands"] == [".claude/commands/twitterkit.plan.md"]
+            assert (project / ".claude" / "commands" / "twitterkit.plan.md").read_text() == template.read_text()
+            assert not (project / ".gemini").exists()
+
+            assert handler.apply({Path(".twitterkit/templates/commands/twitterkit.plan.md")})["commands"] == []
+
+    def test_local_edits_kept(self, project: Path) -> None:
+        """Command files edited locally are reported as conflicts and not overwritten."""
+        command = project / ".claude" / "commands" / "twitterkit.plan.md"
+        command.write_text("my version\n")
+        with ChangeHandler(project) as handler:
+            (project / ".twitterkit" / "templates" / "commands" / "twitterkit.plan.md").write_text("new\n")
+            result = handler.apply({Path(".twitterkit/templates/commands/twitterkit.plan.md")})
+
+        assert result["commands"] == []
+        assert result["conflicts"] == [".claude/commands/twitterkit.plan.md"]
+        assert command.read_text() == "my version\n"
+
+    def test_deleted_template_removes_command(self, project: Path) -> None:
+        """A removed template removes the agents' command file."""
+        with ChangeHandler(project) as handler:
+            (project / ".twitterkit" / "templates" / "commands" / "twitterkit.plan.md").unlink()
+            result = handler.apply({Path(".twitterkit/templates/commands/twitterkit.plan.md")})
+
+        assert result["commands"] == [".claude/commands/twitterkit.plan.md"]
+        assert not (project / ".claude" / "commands" / "twitterkit.plan.md").exists()
+
+    def test_memory_regenerates_existing_contexts(self, project: Path) -> None:
+        """Constitution changes rewrite the context files that exist, and nothing else."""
+        with ChangeHandler(project) as handler:
+            result = handler.apply({Path(".twitterkit/memory/constitution.md")})
+
+        assert result == {"features": [], "commands": [], "conflicts": [], "contexts": [".claude/memory.md"]}
+        assert "Be helpful." in (project / ".claude" / "memory.md").read_text()
+        assert not (project / ".cursor").exists()
+
+    def test_spec_change_rescans_only_that_feature(self, project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Editing one feature rescans just that directory."""
+        (project / "specs" / "002-waitlist").mkdir()
+        with ChangeHandler(project) as handler:
+            handler.apply({Path("specs")})
+            scanned = []
+            original = SpecsIndex._scan
+            monkeypatch.setattr(SpecsIndex, "_scan", lambda self, name: scanned.append(name) or original(self, name))
+
+            (project / "specs" / "002-waitlist" / "plan.md").touch()
+            result = handler.apply({Path("specs/002-waitlist/plan.md")})
+
+            assert result["features"] == ["002-waitlist"]
+            assert scanned == ["002-waitlist"]
+            assert handler.index.feature("002-waitlist")["docs"] == ["plan.md"]
+
+
+class TestWatch:
+    """Test suite for the watch loop."""
+
+    @pytest.mark.parametrize("polling", [False, True])
+    def test_debounced_batch(self, project: Path, polling: bool) -> None:
+        """A burst of edits is handled as one batch."""
+        batches = []
+        ready = threading.Event()
+        stopped = threading.Event()
+        thread = threading.Thread(
+            target=watch,
+            args=(project, batches.append),
+            kwargs={
+                "debounce": 0.3,
+                "polling": polling,
+                "interval": 0.05,
+                "stop": stopped.is_set,
+                "on_ready": lambda backend: ready.set(),
+            },
+        )
+        thread.start()
+        try:
+            assert ready.wait(5)
+            template = project / ".twitterkit" / "templates" / "commands" / "twitterkit.plan.md"
+            template.write_text(TEMPLATE + "1\n")
+            (project / "specs" / "001-launch" / "spec.md").touch()
+            template.write_text(TEMPLATE + "2\n")
+
+            deadline = time.monotonic() + 5
+            while not batches and time.monotonic() < deadline:
+                time.sleep(0.05)
+            time.sleep(0.5)
+        finally:
+            stopped.set()
+            thread.join(5)
+
+        assert batches == [
+            {
+                "features": ["001-launch"],
+                "commands": [".claude/commands/twitterkit.plan.md"],
+                "conflicts": [],
+                "contexts": [],
+            }
+        ]
+        assert (project / ".claude" / "commands" / "twitterkit.plan.md").read_text().endswith("2\n")
@@ -0,0 +1,177 @@
+"""
+Tests for workspace path resolution and the specs index.
+
+Covers:
+- Reading the current branch from .git without running git
+- Incremental specs/ index updates
+- Parity with check-prerequisites.sh --paths-only
+- `twitterify paths` output
+"""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from twitterify_cli import app
+from twitterify_cli.workspace import INDEX_NAME, STATE_DIR, SpecsIndex, feature_paths, find_git_dir, head_branch
+
+runner = CliRunner()
+
+CHECK_PREREQUISITES = Path(__file__).parent.parent / ".twitterkit" / "scripts" / "bash" / "check-prerequisites.sh"
+
+
+def _git(path: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=path, check=True, capture_output=True)
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A project with two features, checked out on a feature branch."""
+    for var in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        monkeypatch.setenv(var, "Test")
+    for var in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        monkeypatch.setenv(var, "test@example.com")
+    monkeypatch.delenv("TWITTERKIT_FEATURE", raising=False)
+
+    path = tmp_path / "project"
+    (path / ".twitterkit").mkdir(parents=True)
+    (path / "specs" / "001-launch").mkdir(parents=True)
+    (path / "specs" / "001-launch" / "spec.md").touch()
+    (path / "specs" / "002-waitlist").mkdir()
+    _git(path, "init", "-q", "-b", "main")
+    _git(path, "commit", "-q", "--allow-empty", "-m", "init")
+    _git(path, "checkout", "-q", "-b", "002-waitlist-v2")
+    return path
+
+
+class TestHeadBranch:
+    """Test suite for reading HEAD."""
+
+    def test_branch_detached_and_packed(self, project: Path) -> None:
+        """Loose and packed branches resolve; detached HEAD reads as HEAD."""
+        git_dir = find_git_dir(project / "specs")[1]
+        assert head_branch(git_dir) == "002-waitlist-v2"
+
+        _git(project, "pack-refs", "--all")
+        assert not (git_dir / "refs" / "heads" / "002-waitlist-v2").exists()
+        assert head_branch(git_dir) == "002-waitlist-v2"
+
+        _git(project, "checkout", "-q", "--detach")
+        assert head_branch(git_dir) == "HEAD"
+
+    def test_unborn_branch(self, tmp_path: Path) -> None:
+        """A branch without commits is treated like no branch, as git does."""
+        _git(tmp_path, "init", "-q", "-b", "main")
+        assert head_branch(tmp_path / ".git") is None
+
+    def test_linked_worktree(self, project: Path, tmp_path: Path) -> None:
+        """Worktrees resolve through their .git file."""
+        _git(project, "worktree", "add", "-q", "-b", "003-side", str(tmp_path / "side"))
+
+        root, git_dir = find_git_dir(tmp_path / "side")
+        assert root == (tmp_path / "side").resolve()
+        assert head_branch(git_dir) == "003-side"
+
+
+class TestSpecsIndex:
+    """Test suite for the persistent specs/ index."""
+
+    def test_incremental_updates(self, project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Only directories whose mtime changed are rescanned."""
+        with SpecsIndex(project) as index:
+            assert index.feature("001-launch")["docs"] == ["spec.md"]
+
+        feature = project / "specs" / "001-launch"
+        (feature / "plan.md").touch()
+        (feature / "contracts").mkdir()
+        with SpecsIndex(project) as index:
+            assert index.feature("001-launch")["docs"] == ["spec.md", "plan.md"]
+
+        (feature / "contracts" / "api.md").touch()
+        with SpecsIndex(project) as index:
+            assert index.feature("001-launch")["docs"] == ["spec.md", "plan.md", "contracts/"]
+
+        def fail(*args, **kwargs):
+            raise AssertionError("unchanged directory was rescanned")
+
+        monkeypatch.setattr(SpecsIndex, "_scan", fail)
+        with SpecsIndex(project) as index:
+            assert index.feature("001-launch")["docs"] == ["spec.md", "plan.md", "contracts/"]
+
+    def test_added_and_removed_features(self, project: Path) -> None:
+        """Feature directories are added and dropped when specs/ changes."""
+        with SpecsIndex(project) as index:
+            assert index.latest() == "002-waitlist"
+
+        (project / "specs" / "002-waitlist").rmdir()
+        (project / "specs" / "010-promo").mkdir()
+        with SpecsIndex(project) as index:
+            assert [feature["name"] for feature in index.features()] == ["001-launch", "010-promo"]
+            assert index.latest() == "010-promo"
+
+    def test_corrupt_index_is_rebuilt(self, project: Path) -> None:
+        """A damaged database file is replaced."""
+        (project / STATE_DIR).mkdir(parents=True)
+        (project / STATE_DIR / INDEX_NAME).write_bytes(b"not a database" * 100)
+
+        with SpecsIndex(project) as index:
+            assert index.with_prefix("001") == ["001-launch"]
+
+
+class TestFeaturePaths:
+    """Test suite for resolving the current feature."""
+
+    def test_matches_bash(self, project: Path) -> None:
+        """Paths agree with check-prerequisites.sh --json --paths-only."""
+        result = subprocess.run(
+            ["bash", str(CHECK_PREREQUISITES), "--json", "--paths-only"],
+            cwd=project / "specs",
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        expected = json.loads(result.stdout)
+
+        paths = feature_paths(project / "specs")
+
+        assert paths["FEATURE_DIR"] == str(project.resolve() / "specs" / "002-waitlist")
+        assert {key: paths[key] for key in ("REPO_ROOT", "FEATURE_DIR", "FEATURE_SPEC", "IMPL_PLAN", "TASKS")} == {
+            key: expected[key] for key in ("REPO_ROOT", "FEATURE_DIR", "FEATURE_SPEC", "IMPL_PLAN", "TASKS")
+        }
+        assert paths["CURRENT_BRANCH"] == expected["BRANCH"]
+
+    def test_ambiguous_prefix(self, project: Path) -> None:
+        """Several directories with the branch's prefix produce a warning."""
+        (project / "specs" / "002-other").mkdir()
+
+        paths = feature_paths(project)
+
+        assert paths["FEATURE_DIR"] == str(project.resolve() / "specs" / "002-waitlist-v2")
+        assert paths["warnings"] == ["Multiple spec directories found with prefix '002': 002-other 002-waitlist"]
+
+    def test_feature_override(self, project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """TWITTERKIT_FEATURE takes precedence over the branch."""
+        monkeypatch.setenv("TWITTERKIT_FEATURE", "001-anything")
+
+        assert feature_paths(project)["FEATURE_DIR"] == str(project.resolve() / "specs" / "001-launch")
+
+
+class TestPathsCommand:
+    """Test suite for `twitterify paths`."""
+
+    def test_json(self, project: Path) -> None:
+        """JSON output has the paths-only keys plus the documents present."""
+        os.chdir(project)
+        (project / "specs" / "002-waitlist" / "plan.md").touch()
+
+        result = runner.invoke(app, ["paths", "--json"])
+
+        assert result.exit_code == 0
+        output = json.loads(result.stdout)
+        assert list(output) == ["REPO_ROOT", "BRANCH", "FEATURE_DIR", "FEATURE_SPEC", "IMPL_PLAN", "TASKS", "AVAILABLE_DOCS"]
+        assert output["BRANCH"] == "002-waitlist-v2"
+        assert output["AVAILABLE_DOCS"] == ["plan.md"]